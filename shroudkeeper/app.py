@@ -1,18 +1,11 @@
 from __future__ import annotations
 
+import multiprocessing
 import sys
+from typing import TYPE_CHECKING
 
-from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QApplication
-
-from core.config import AppConfig
-from core.logging import setup_logging
-from core.paths import ensure_runtime_directories
-from core.resources import resource_path
-from core.theme.theme_loader import apply_theme
-from i18n.i18n import initialize_i18n, tr
-from storage.db import DatabaseManager
-from ui.main_window import MainWindow
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QApplication
 
 
 def _normalize_application_font(app: QApplication) -> None:
@@ -33,6 +26,19 @@ def _normalize_application_font(app: QApplication) -> None:
 
 
 def main() -> int:
+    # Imported here because spawned world-name search workers re-import this module as __mp_main__.
+    from PySide6.QtGui import QIcon
+    from PySide6.QtWidgets import QApplication
+
+    from core.config import AppConfig
+    from core.logging import setup_logging
+    from core.paths import ensure_runtime_directories
+    from core.resources import resource_path
+    from core.theme.theme_loader import apply_theme
+    from i18n.i18n import initialize_i18n, tr
+    from storage.db import DatabaseManager
+    from ui.main_window import MainWindow
+
     ensure_runtime_directories()
 
     app = QApplication(sys.argv)
@@ -63,4 +69,5 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     raise SystemExit(main())
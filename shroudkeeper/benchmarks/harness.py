@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+import gc
+import statistics
+import time
+import tracemalloc
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    name: str
+    status: str
+    runs: int
+    min_seconds: float | None = None
+    median_seconds: float | None = None
+    mean_seconds: float | None = None
+    max_seconds: float | None = None
+    peak_memory_bytes: int | None = None
+    items: int | None = None
+    bytes_processed: int | None = None
+    message: str | None = None
+
+    def to_json(self) -> dict[str, object]:
+        return asdict(self)
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    repeat: int = 5,
+    warmup: int = 1,
+    items: int | None = None,
+    setup: Callable[[], None] | None = None,
+    bytes_processed: int | None = None,
+) -> BenchmarkResult:
+    try:
+        for _ in range(max(0, warmup)):
+            if setup is not None:
+                setup()
+            func()
+
+        timings: list[float] = []
+        for _ in range(max(1, repeat)):
+            if setup is not None:
+                setup()
+            gc.collect()
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+
+        if setup is not None:
+            setup()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func()
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except Exception as error:
+        return BenchmarkResult(
+            name=name,
+            status="failed",
+            runs=0,
+            items=items,
+            bytes_processed=bytes_processed,
+            message=str(error),
+        )
+
+    return BenchmarkResult(
+        name=name,
+        status="ok",
+        runs=len(timings),
+        min_seconds=min(timings),
+        median_seconds=statistics.median(timings),
+        mean_seconds=statistics.fmean(timings),
+        max_seconds=max(timings),
+        peak_memory_bytes=peak,
+        items=items,
+        bytes_processed=bytes_processed,
+    )
+
+
+def skipped(name: str, reason: str) -> BenchmarkResult:
+    return BenchmarkResult(name=name, status="skipped", runs=0, message=reason)
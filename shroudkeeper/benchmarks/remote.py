@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import AsyncExitStack, contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+import fnmatch
+import json
+import logging
+from pathlib import Path
+import platform
+import random
+import sys
+import tempfile
+
+from benchmarks.harness import BenchmarkResult, measure
+from benchmarks.remote_servers import LOCAL_PASSWORD, EventLoopThread, LocalRemoteServers
+from core.remote.client_base import RemoteClient
+from core.remote.client_factory import create_client
+from core.remote.wan_simulation import WanConditions
+
+
+RESULT_FORMAT_VERSION = 1
+PROTOCOLS = ("ftp", "sftp")
+
+RemoteBenchmark = Callable[["RemoteBenchContext", str], list[BenchmarkResult]]
+
+
+@dataclass(slots=True)
+class RemoteBenchContext:
+    servers: LocalRemoteServers
+    runner: EventLoopThread
+    work_dir: Path
+    args: argparse.Namespace
+    logger: logging.Logger
+    wan_conditions: WanConditions | None = None
+
+    def selected(self, name: str) -> bool:
+        patterns = self.args.only
+        return not patterns or any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+    @contextmanager
+    def client(self, protocol: str, concurrency: int = 1) -> Iterator[RemoteClient]:
+        profile = self.servers.server(protocol).profile(transfer_concurrency=concurrency)
+        client = create_client(
+            profile=profile,
+            password=LOCAL_PASSWORD,
+            logger=self.logger,
+            wan_conditions=self.wan_conditions,
+        )
+        stack = AsyncExitStack()
+        self.runner.run(stack.enter_async_context(client.session()))
+        try:
+            yield client
+        finally:
+            self.runner.run(stack.aclose())
+
+    def measure_remote(
+        self,
+        name: str,
+        operation: Callable[[], Awaitable[object]],
+        items: int | None = None,
+        bytes_processed: int | None = None,
+    ) -> BenchmarkResult:
+        return measure(
+            name,
+            lambda: self.runner.run(operation()),
+            repeat=self.args.repeat,
+            warmup=self.args.warmup,
+            items=items,
+            bytes_processed=bytes_processed,
+        )
+
+
+def bench_list(context: RemoteBenchContext, protocol: str) -> list[BenchmarkResult]:
+    name = f"remote.{protocol}.list_dir_details"
+    if not context.selected(name):
+        return []
+
+    server = context.servers.server(protocol)
+    list_root = server.root / "list"
+    for index in range(context.args.list_files):
+        _write_random_file(list_root / f"entry-{index:05d}.bin", 1024)
+
+    with context.client(protocol) as client:
+
+        async def run() -> None:
+            ok, message, _entries = await client.list_dir_details("/list")
+            if not ok:
+                raise RuntimeError(message)
+
+        return [context.measure_remote(name, run, items=context.args.list_files)]
+
+
+def bench_upload(context: RemoteBenchContext, protocol: str) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    for size_kib in context.args.sizes_kib:
+        local_root = context.work_dir / f"{protocol}-upload-{size_kib}"
+        for concurrency in context.args.concurrency:
+            name = f"remote.{protocol}.upload.{size_kib}kib.c{concurrency}"
+            if not context.selected(name):
+                continue
+
+            sources = [local_root / f"source-{index}.bin" for index in range(concurrency)]
+            for source in sources:
+                if not source.exists():
+                    _write_random_file(source, size_kib * 1024)
+
+            with context.client(protocol, concurrency) as client:
+
+                async def run() -> None:
+                    outcomes = await asyncio.gather(
+                        *(
+                            client.upload_file(source, f"/upload/{size_kib}kib-{index}.bin")
+                            for index, source in enumerate(sources)
+                        )
+                    )
+                    _raise_on_failure(outcomes)
+
+                ok, message = context.runner.run(client.ensure_dir("/upload"))
+                if not ok:
+                    raise RuntimeError(message)
+                results.append(
+                    context.measure_remote(name, run, items=concurrency, bytes_processed=concurrency * size_kib * 1024)
+                )
+    return results
+
+
+def bench_download(context: RemoteBenchContext, protocol: str) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    server = context.servers.server(protocol)
+    for size_kib in context.args.sizes_kib:
+        for concurrency in context.args.concurrency:
+            name = f"remote.{protocol}.download.{size_kib}kib.c{concurrency}"
+            if not context.selected(name):
+                continue
+
+            remote_names = [f"{size_kib}kib-{index}.bin" for index in range(concurrency)]
+            for remote_name in remote_names:
+                target = server.root / "download" / remote_name
+                if not target.exists():
+                    _write_random_file(target, size_kib * 1024)
+            local_root = context.work_dir / f"{protocol}-download-{size_kib}-c{concurrency}"
+            local_root.mkdir(parents=True, exist_ok=True)
+
+            with context.client(protocol, concurrency) as client:
+
+                async def run() -> None:
+                    outcomes = await asyncio.gather(
+                        *(
+                            client.download_file(f"/download/{remote_name}", local_root / remote_name)
+                            for remote_name in remote_names
+                        )
+                    )
+                    _raise_on_failure(outcomes)
+
+                results.append(
+                    context.measure_remote(name, run, items=concurrency, bytes_processed=concurrency * size_kib * 1024)
+                )
+    return results
+
+
+def bench_read_file_bytes(context: RemoteBenchContext, protocol: str) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    server = context.servers.server(protocol)
+    for size_kib in context.args.sizes_kib:
+        for concurrency in context.args.concurrency:
+            name = f"remote.{protocol}.read_file_bytes.{size_kib}kib.c{concurrency}"
+            if not context.selected(name):
+                continue
+
+            remote_path = f"/read/{size_kib}kib.bin"
+            target = server.root / "read" / f"{size_kib}kib.bin"
+            if not target.exists():
+                _write_random_file(target, size_kib * 1024)
+
+            with context.client(protocol, concurrency) as client:
+
+                async def run() -> None:
+                    outcomes = await asyncio.gather(
+                        *(client.read_file_bytes(remote_path, max_bytes=size_kib * 1024) for _ in range(concurrency))
+                    )
+                    _raise_on_failure(outcomes)
+
+                results.append(
+                    context.measure_remote(name, run, items=concurrency, bytes_processed=concurrency * size_kib * 1024)
+                )
+    return results
+
+
+BENCHMARKS: dict[str, RemoteBenchmark] = {
+    "list": bench_list,
+    "upload": bench_upload,
+    "download": bench_download,
+    "read_file_bytes": bench_read_file_bytes,
+}
+
+
+def _write_random_file(path: Path, size_bytes: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(random.randbytes(size_bytes))
+
+
+def _raise_on_failure(outcomes: list[tuple[object, ...]]) -> None:
+    for outcome in outcomes:
+        if not outcome[0]:
+            raise RuntimeError(str(outcome[1]))
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run Shroudkeeper remote-layer benchmarks against local FTP and SFTP servers."
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Write JSON results to this file instead of stdout.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--protocol", action="append", choices=PROTOCOLS, default=None)
+    parser.add_argument("--sizes-kib", type=int, nargs="+", default=[64, 1024, 8192])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--list-files", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1203620)
+    parser.add_argument(
+        "--wan",
+        type=WanConditions.parse,
+        default=None,
+        help="Simulate WAN conditions, e.g. 'latency_ms=150,jitter_ms=20,upload_kib_per_second=1024'.",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=None,
+        help="Run only benchmarks whose name matches this pattern, e.g. 'remote.sftp.upload.*'.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    random.seed(args.seed)
+
+    protocols = args.protocol or list(PROTOCOLS)
+    logger = logging.getLogger("shroudkeeper.benchmarks")
+    results: list[dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="shroudkeeper-remote-bench-") as temp_dir:
+        base_dir = Path(temp_dir)
+        work_dir = base_dir / "work"
+        work_dir.mkdir()
+
+        runner = EventLoopThread("shroudkeeper-bench-clients")
+        try:
+            with LocalRemoteServers(base_dir / "servers", logger=logger) as servers:
+                context = RemoteBenchContext(
+                    servers=servers,
+                    runner=runner,
+                    work_dir=work_dir,
+                    args=args,
+                    logger=logger,
+                    wan_conditions=args.wan,
+                )
+                for protocol in protocols:
+                    for benchmark in BENCHMARKS.values():
+                        results.extend(result.to_json() for result in benchmark(context, protocol))
+        finally:
+            runner.close()
+
+    payload = {
+        "format": RESULT_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+            "protocols": protocols,
+            "sizes_kib": args.sizes_kib,
+            "concurrency": args.concurrency,
+            "list_files": args.list_files,
+            "seed": args.seed,
+            "wan": asdict(args.wan) if args.wan is not None else None,
+        },
+        "results": results,
+    }
+
+    rendered = json.dumps(payload, indent=2)
+    if args.output is None:
+        sys.stdout.write(rendered + "\n")
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
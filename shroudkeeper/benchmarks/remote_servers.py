@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import threading
+from typing import Any, TypeVar
+
+import aioftp
+import asyncssh
+
+from core.profiles.models import Profile
+
+
+LOCAL_HOST = "127.0.0.1"
+LOCAL_USERNAME = "bench"
+LOCAL_PASSWORD = "bench"
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class LocalServer:
+    protocol: str
+    host: str
+    port: int
+    root: Path
+
+    def profile(self, transfer_concurrency: int = 1) -> Profile:
+        return Profile(
+            name=f"bench-{self.protocol}",
+            protocol=self.protocol,
+            host=self.host,
+            port=self.port,
+            username=LOCAL_USERNAME,
+            remote_path="/",
+            verify_host_key=False,
+            transfer_concurrency=transfer_concurrency,
+        )
+
+
+class EventLoopThread:
+    def __init__(self, name: str) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name=name, daemon=True)
+        self._thread.start()
+
+    def run(self, coroutine: Coroutine[Any, Any, T], timeout_seconds: float | None = None) -> T:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout_seconds)
+
+    def close(self, timeout_seconds: float = 5.0) -> None:
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout_seconds)
+        self._loop.close()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+
+class _BenchSSHServer(asyncssh.SSHServer):
+    def begin_auth(self, username: str) -> bool:
+        return True
+
+    def password_auth_supported(self) -> bool:
+        return True
+
+    def validate_password(self, username: str, password: str) -> bool:
+        return username == LOCAL_USERNAME and password == LOCAL_PASSWORD
+
+
+class LocalRemoteServers:
+    def __init__(self, root: Path, logger: logging.Logger | None = None) -> None:
+        self._root = Path(root)
+        self._logger = logger or logging.getLogger("shroudkeeper.benchmarks.servers")
+        self._thread: EventLoopThread | None = None
+        self._ftp_server: aioftp.Server | None = None
+        self._sftp_server: asyncssh.SSHAcceptor | None = None
+        self.ftp: LocalServer | None = None
+        self.sftp: LocalServer | None = None
+
+    def __enter__(self) -> LocalRemoteServers:
+        self.start()
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.stop()
+
+    def server(self, protocol: str) -> LocalServer:
+        server = self.ftp if protocol == "ftp" else self.sftp
+        if server is None:
+            raise RuntimeError(f"{protocol} server is not running")
+        return server
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = EventLoopThread("shroudkeeper-bench-servers")
+        try:
+            self.ftp = self._thread.run(self._start_ftp(self._root / "ftp"))
+            self.sftp = self._thread.run(self._start_sftp(self._root / "sftp"))
+        except BaseException:
+            self.stop()
+            raise
+
+    def stop(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        try:
+            thread.run(self._close_servers(), timeout_seconds=10.0)
+        except Exception as error:
+            self._logger.warning("Stopping benchmark servers failed: %s", error)
+        finally:
+            thread.close()
+            self._thread = None
+            self.ftp = None
+            self.sftp = None
+
+    async def _start_ftp(self, root: Path) -> LocalServer:
+        root.mkdir(parents=True, exist_ok=True)
+        user = aioftp.User(LOCAL_USERNAME, LOCAL_PASSWORD, base_path=root, home_path="/")
+        server = aioftp.Server([user])
+        await server.start(LOCAL_HOST, 0)
+        self._ftp_server = server
+        _host, port = server.address
+        return LocalServer(protocol="ftp", host=LOCAL_HOST, port=port, root=root)
+
+    async def _start_sftp(self, root: Path) -> LocalServer:
+        root.mkdir(parents=True, exist_ok=True)
+        server = await asyncssh.create_server(
+            _BenchSSHServer,
+            LOCAL_HOST,
+            0,
+            server_host_keys=[asyncssh.generate_private_key("ssh-ed25519")],
+            sftp_factory=lambda channel: asyncssh.SFTPServer(channel, chroot=str(root).encode()),
+        )
+        self._sftp_server = server
+        port = server.sockets[0].getsockname()[1]
+        return LocalServer(protocol="sftp", host=LOCAL_HOST, port=port, root=root)
+
+    async def _close_servers(self) -> None:
+        if self._ftp_server is not None:
+            await self._ftp_server.close()
+            self._ftp_server = None
+        if self._sftp_server is not None:
+            self._sftp_server.close()
+            await self._sftp_server.wait_closed()
+            self._sftp_server = None
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from datetime import datetime, timezone
+import json
+import logging
+from pathlib import Path
+import platform
+import sys
+import tempfile
+
+from benchmarks.harness import BenchmarkResult, measure, skipped
+from benchmarks.save_tree import SyntheticSaveTree, generate_save_tree
+from core.saves.integrity import RollIntegrityService
+from core.saves.root_discovery import SaveRootDiscoveryService
+from core.saves.scan_cache import ScanCache
+from core.saves.scanner_service import SaveScannerService
+from core.transfers.transfer_service import build_plan_sp_to_sp
+from core.transfers.transfer_worker import TransferWorker
+from core.worldname.extractor import extract_world_name_from_info_file
+
+
+RESULT_FORMAT_VERSION = 1
+
+Benchmark = Callable[[SyntheticSaveTree, Path, argparse.Namespace], BenchmarkResult]
+
+
+def bench_scan_probe(tree: SyntheticSaveTree, work_dir: Path, args: argparse.Namespace) -> BenchmarkResult:
+    scanner = SaveScannerService(single_pass=False, scan_cache=ScanCache(cache_path=work_dir / "probe-cache.json"))
+    return measure(
+        "scan_singleplayer.probe",
+        lambda: scanner.scan_singleplayer(tree.saved_games_root),
+        repeat=args.repeat,
+        warmup=args.warmup,
+    )
+
+
+def bench_scan_single_pass(tree: SyntheticSaveTree, work_dir: Path, args: argparse.Namespace) -> BenchmarkResult:
+    scanner = SaveScannerService(single_pass=True, scan_cache=ScanCache(cache_path=work_dir / "single-cache.json"))
+    return measure(
+        "scan_singleplayer.single_pass",
+        lambda: scanner.scan_singleplayer(tree.saved_games_root),
+        repeat=args.repeat,
+        warmup=args.warmup,
+    )
+
+
+def bench_scan_incremental(tree: SyntheticSaveTree, work_dir: Path, args: argparse.Namespace) -> BenchmarkResult:
+    scanner = SaveScannerService(scan_cache=ScanCache(cache_path=work_dir / "incremental-cache.json"))
+    return measure(
+        "scan_singleplayer.incremental_warm",
+        lambda: scanner.scan_singleplayer(tree.saved_games_root, incremental=True),
+        repeat=args.repeat,
+        warmup=max(1, args.warmup),
+    )
+
+
+def bench_root_discovery(tree: SyntheticSaveTree, work_dir: Path, args: argparse.Namespace) -> BenchmarkResult:
+    service = SaveRootDiscoveryService()
+    roots = tree.all_roots
+    return measure(
+        "root_discovery.rank_candidates",
+        lambda: service.rank_candidates(roots),
+        repeat=args.repeat,
+        warmup=args.warmup,
+        items=len(roots),
+    )
+
+
+def bench_world_name_extraction(tree: SyntheticSaveTree, work_dir: Path, args: argparse.Namespace) -> BenchmarkResult:
+    info_files = [path for path in tree.info_files if path.parent == tree.saved_games_root]
+
+    def run() -> None:
+        for path in info_files:
+            extract_world_name_from_info_file(path)
+
+    return measure(
+        "worldname.extract_info_file",
+        run,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        items=len(info_files),
+    )
+
+
+def bench_local_transfer(tree: SyntheticSaveTree, work_dir: Path, args: argparse.Namespace) -> BenchmarkResult:
+    scan = SaveScannerService(scan_cache=ScanCache(cache_path=work_dir / "transfer-cache.json")).scan_singleplayer(
+        tree.saved_games_root
+    )
+    if len(scan.slots) < 2:
+        return skipped("transfer.local_sp_to_sp", "at least two slots are required")
+
+    source_slot = scan.slots[0]
+    target_slot = scan.slots[-1].slot_number
+    plans = [
+        build_plan_sp_to_sp(source_slot, target_slot, roll.roll_index)
+        for roll in source_slot.rolls
+        if roll.exists
+    ]
+    integrity_service = RollIntegrityService(db_path=work_dir / "transfer-integrity.db")
+    logger = logging.getLogger("shroudkeeper.benchmarks")
+
+    def run() -> None:
+        for plan in plans:
+            worker = TransferWorker(plan=plan, logger=logger, integrity_service=integrity_service)
+            errors: list[str] = []
+            worker.error.connect(errors.append)
+            worker.run()
+            if errors:
+                raise RuntimeError(errors[0])
+
+    return measure(
+        "transfer.local_sp_to_sp",
+        run,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        items=len(plans),
+    )
+
+
+def bench_singleplayer_backup(tree: SyntheticSaveTree, work_dir: Path, args: argparse.Namespace) -> BenchmarkResult:
+    try:
+        from core.backups.singleplayer_backup_worker import SingleplayerBackupWorker
+    except ImportError as error:
+        return skipped("backup.singleplayer", f"backup engine unavailable: {error}")
+
+    scan = SaveScannerService(scan_cache=ScanCache(cache_path=work_dir / "backup-cache.json")).scan_singleplayer(
+        tree.saved_games_root
+    )
+    backup_root = work_dir / "backups"
+    logger = logging.getLogger("shroudkeeper.benchmarks")
+
+    def run() -> None:
+        worker = SingleplayerBackupWorker(
+            effective_root=scan.root,
+            slots=scan.slots,
+            backup_root=backup_root,
+            backup_zip_enabled=args.backup_zip,
+            backup_keep_uncompressed=False,
+            logger=logger,
+        )
+        errors: list[str] = []
+        worker.error.connect(errors.append)
+        worker.run()
+        if errors:
+            raise RuntimeError(errors[0])
+
+    return measure(
+        "backup.singleplayer",
+        run,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        items=len(scan.slots),
+    )
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "scan_singleplayer.probe": bench_scan_probe,
+    "scan_singleplayer.single_pass": bench_scan_single_pass,
+    "scan_singleplayer.incremental_warm": bench_scan_incremental,
+    "root_discovery.rank_candidates": bench_root_discovery,
+    "worldname.extract_info_file": bench_world_name_extraction,
+    "transfer.local_sp_to_sp": bench_local_transfer,
+    "backup.singleplayer": bench_singleplayer_backup,
+}
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run Shroudkeeper performance benchmarks.")
+    parser.add_argument("--output", type=Path, default=None, help="Write JSON results to this file instead of stdout.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--slots", type=int, default=10)
+    parser.add_argument("--rolls", type=int, default=10)
+    parser.add_argument("--steam-users", type=int, default=2)
+    parser.add_argument("--roll-size-kib", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=1203620)
+    parser.add_argument("--backup-zip", action="store_true")
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS), default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    selected = args.only or list(BENCHMARKS)
+    with tempfile.TemporaryDirectory(prefix="shroudkeeper-bench-") as temp_dir:
+        base_dir = Path(temp_dir)
+        tree = generate_save_tree(
+            base_dir / "tree",
+            slots=args.slots,
+            rolls=args.rolls,
+            steam_users=args.steam_users,
+            roll_size=args.roll_size_kib * 1024,
+            seed=args.seed,
+        )
+        work_dir = base_dir / "work"
+        work_dir.mkdir()
+
+        tree_summary = {
+            "roots": len(tree.all_roots),
+            "roll_files": len(tree.roll_files),
+            "info_files": len(tree.info_files),
+            "total_bytes": tree.total_bytes,
+        }
+        results = [BENCHMARKS[name](tree, work_dir, args).to_json() for name in selected]
+
+    payload = {
+        "format": RESULT_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+            "slots": args.slots,
+            "rolls": args.rolls,
+            "steam_users": args.steam_users,
+            "roll_size_kib": args.roll_size_kib,
+            "seed": args.seed,
+            "backup_zip": args.backup_zip,
+        },
+        "tree": tree_summary,
+        "results": results,
+    }
+
+    rendered = json.dumps(payload, indent=2)
+    if args.output is None:
+        sys.stdout.write(rendered + "\n")
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import random
+import struct
+
+import zstandard
+
+from core.saves.root_discovery import STEAM_APP_ID
+from core.saves.world_slots import WORLD_SLOT_MAPPING
+
+
+WORLD_NAMES = [
+    "Emberveil Hollow",
+    "Kindlewastes",
+    "Revelwood Camp",
+    "Nomad Highlands",
+    "Blackmire Outpost",
+    "Springlands Haven",
+    "Veilwater Basin",
+    "Albaneve Summits",
+    "Shroud Tower",
+    "Pikemead Farm",
+]
+
+_INFO_NOISE = [
+    "Difficulty",
+    "Normal",
+    "PlayerSettings",
+    "EnemyDamage",
+    "WeatherFrequency",
+    "ShroudTimeFactor",
+    "TombstoneMode",
+    "FactoryDefault",
+]
+
+
+@dataclass(slots=True)
+class SyntheticSaveTree:
+    base_dir: Path
+    saved_games_root: Path
+    steam_roots: list[Path]
+    info_files: list[Path] = field(default_factory=list)
+    roll_files: list[Path] = field(default_factory=list)
+
+    @property
+    def all_roots(self) -> list[Path]:
+        return [self.saved_games_root, *self.steam_roots]
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(path.stat().st_size for path in [*self.roll_files, *self.info_files])
+
+
+def generate_save_tree(
+    base_dir: Path,
+    slots: int = 10,
+    rolls: int = 10,
+    steam_users: int = 2,
+    roll_size: int = 256 * 1024,
+    seed: int = 1203620,
+) -> SyntheticSaveTree:
+    rnd = random.Random(seed)
+    compressor = zstandard.ZstdCompressor(level=3, write_checksum=True)
+
+    saved_games_root = base_dir / "Saved Games" / "enshrouded"
+    steam_roots = [
+        base_dir / "Steam" / "userdata" / str(76561198000000000 + user) / STEAM_APP_ID / "remote"
+        for user in range(max(0, steam_users))
+    ]
+    tree = SyntheticSaveTree(base_dir=base_dir, saved_games_root=saved_games_root, steam_roots=steam_roots)
+
+    for root in tree.all_roots:
+        root.mkdir(parents=True, exist_ok=True)
+        for slot_number in sorted(WORLD_SLOT_MAPPING)[: max(0, min(slots, len(WORLD_SLOT_MAPPING)))]:
+            _write_slot(tree, root, slot_number, max(1, min(rolls, 10)), roll_size, rnd, compressor)
+
+    return tree
+
+
+def _write_slot(
+    tree: SyntheticSaveTree,
+    root: Path,
+    slot_number: int,
+    rolls: int,
+    roll_size: int,
+    rnd: random.Random,
+    compressor: zstandard.ZstdCompressor,
+) -> None:
+    world_id = WORLD_SLOT_MAPPING[slot_number]
+    world_name = WORLD_NAMES[(slot_number - 1) % len(WORLD_NAMES)]
+
+    for roll_index in range(rolls):
+        name = world_id if roll_index == 0 else f"{world_id}-{roll_index}"
+        path = root / name
+        path.write_bytes(_container(compressor.compress(_roll_payload(rnd, roll_size))))
+        tree.roll_files.append(path)
+
+        info_name = f"{world_id}_info" if roll_index == 0 else f"{world_id}_info-{roll_index}"
+        info_path = root / info_name
+        info_path.write_bytes(_container(compressor.compress(_info_payload(rnd, world_name))))
+        tree.info_files.append(info_path)
+
+    latest = rnd.randrange(rolls)
+    _write_index(root / f"{world_id}-index", latest)
+    _write_index(root / f"{world_id}_info-index", latest)
+
+
+def _write_index(path: Path, latest: int) -> None:
+    payload = {"time": 1_700_000_000 + latest, "deleted": False, "latest": latest}
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _container(frame: bytes) -> bytes:
+    return struct.pack("<I", len(frame)) + frame
+
+
+def _roll_payload(rnd: random.Random, size: int) -> bytes:
+    # Mix incompressible noise with repeated records so zstd lands near real save ratios.
+    noise_size = size // 3
+    record = rnd.randbytes(64)
+    repeats = (size - noise_size) // len(record) + 1
+    return (rnd.randbytes(noise_size) + record * repeats)[:size]
+
+
+def _info_payload(rnd: random.Random, world_name: str) -> bytes:
+    parts: list[bytes] = []
+    for _ in range(24):
+        parts.append(rnd.randbytes(rnd.randint(8, 48)))
+        parts.append(rnd.choice(_INFO_NOISE).encode("ascii") + b"\x00")
+        if rnd.random() < 0.3:
+            parts.append(world_name.encode("utf-8") + b"\x00")
+    parts.append(world_name.encode("utf-8") + b"\x00")
+    return b"".join(parts)
@@ -11,8 +11,8 @@ from PySide6.QtCore import QObject, Signal
 from core.automations.models import AutomationExecutionResult, AutomationJob
 from core.config import AppConfig
 from core.profiles.models import Profile
-from core.remote.client_factory import create_client
-from core.transfers.execute_remote import upload_index_latest, upload_local_file
+from core.remote.connection_manager import get_connection_manager
+from core.transfers.execute_remote import upload_index_latest, upload_local_files
 from i18n.i18n import tr
 
 
@@ -79,16 +79,24 @@ class ScheduledUploadJobWorker(QObject):
         target_roll_path = str(PurePosixPath(remote_root) / target_roll_name)
         target_index_path = str(PurePosixPath(remote_root) / f"{SERVER_WORLD_HEX}-index")
 
-        client = create_client(profile=self._profile, password=self._password, logger=self._logger)
-        ensure_success, ensure_message = await client.ensure_dir(remote_root)
-        if not ensure_success:
-            return AutomationExecutionResult(status="failed", message=ensure_message)
-
-        try:
-            await upload_local_file(client, local_roll_file, target_roll_path)
-            await upload_index_latest(client, target_index_path, selected_roll)
-        except Exception as error:
-            return AutomationExecutionResult(status="failed", message=str(error))
+        client = get_connection_manager().client(profile=self._profile, password=self._password, logger=self._logger)
+        async with client.session():
+            ensure_success, ensure_message = await client.ensure_dir(remote_root)
+            if not ensure_success:
+                return AutomationExecutionResult(status="failed", message=ensure_message)
+
+            try:
+                copied = await upload_local_files(
+                    client,
+                    [(local_roll_file, target_roll_path)],
+                    profile_id=self._profile.id,
+                    skip_identical=True,
+                )
+                if copied.files_skipped > 0:
+                    self._logger.info("Server already has an identical %s, upload skipped", target_roll_name)
+                await upload_index_latest(client, target_index_path, selected_roll)
+            except Exception as error:
+                return AutomationExecutionResult(status="failed", message=str(error))
 
         return AutomationExecutionResult(status="success", message=tr("automations.status.success"))
 
@@ -39,6 +39,10 @@ def get_config_path() -> Path:
     return (get_app_data_dir() / "config.json").resolve()
 
 
+def get_scan_cache_path() -> Path:
+    return (get_app_data_dir() / "scan-cache.json").resolve()
+
+
 def get_database_path() -> Path:
     app_data_dir = get_app_data_dir()
     legacy_path = (app_data_dir / "embervault.db").resolve()
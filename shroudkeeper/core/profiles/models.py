@@ -3,6 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
+DEFAULT_TRANSFER_CONCURRENCY = 4
+MAX_TRANSFER_CONCURRENCY = 10
+
+
 @dataclass(slots=True)
 class Profile:
     name: str
@@ -13,6 +17,11 @@ class Profile:
     remote_path: str
     passive_mode: bool = True
     verify_host_key: bool = True
+    transfer_concurrency: int = DEFAULT_TRANSFER_CONCURRENCY
+    transfer_block_size: int = 0
+    transfer_max_requests: int = 0
+    ssh_compression: bool = False
+    transfer_auto_tune: bool = False
     id: int | None = None
     created_at: str | None = None
     updated_at: str | None = None
@@ -1,4 +1,5 @@
 from .client_factory import create_client
+from .connection_manager import get_connection_manager
 from .test_worker import RemoteTestWorker
 
-__all__ = ["create_client", "RemoteTestWorker"]
+__all__ = ["create_client", "get_connection_manager", "RemoteTestWorker"]
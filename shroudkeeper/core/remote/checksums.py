@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import hashlib
+from pathlib import Path
+from typing import Protocol
+import zlib
+
+
+CHECKSUM_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+class _Hasher(Protocol):
+    def update(self, data: bytes, /) -> None: ...
+
+    def hexdigest(self) -> str: ...
+
+
+class _Crc32:
+    def __init__(self) -> None:
+        self._value = 0
+
+    def update(self, data: bytes) -> None:
+        self._value = zlib.crc32(data, self._value)
+
+    def hexdigest(self) -> str:
+        return f"{self._value:08x}"
+
+
+_HASHERS: dict[str, Callable[[], _Hasher]] = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha224": hashlib.sha224,
+    "sha256": hashlib.sha256,
+    "sha384": hashlib.sha384,
+    "sha512": hashlib.sha512,
+    "crc32": _Crc32,
+}
+
+
+def normalize_algorithm(algorithm: str) -> str:
+    return algorithm.strip().lower().replace("-", "").replace("_", "")
+
+
+def is_supported_algorithm(algorithm: str) -> bool:
+    return normalize_algorithm(algorithm) in _HASHERS
+
+
+def compute_local_checksum(path: Path, algorithm: str) -> str | None:
+    factory = _HASHERS.get(normalize_algorithm(algorithm))
+    if factory is None:
+        return None
+
+    hasher = factory()
+    with path.open("rb") as handle:
+        while True:
+            chunk = handle.read(CHECKSUM_CHUNK_SIZE)
+            if chunk == b"":
+                break
+            hasher.update(chunk)
+    return hasher.hexdigest()
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Protocol
+from typing import BinaryIO, Protocol
+
+
+ProgressCallback = Callable[[int], None]
 
 
 @dataclass(slots=True)
@@ -14,7 +19,17 @@ class RemoteEntry:
     modified_at: datetime | None
 
 
+@dataclass(slots=True)
+class RemoteChecksum:
+    algorithm: str
+    digest: str
+
+
 class RemoteClient(Protocol):
+    def session(self) -> AbstractAsyncContextManager[RemoteClient]: ...
+
+    async def keepalive(self) -> bool: ...
+
     async def test_connection(self) -> tuple[bool, str]: ...
 
     async def ensure_dir(self, remote_path: str) -> tuple[bool, str]: ...
@@ -23,16 +38,47 @@ class RemoteClient(Protocol):
 
     async def list_dir_details(self, remote_path: str) -> tuple[bool, str, list[RemoteEntry]]: ...
 
+    async def stat_many(self, remote_paths: list[str]) -> tuple[bool, str, dict[str, RemoteEntry | None]]: ...
+
     async def read_file_bytes(
         self,
         remote_path: str,
         max_bytes: int = 131072,
     ) -> tuple[bool, str, bytes | None]: ...
 
-    async def upload_file(self, local_path: Path, remote_path: str) -> tuple[bool, str, int]: ...
+    async def read_file_prefix(self, remote_path: str, max_bytes: int) -> tuple[bool, str, bytes | None]: ...
+
+    async def upload_file(
+        self,
+        local_path: Path,
+        remote_path: str,
+        offset: int = 0,
+        progress: ProgressCallback | None = None,
+    ) -> tuple[bool, str, int]: ...
 
     async def upload_bytes(self, remote_path: str, data: bytes) -> tuple[bool, str, int]: ...
 
-    async def download_file(self, remote_path: str, local_path: Path) -> tuple[bool, str, int]: ...
+    async def download_file(
+        self,
+        remote_path: str,
+        local_path: Path,
+        offset: int = 0,
+        progress: ProgressCallback | None = None,
+    ) -> tuple[bool, str, int]: ...
 
     async def file_exists(self, remote_path: str) -> tuple[bool, str, bool]: ...
+
+    async def checksum(self, remote_path: str) -> tuple[bool, str, RemoteChecksum | None]: ...
+
+    async def preserves_mtime(self) -> bool: ...
+
+    async def upload_resume_offset(self, offset: int) -> int: ...
+
+
+def open_local_target(path: Path, offset: int) -> BinaryIO:
+    if offset <= 0:
+        return path.open("wb")
+    handle = path.open("r+b")
+    handle.truncate(offset)
+    handle.seek(offset)
+    return handle
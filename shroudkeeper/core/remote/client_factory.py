@@ -6,9 +6,25 @@ from core.profiles.models import Profile
 from core.remote.client_base import RemoteClient
 from core.remote.ftp_client import FTPClient
 from core.remote.sftp_client import SFTPClient
+from core.remote.wan_simulation import WanConditions, WanSimulatedClient
 
 
-def create_client(profile: Profile, password: str, logger: logging.Logger) -> RemoteClient:
+def create_client(
+    profile: Profile,
+    password: str,
+    logger: logging.Logger,
+    wan_conditions: WanConditions | None = None,
+) -> RemoteClient:
+    client = _create_protocol_client(profile, password, logger)
+    conditions = wan_conditions if wan_conditions is not None else WanConditions.from_env(logger)
+    if conditions is None or not conditions.active:
+        return client
+
+    logger.debug("Simulating WAN conditions for %s: %s", profile.name, conditions)
+    return WanSimulatedClient(client, conditions, logger)
+
+
+def _create_protocol_client(profile: Profile, password: str, logger: logging.Logger) -> RemoteClient:
     protocol = profile.protocol.lower()
     if protocol in {"ftp", "ftps"}:
         return FTPClient(profile=profile, password=password)
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+import hashlib
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import Any, TypeVar
+
+from core.profiles.models import Profile
+from core.remote.client_base import ProgressCallback, RemoteChecksum, RemoteClient, RemoteEntry
+from core.remote.client_factory import create_client
+
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 120.0
+DEFAULT_MAX_CONNECTIONS = 4
+DEFAULT_KEEPALIVE_INTERVAL_SECONDS = 30.0
+DEFAULT_PROBE_AFTER_SECONDS = 10.0
+
+ConnectionKey = tuple[int | None, str, str, int, str, bool, bool, int, int, int, bool, bool, str]
+
+T = TypeVar("T")
+
+
+def connection_key(profile: Profile, password: str) -> ConnectionKey:
+    return (
+        profile.id,
+        profile.protocol.lower(),
+        profile.host,
+        int(profile.port),
+        profile.username,
+        bool(profile.passive_mode),
+        bool(profile.verify_host_key),
+        int(profile.transfer_concurrency),
+        int(profile.transfer_block_size),
+        int(profile.transfer_max_requests),
+        bool(profile.ssh_compression),
+        bool(profile.transfer_auto_tune),
+        hashlib.sha256(password.encode("utf-8")).hexdigest(),
+    )
+
+
+@dataclass(slots=True)
+class _PooledConnection:
+    client: RemoteClient
+    stack: AsyncExitStack
+    last_used: float
+    active: int = 0
+
+
+class RemoteConnectionManager:
+    def __init__(
+        self,
+        idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_interval_seconds: float = DEFAULT_KEEPALIVE_INTERVAL_SECONDS,
+        probe_after_seconds: float = DEFAULT_PROBE_AFTER_SECONDS,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._max_connections = max(1, max_connections)
+        self._keepalive_interval_seconds = keepalive_interval_seconds
+        self._probe_after_seconds = probe_after_seconds
+        self._logger = logger or logging.getLogger("shroudkeeper.remote.pool")
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._connections: dict[ConnectionKey, _PooledConnection] = {}
+        self._connect_locks: dict[ConnectionKey, asyncio.Lock] = {}
+
+    def client(self, profile: Profile, password: str, logger: logging.Logger) -> PooledRemoteClient:
+        return PooledRemoteClient(self, profile, password, logger)
+
+    async def run(
+        self,
+        profile: Profile,
+        password: str,
+        logger: logging.Logger,
+        operation: Callable[[RemoteClient], Awaitable[T]],
+    ) -> T:
+        return await self._submit(self._run_pooled(profile, password, logger, operation))
+
+    def shutdown(self, timeout_seconds: float = 5.0) -> None:
+        with self._lock:
+            loop = self._loop
+            thread = self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+
+        future = asyncio.run_coroutine_threadsafe(self._close_all(), loop)
+        try:
+            future.result(timeout_seconds)
+        except Exception as error:
+            self._logger.warning("Closing pooled connections failed: %s", error)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout_seconds)
+
+    async def _submit(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        loop = self._ensure_loop()
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, loop))
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=self._run_loop, args=(loop,), name="shroudkeeper-remote", daemon=True)
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        maintenance = loop.create_task(self._maintain())
+        try:
+            loop.run_forever()
+        finally:
+            maintenance.cancel()
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+
+    async def _run_pooled(
+        self,
+        profile: Profile,
+        password: str,
+        logger: logging.Logger,
+        operation: Callable[[RemoteClient], Awaitable[T]],
+    ) -> T:
+        connection = await self._acquire(connection_key(profile, password), profile, password, logger)
+        if connection is None:
+            return await operation(create_client(profile=profile, password=password, logger=logger))
+
+        try:
+            return await operation(connection.client)
+        finally:
+            connection.active -= 1
+            connection.last_used = time.monotonic()
+
+    async def _acquire(
+        self,
+        key: ConnectionKey,
+        profile: Profile,
+        password: str,
+        logger: logging.Logger,
+    ) -> _PooledConnection | None:
+        async with self._connect_locks.setdefault(key, asyncio.Lock()):
+            connection = self._connections.get(key)
+            if connection is None:
+                if not await self._make_room():
+                    return None
+                client = create_client(profile=profile, password=password, logger=logger)
+                stack = AsyncExitStack()
+                await stack.enter_async_context(client.session())
+                connection = _PooledConnection(client=client, stack=stack, last_used=time.monotonic())
+                self._connections[key] = connection
+            connection.active += 1
+
+        if connection.active == 1 and time.monotonic() - connection.last_used >= self._probe_after_seconds:
+            await connection.client.keepalive()
+        return connection
+
+    async def _make_room(self) -> bool:
+        while len(self._connections) >= self._max_connections:
+            idle = [key for key, connection in self._connections.items() if connection.active == 0]
+            if not idle:
+                return False
+            oldest = min(idle, key=lambda key: self._connections[key].last_used)
+            await self._close(self._connections.pop(oldest))
+        return True
+
+    async def _maintain(self) -> None:
+        while True:
+            await asyncio.sleep(self._keepalive_interval_seconds)
+            now = time.monotonic()
+            for key, connection in list(self._connections.items()):
+                if connection.active > 0:
+                    continue
+
+                idle_seconds = now - connection.last_used
+                if idle_seconds >= self._idle_timeout_seconds:
+                    if self._connections.get(key) is connection:
+                        del self._connections[key]
+                    await self._close(connection)
+                elif idle_seconds >= self._keepalive_interval_seconds:
+                    connection.active += 1
+                    try:
+                        await connection.client.keepalive()
+                    finally:
+                        connection.active -= 1
+
+    async def _close(self, connection: _PooledConnection) -> None:
+        try:
+            await asyncio.wait_for(connection.stack.aclose(), timeout=self._keepalive_interval_seconds)
+        except Exception as error:
+            self._logger.debug("Closing pooled connection failed: %s", error)
+
+    async def _close_all(self) -> None:
+        connections = list(self._connections.values())
+        self._connections.clear()
+        self._connect_locks.clear()
+        for connection in connections:
+            await self._close(connection)
+
+
+class PooledRemoteClient:
+    def __init__(
+        self,
+        manager: RemoteConnectionManager,
+        profile: Profile,
+        password: str,
+        logger: logging.Logger,
+    ) -> None:
+        self._manager = manager
+        self._profile = profile
+        self._password = password
+        self._logger = logger
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[PooledRemoteClient]:
+        yield self
+
+    async def keepalive(self) -> bool:
+        return await self._call(lambda client: client.keepalive())
+
+    async def test_connection(self) -> tuple[bool, str]:
+        return await self._call(lambda client: client.test_connection())
+
+    async def ensure_dir(self, remote_path: str) -> tuple[bool, str]:
+        return await self._call(lambda client: client.ensure_dir(remote_path))
+
+    async def list_dir(self, remote_path: str) -> tuple[bool, str, list[str]]:
+        return await self._call(lambda client: client.list_dir(remote_path))
+
+    async def list_dir_details(self, remote_path: str) -> tuple[bool, str, list[RemoteEntry]]:
+        return await self._call(lambda client: client.list_dir_details(remote_path))
+
+    async def stat_many(self, remote_paths: list[str]) -> tuple[bool, str, dict[str, RemoteEntry | None]]:
+        return await self._call(lambda client: client.stat_many(remote_paths))
+
+    async def read_file_bytes(
+        self,
+        remote_path: str,
+        max_bytes: int = 131072,
+    ) -> tuple[bool, str, bytes | None]:
+        return await self._call(lambda client: client.read_file_bytes(remote_path, max_bytes))
+
+    async def read_file_prefix(self, remote_path: str, max_bytes: int) -> tuple[bool, str, bytes | None]:
+        return await self._call(lambda client: client.read_file_prefix(remote_path, max_bytes))
+
+    async def upload_file(
+        self,
+        local_path: Path,
+        remote_path: str,
+        offset: int = 0,
+        progress: ProgressCallback | None = None,
+    ) -> tuple[bool, str, int]:
+        return await self._call(lambda client: client.upload_file(local_path, remote_path, offset, progress))
+
+    async def upload_bytes(self, remote_path: str, data: bytes) -> tuple[bool, str, int]:
+        return await self._call(lambda client: client.upload_bytes(remote_path, data))
+
+    async def download_file(
+        self,
+        remote_path: str,
+        local_path: Path,
+        offset: int = 0,
+        progress: ProgressCallback | None = None,
+    ) -> tuple[bool, str, int]:
+        return await self._call(lambda client: client.download_file(remote_path, local_path, offset, progress))
+
+    async def file_exists(self, remote_path: str) -> tuple[bool, str, bool]:
+        return await self._call(lambda client: client.file_exists(remote_path))
+
+    async def checksum(self, remote_path: str) -> tuple[bool, str, RemoteChecksum | None]:
+        return await self._call(lambda client: client.checksum(remote_path))
+
+    async def preserves_mtime(self) -> bool:
+        return await self._call(lambda client: client.preserves_mtime())
+
+    async def upload_resume_offset(self, offset: int) -> int:
+        return await self._call(lambda client: client.upload_resume_offset(offset))
+
+    async def _call(self, operation: Callable[[RemoteClient], Awaitable[T]]) -> T:
+        return await self._manager.run(self._profile, self._password, self._logger, operation)
+
+
+_connection_manager = RemoteConnectionManager()
+
+
+def get_connection_manager() -> RemoteConnectionManager:
+    return _connection_manager
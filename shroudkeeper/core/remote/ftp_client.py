@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timezone
 import ssl
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path, PurePosixPath
+import time
 from typing import Mapping
 
 import aioftp
 
 from core.profiles.models import Profile
-from core.remote.client_base import RemoteEntry
+from core.remote.checksums import is_supported_algorithm
+from core.remote.client_base import ProgressCallback, RemoteChecksum, RemoteEntry, open_local_target
+from core.remote.transfer_tuning import get_transfer_tuner
+
+
+FTP_CHECKSUM_COMMANDS = ("HASH", "XMD5")
 
 
 @dataclass(slots=True)
@@ -18,14 +26,47 @@ class FTPClient:
     profile: Profile
     password: str
     timeout_seconds: float = 12.0
+    _session_depth: int = field(default=0, init=False, repr=False)
+    _session_client: aioftp.Client | None = field(default=None, init=False, repr=False)
+    _session_lock: asyncio.Lock | None = field(default=None, init=False, repr=False)
+    _unsupported_commands: set[str] = field(default_factory=set, init=False, repr=False)
+    _features: set[str] | None = field(default=None, init=False, repr=False)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[FTPClient]:
+        if self._session_depth == 0:
+            self._session_lock = asyncio.Lock()
+        self._session_depth += 1
+        try:
+            yield self
+        finally:
+            self._session_depth -= 1
+            if self._session_depth == 0 and self._session_client is not None:
+                client = self._session_client
+                self._session_client = None
+                await self._disconnect(client)
+
+    async def keepalive(self) -> bool:
+        if self._session_lock is None or self._session_client is None:
+            return False
+
+        async with self._session_lock:
+            client = self._session_client
+            if client is None:
+                return False
+            try:
+                await asyncio.wait_for(client.command("NOOP", ("2xx", "5xx")), timeout=self.timeout_seconds)
+                return True
+            except Exception:
+                self._session_client = None
+                client.close()
+                return False
 
     async def test_connection(self) -> tuple[bool, str]:
         remote_path = self._normalize_remote_path(self.profile.remote_path)
         try:
             async with self._open_client() as client:
-                await asyncio.wait_for(client.list(remote_path).__anext__(), timeout=self.timeout_seconds)
-            return True, "ok"
-        except StopAsyncIteration:
+                await asyncio.wait_for(client.list(remote_path), timeout=self.timeout_seconds)
             return True, "ok"
         except Exception as error:
             return False, str(error)
@@ -56,6 +97,31 @@ class FTPClient:
         except Exception as error:
             return False, str(error), []
 
+    async def stat_many(self, remote_paths: list[str]) -> tuple[bool, str, dict[str, RemoteEntry | None]]:
+        by_parent: dict[str, list[str]] = {}
+        for remote_path in remote_paths:
+            parent = str(PurePosixPath(self._normalize_remote_path(remote_path)).parent)
+            by_parent.setdefault(parent, []).append(remote_path)
+
+        entries: dict[str, RemoteEntry | None] = {}
+        try:
+            async with self._open_client() as client:
+                for parent, paths in by_parent.items():
+                    if len(paths) == 1 and "MLST" not in self._unsupported_commands:
+                        answered, entry = await self._mlst(client, self._normalize_remote_path(paths[0]))
+                        if answered:
+                            entries[paths[0]] = entry
+                            continue
+
+                    by_name = await self._list_by_name(client, parent)
+                    for remote_path in paths:
+                        name = PurePosixPath(self._normalize_remote_path(remote_path)).name
+                        info = by_name.get(name)
+                        entries[remote_path] = self._to_remote_entry(name, info) if info is not None else None
+            return True, "ok", entries
+        except Exception as error:
+            return False, str(error), {}
+
     async def read_file_bytes(
         self,
         remote_path: str,
@@ -81,7 +147,34 @@ class FTPClient:
         except Exception as error:
             return False, str(error), None
 
-    async def upload_file(self, local_path: Path, remote_path: str) -> tuple[bool, str, int]:
+    async def read_file_prefix(self, remote_path: str, max_bytes: int) -> tuple[bool, str, bytes | None]:
+        if max_bytes <= 0:
+            return False, "invalid max_bytes", None
+
+        target = self._normalize_remote_path(remote_path)
+        chunks: list[bytes] = []
+        total_size = 0
+        try:
+            async with self._open_client() as client:
+                async with client.download_stream(target) as stream:
+                    async for chunk in stream.iter_by_block():
+                        chunks.append(bytes(chunk))
+                        total_size += len(chunk)
+                        if total_size >= max_bytes:
+                            break
+        except Exception as error:
+            if total_size < max_bytes:
+                return False, str(error), None
+
+        return True, "ok", b"".join(chunks)[:max_bytes]
+
+    async def upload_file(
+        self,
+        local_path: Path,
+        remote_path: str,
+        offset: int = 0,
+        progress: ProgressCallback | None = None,
+    ) -> tuple[bool, str, int]:
         source = Path(local_path)
         if not source.exists() or not source.is_file():
             return False, "source file missing", 0
@@ -89,18 +182,31 @@ class FTPClient:
         target = self._normalize_remote_path(remote_path)
         target_parent = str(PurePosixPath(target).parent)
 
+        tuner = get_transfer_tuner()
+        block_size = tuner.tuning_for(self.profile).ftp_block_size()
+        measure = offset == 0 and tuner.needs_measurement(self.profile)
         try:
             async with self._open_client() as client:
                 await asyncio.wait_for(client.make_directory(target_parent, parents=True), timeout=self.timeout_seconds)
-                async with client.upload_stream(target) as stream:
+                rtt_seconds = await self._measure_rtt(client) if measure else 0.0
+                started = time.perf_counter()
+                stream_context = client.append_stream(target) if offset > 0 else client.upload_stream(target)
+                async with stream_context as stream:
                     with source.open("rb") as handle:
+                        handle.seek(offset)
                         total = 0
                         while True:
-                            chunk = handle.read(65536)
+                            chunk = handle.read(block_size)
                             if chunk == b"":
                                 break
                             total += len(chunk)
                             await stream.write(chunk)
+                            if progress is not None:
+                                progress(len(chunk))
+                elapsed_seconds = time.perf_counter() - started
+                await self._set_remote_mtime(client, target, source.stat().st_mtime)
+            if measure:
+                tuner.record(self.profile, total, elapsed_seconds, rtt_seconds)
             return True, "ok", source.stat().st_size
         except Exception as error:
             return False, str(error), 0
@@ -118,38 +224,148 @@ class FTPClient:
         except Exception as error:
             return False, str(error), 0
 
-    async def download_file(self, remote_path: str, local_path: Path) -> tuple[bool, str, int]:
+    async def download_file(
+        self,
+        remote_path: str,
+        local_path: Path,
+        offset: int = 0,
+        progress: ProgressCallback | None = None,
+    ) -> tuple[bool, str, int]:
         target = self._normalize_remote_path(remote_path)
         local_target = Path(local_path)
         local_target.parent.mkdir(parents=True, exist_ok=True)
 
+        tuner = get_transfer_tuner()
+        block_size = tuner.tuning_for(self.profile).ftp_block_size()
+        measure = offset == 0 and tuner.needs_measurement(self.profile)
         try:
             async with self._open_client() as client:
+                rtt_seconds = await self._measure_rtt(client) if measure else 0.0
+                started = time.perf_counter()
                 total = 0
-                async with client.download_stream(target) as stream:
-                    with local_target.open("wb") as handle:
-                        async for chunk in stream.iter_by_block():
+                async with client.download_stream(target, offset=offset) as stream:
+                    with open_local_target(local_target, offset) as handle:
+                        async for chunk in stream.iter_by_block(block_size):
                             total += len(chunk)
                             handle.write(chunk)
-            return True, "ok", total
+                            if progress is not None:
+                                progress(len(chunk))
+                elapsed_seconds = time.perf_counter() - started
+            if measure:
+                tuner.record(self.profile, total, elapsed_seconds, rtt_seconds)
+            return True, "ok", offset + total
         except Exception as error:
             return False, str(error), 0
 
     async def file_exists(self, remote_path: str) -> tuple[bool, str, bool]:
-        normalized = self._normalize_remote_path(remote_path)
-        parent = str(PurePosixPath(normalized).parent)
-        target_name = PurePosixPath(normalized).name
+        success, message, entries = await self.stat_many([remote_path])
+        if not success:
+            return False, message, False
+        entry = entries.get(remote_path)
+        return True, "ok", entry is not None and entry.is_file
 
+    async def checksum(self, remote_path: str) -> tuple[bool, str, RemoteChecksum | None]:
+        target = self._normalize_remote_path(remote_path)
         try:
             async with self._open_client() as client:
-                async for path, info in client.list(parent):
-                    if path.name != target_name:
+                for command in FTP_CHECKSUM_COMMANDS:
+                    if command in self._unsupported_commands:
                         continue
-                    entry = self._to_remote_entry(path.name, info)
-                    return True, "ok", entry.is_file
-            return True, "ok", False
+                    code, info = await asyncio.wait_for(
+                        client.command(f"{command} {target}", ("2xx", "4xx", "5xx")),
+                        timeout=self.timeout_seconds,
+                    )
+                    if code.matches("50x"):
+                        self._unsupported_commands.add(command)
+                        continue
+                    if not code.matches("2xx"):
+                        continue
+                    checksum = self._parse_checksum(command, info)
+                    if checksum is not None:
+                        return True, "ok", checksum
+            return True, "ok", None
         except Exception as error:
-            return False, str(error), False
+            return False, str(error), None
+
+    async def _mlst(self, client: aioftp.Client, target: str) -> tuple[bool, RemoteEntry | None]:
+        code, info = await asyncio.wait_for(
+            client.command(f"MLST {target}", ("2xx", "4xx", "5xx")),
+            timeout=self.timeout_seconds,
+        )
+        if code.matches("50x"):
+            self._unsupported_commands.add("MLST")
+            return False, None
+        if code.matches("55x"):
+            return True, None
+        if not code.matches("2xx") or len(info) < 2:
+            return False, None
+        _path, facts = client.parse_mlsx_line(info[1].lstrip())
+        return True, self._to_remote_entry(PurePosixPath(target).name, facts)
+
+    async def _list_by_name(self, client: aioftp.Client, parent: str) -> dict[str, Mapping[str, object]]:
+        try:
+            listing = await asyncio.wait_for(client.list(parent), timeout=self.timeout_seconds)
+        except aioftp.StatusCodeError as error:
+            if any(code.matches("55x") for code in error.received_codes):
+                return {}
+            raise
+        return {path.name: info for path, info in listing}
+
+    async def upload_resume_offset(self, offset: int) -> int:
+        return offset
+
+    async def preserves_mtime(self) -> bool:
+        try:
+            async with self._open_client() as client:
+                return "MFMT" in await self._server_features(client)
+        except Exception:
+            return False
+
+    async def _server_features(self, client: aioftp.Client) -> set[str]:
+        if self._features is None:
+            code, info = await asyncio.wait_for(client.command("FEAT", ("2xx", "4xx", "5xx")), timeout=self.timeout_seconds)
+            features: set[str] = set()
+            if code.matches("2xx"):
+                for line in info[1:]:
+                    parts = line.split()
+                    if parts:
+                        features.add(parts[0].upper())
+            self._features = features
+        return self._features
+
+    async def _set_remote_mtime(self, client: aioftp.Client, target: str, mtime: float) -> None:
+        if "MFMT" not in await self._server_features(client):
+            return
+        stamp = datetime.fromtimestamp(mtime, timezone.utc).strftime("%Y%m%d%H%M%S")
+        await asyncio.wait_for(
+            client.command(f"MFMT {stamp} {target}", ("2xx", "4xx", "5xx")),
+            timeout=self.timeout_seconds,
+        )
+
+    def _parse_checksum(self, command: str, info: list[str]) -> RemoteChecksum | None:
+        parts = " ".join(info).split()
+        if command == "HASH":
+            if len(parts) < 3 or not is_supported_algorithm(parts[0]) or not self._is_hex(parts[2]):
+                return None
+            return RemoteChecksum(algorithm=parts[0], digest=parts[2].lower())
+
+        digest = next((part for part in parts if len(part) == 32 and self._is_hex(part)), None)
+        if digest is None:
+            return None
+        return RemoteChecksum(algorithm="md5", digest=digest.lower())
+
+    @staticmethod
+    def _is_hex(value: str) -> bool:
+        try:
+            int(value, 16)
+        except ValueError:
+            return False
+        return True
+
+    async def _measure_rtt(self, client: aioftp.Client) -> float:
+        started = time.perf_counter()
+        await asyncio.wait_for(client.command("NOOP", ("2xx", "5xx")), timeout=self.timeout_seconds)
+        return time.perf_counter() - started
 
     def _normalize_remote_path(self, remote_path: str) -> str:
         normalized = "/" + "/".join(part for part in remote_path.strip().split("/") if part)
@@ -171,7 +387,7 @@ class FTPClient:
         modify_raw = info.get("modify")
         if isinstance(modify_raw, str) and len(modify_raw) >= 14:
             try:
-                modified_at = datetime.strptime(modify_raw[:14], "%Y%m%d%H%M%S")
+                modified_at = datetime.strptime(modify_raw[:14], "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc)
             except ValueError:
                 modified_at = None
 
@@ -187,15 +403,47 @@ class FTPClient:
             return None
         return ssl.create_default_context()
 
-    def _open_client(self):
-        return aioftp.Client.context(
-            host=self.profile.host,
-            port=self.profile.port,
-            user=self.profile.username,
-            password=self.password,
+    @asynccontextmanager
+    async def _open_client(self) -> AsyncIterator[aioftp.Client]:
+        if self._session_lock is None or self._session_depth == 0:
+            client = await self._connect()
+            try:
+                yield client
+            finally:
+                await self._disconnect(client)
+            return
+
+        async with self._session_lock:
+            if self._session_client is None:
+                self._session_client = await self._connect()
+            client = self._session_client
+            try:
+                yield client
+            except BaseException:
+                if self._session_client is client:
+                    self._session_client = None
+                client.close()
+                raise
+
+    async def _connect(self) -> aioftp.Client:
+        client = aioftp.Client(
             ssl=self._ssl_context(),
             connection_timeout=self.timeout_seconds,
             socket_timeout=self.timeout_seconds,
             passive_commands=("pasv",) if self.profile.passive_mode else (),
             path_timeout=self.timeout_seconds,
         )
+        try:
+            await client.connect(self.profile.host, self.profile.port)
+            await client.login(self.profile.username, self.password)
+        except BaseException:
+            client.close()
+            raise
+        return client
+
+    async def _disconnect(self, client: aioftp.Client) -> None:
+        try:
+            with suppress(Exception):
+                await asyncio.wait_for(client.quit(), timeout=self.timeout_seconds)
+        finally:
+            client.close()
@@ -6,7 +6,7 @@ import logging
 from PySide6.QtCore import QObject, Signal
 
 from core.profiles.models import Profile
-from core.remote.client_factory import create_client
+from core.remote.connection_manager import get_connection_manager
 
 
 class RemoteTestWorker(QObject):
@@ -27,18 +27,19 @@ class RemoteTestWorker(QObject):
             self.failed.emit(str(error))
 
     async def _run_test(self) -> tuple[bool, str]:
-        client = create_client(profile=self._profile, password=self._password, logger=self._logger)
+        client = get_connection_manager().client(profile=self._profile, password=self._password, logger=self._logger)
 
-        success, message = await client.test_connection()
-        if not success:
-            return False, message
+        async with client.session():
+            success, message = await client.test_connection()
+            if not success:
+                return False, message
 
-        ensure_success, ensure_message = await client.ensure_dir(self._profile.remote_path)
-        if not ensure_success:
-            return False, ensure_message
+            ensure_success, ensure_message = await client.ensure_dir(self._profile.remote_path)
+            if not ensure_success:
+                return False, ensure_message
 
-        list_success, list_message, _entries = await client.list_dir(self._profile.remote_path)
-        if not list_success:
-            return False, list_message
+            list_success, list_message, _entries = await client.list_dir(self._profile.remote_path)
+            if not list_success:
+                return False, list_message
 
         return True, message
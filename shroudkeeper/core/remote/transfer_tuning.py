@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import math
+import threading
+
+from core.profiles.models import Profile
+
+
+DEFAULT_FTP_BLOCK_SIZE = 64 * 1024
+MIN_FTP_BLOCK_SIZE = 64 * 1024
+MAX_FTP_BLOCK_SIZE = 4 * 1024 * 1024
+MAX_SFTP_BLOCK_SIZE = 256 * 1024
+DEFAULT_SFTP_WINDOW = 4 * 1024 * 1024
+MIN_SFTP_REQUESTS = 16
+MAX_SFTP_REQUESTS = 256
+AUTO_TUNE_MIN_BYTES = 1024 * 1024
+AUTO_TUNE_WINDOW_FACTOR = 4.0
+
+TuningKey = tuple[int | None, str, str, int]
+
+
+@dataclass(slots=True)
+class TransferTuning:
+    block_size: int = 0
+    max_requests: int = 0
+
+    def ftp_block_size(self) -> int:
+        return self.block_size if self.block_size > 0 else DEFAULT_FTP_BLOCK_SIZE
+
+    def sftp_block_size(self) -> int:
+        return self.block_size if self.block_size > 0 else -1
+
+    def sftp_max_requests(self) -> int:
+        return self.max_requests if self.max_requests > 0 else -1
+
+
+def recommend_tuning(protocol: str, bytes_per_second: float, rtt_seconds: float) -> TransferTuning:
+    if protocol.lower() != "sftp":
+        block_size = _clamp_power_of_two(bytes_per_second / 100.0, MIN_FTP_BLOCK_SIZE, MAX_FTP_BLOCK_SIZE)
+        return TransferTuning(block_size=block_size)
+
+    window = bytes_per_second * rtt_seconds * AUTO_TUNE_WINDOW_FACTOR
+    if window <= DEFAULT_SFTP_WINDOW:
+        return TransferTuning()
+    max_requests = min(MAX_SFTP_REQUESTS, max(MIN_SFTP_REQUESTS, math.ceil(window / MAX_SFTP_BLOCK_SIZE)))
+    return TransferTuning(block_size=MAX_SFTP_BLOCK_SIZE, max_requests=max_requests)
+
+
+def _clamp_power_of_two(value: float, minimum: int, maximum: int) -> int:
+    if value <= minimum:
+        return minimum
+    return min(maximum, 1 << math.ceil(math.log2(value)))
+
+
+class TransferAutoTuner:
+    def __init__(self, logger: logging.Logger | None = None) -> None:
+        self._logger = logger or logging.getLogger("shroudkeeper.remote.tuning")
+        self._lock = threading.Lock()
+        self._tuned: dict[TuningKey, TransferTuning] = {}
+
+    def tuning_for(self, profile: Profile) -> TransferTuning:
+        manual = TransferTuning(block_size=profile.transfer_block_size, max_requests=profile.transfer_max_requests)
+        if not profile.transfer_auto_tune:
+            return manual
+        with self._lock:
+            tuned = self._tuned.get(self._key(profile))
+        return tuned if tuned is not None else manual
+
+    def needs_measurement(self, profile: Profile) -> bool:
+        if not profile.transfer_auto_tune:
+            return False
+        with self._lock:
+            return self._key(profile) not in self._tuned
+
+    def record(self, profile: Profile, size_bytes: int, elapsed_seconds: float, rtt_seconds: float) -> None:
+        if size_bytes < AUTO_TUNE_MIN_BYTES or elapsed_seconds <= 0:
+            return
+
+        key = self._key(profile)
+        tuning = recommend_tuning(profile.protocol, size_bytes / elapsed_seconds, rtt_seconds)
+        with self._lock:
+            if key in self._tuned:
+                return
+            self._tuned[key] = tuning
+        self._logger.info(
+            "Auto-tuned transfers for %s: %.1f MB/s, rtt %.0f ms -> block %d, requests %d",
+            profile.name,
+            size_bytes / elapsed_seconds / 1_000_000,
+            rtt_seconds * 1000,
+            tuning.block_size,
+            tuning.max_requests,
+        )
+
+    @staticmethod
+    def _key(profile: Profile) -> TuningKey:
+        return (profile.id, profile.protocol.lower(), profile.host, int(profile.port))
+
+
+_transfer_tuner = TransferAutoTuner()
+
+
+def get_transfer_tuner() -> TransferAutoTuner:
+    return _transfer_tuner
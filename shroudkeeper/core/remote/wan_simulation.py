@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields
+import logging
+import math
+import os
+from pathlib import Path
+import random
+import time
+from typing import TypeVar
+
+from core.remote.client_base import ProgressCallback, RemoteChecksum, RemoteClient, RemoteEntry
+
+
+WAN_SIMULATION_ENV = "SHROUDKEEPER_WAN_SIMULATION"
+SIMULATED_FAILURE_MESSAGE = "simulated network failure"
+CONNECT_ROUND_TRIPS = 3
+PROGRESS_STEP_SECONDS = 0.1
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class WanConditions:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    upload_kib_per_second: float = 0.0
+    download_kib_per_second: float = 0.0
+    failure_rate: float = 0.0
+    seed: int | None = None
+
+    @property
+    def active(self) -> bool:
+        return (
+            self.latency_ms > 0
+            or self.jitter_ms > 0
+            or self.upload_kib_per_second > 0
+            or self.download_kib_per_second > 0
+            or self.failure_rate > 0
+        )
+
+    @classmethod
+    def parse(cls, spec: str) -> WanConditions:
+        known = {field.name for field in fields(cls)}
+        values: dict[str, float | int] = {}
+        for item in spec.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            key, separator, raw_value = item.partition("=")
+            key = key.strip()
+            if not separator or key not in known:
+                raise ValueError(f"Unknown WAN simulation setting: {item}")
+            values[key] = int(raw_value) if key == "seed" else float(raw_value)
+
+        conditions = cls(**values)
+        if not 0.0 <= conditions.failure_rate <= 1.0:
+            raise ValueError("failure_rate must be between 0 and 1")
+        return conditions
+
+    @classmethod
+    def from_env(cls, logger: logging.Logger | None = None) -> WanConditions | None:
+        spec = os.getenv(WAN_SIMULATION_ENV, "").strip()
+        if not spec:
+            return None
+        try:
+            return cls.parse(spec)
+        except ValueError as error:
+            (logger or logging.getLogger("shroudkeeper.remote.wan")).warning(
+                "Ignoring %s=%r: %s",
+                WAN_SIMULATION_ENV,
+                spec,
+                error,
+            )
+            return None
+
+
+class _BandwidthLimiter:
+    def __init__(self, kib_per_second: float) -> None:
+        self._bytes_per_second = kib_per_second * 1024
+        self._available_at = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._bytes_per_second > 0
+
+    def reserve(self, size_bytes: int) -> float:
+        if self._bytes_per_second <= 0 or size_bytes <= 0:
+            return 0.0
+        now = time.monotonic()
+        self._available_at = max(now, self._available_at) + size_bytes / self._bytes_per_second
+        return self._available_at - now
+
+
+class WanSimulatedClient:
+    def __init__(
+        self,
+        inner: RemoteClient,
+        conditions: WanConditions,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._inner = inner
+        self._conditions = conditions
+        self._logger = logger or logging.getLogger("shroudkeeper.remote.wan")
+        self._random = random.Random(conditions.seed)
+        self._upload_limiter = _BandwidthLimiter(conditions.upload_kib_per_second)
+        self._download_limiter = _BandwidthLimiter(conditions.download_kib_per_second)
+
+    @property
+    def conditions(self) -> WanConditions:
+        return self._conditions
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[WanSimulatedClient]:
+        async with self._inner.session():
+            await self._delay(CONNECT_ROUND_TRIPS)
+            yield self
+
+    async def keepalive(self) -> bool:
+        if await self._should_fail():
+            return False
+        return await self._inner.keepalive()
+
+    async def test_connection(self) -> tuple[bool, str]:
+        return await self._call(self._inner.test_connection, (False, SIMULATED_FAILURE_MESSAGE), CONNECT_ROUND_TRIPS)
+
+    async def ensure_dir(self, remote_path: str) -> tuple[bool, str]:
+        return await self._call(lambda: self._inner.ensure_dir(remote_path), (False, SIMULATED_FAILURE_MESSAGE))
+
+    async def list_dir(self, remote_path: str) -> tuple[bool, str, list[str]]:
+        return await self._call(lambda: self._inner.list_dir(remote_path), (False, SIMULATED_FAILURE_MESSAGE, []))
+
+    async def list_dir_details(self, remote_path: str) -> tuple[bool, str, list[RemoteEntry]]:
+        return await self._call(
+            lambda: self._inner.list_dir_details(remote_path),
+            (False, SIMULATED_FAILURE_MESSAGE, []),
+        )
+
+    async def stat_many(self, remote_paths: list[str]) -> tuple[bool, str, dict[str, RemoteEntry | None]]:
+        return await self._call(lambda: self._inner.stat_many(remote_paths), (False, SIMULATED_FAILURE_MESSAGE, {}))
+
+    async def read_file_bytes(
+        self,
+        remote_path: str,
+        max_bytes: int = 131072,
+    ) -> tuple[bool, str, bytes | None]:
+        return await self._read(lambda: self._inner.read_file_bytes(remote_path, max_bytes))
+
+    async def read_file_prefix(self, remote_path: str, max_bytes: int) -> tuple[bool, str, bytes | None]:
+        return await self._read(lambda: self._inner.read_file_prefix(remote_path, max_bytes))
+
+    async def upload_file(
+        self,
+        local_path: Path,
+        remote_path: str,
+        offset: int = 0,
+        progress: ProgressCallback | None = None,
+    ) -> tuple[bool, str, int]:
+        return await self._transfer(
+            lambda inner_progress: self._inner.upload_file(local_path, remote_path, offset, inner_progress),
+            self._upload_limiter,
+            progress,
+        )
+
+    async def upload_bytes(self, remote_path: str, data: bytes) -> tuple[bool, str, int]:
+        return await self._transfer(
+            lambda _progress: self._inner.upload_bytes(remote_path, data),
+            self._upload_limiter,
+            None,
+        )
+
+    async def download_file(
+        self,
+        remote_path: str,
+        local_path: Path,
+        offset: int = 0,
+        progress: ProgressCallback | None = None,
+    ) -> tuple[bool, str, int]:
+        return await self._transfer(
+            lambda inner_progress: self._inner.download_file(remote_path, local_path, offset, inner_progress),
+            self._download_limiter,
+            progress,
+        )
+
+    async def file_exists(self, remote_path: str) -> tuple[bool, str, bool]:
+        return await self._call(lambda: self._inner.file_exists(remote_path), (False, SIMULATED_FAILURE_MESSAGE, False))
+
+    async def checksum(self, remote_path: str) -> tuple[bool, str, RemoteChecksum | None]:
+        return await self._call(lambda: self._inner.checksum(remote_path), (False, SIMULATED_FAILURE_MESSAGE, None))
+
+    async def preserves_mtime(self) -> bool:
+        return await self._inner.preserves_mtime()
+
+    async def upload_resume_offset(self, offset: int) -> int:
+        return await self._inner.upload_resume_offset(offset)
+
+    async def _call(self, operation: Callable[[], Awaitable[T]], failure: T, round_trips: int = 1) -> T:
+        if await self._should_fail():
+            return failure
+        await self._delay(round_trips)
+        return await operation()
+
+    async def _read(
+        self,
+        operation: Callable[[], Awaitable[tuple[bool, str, bytes | None]]],
+    ) -> tuple[bool, str, bytes | None]:
+        result, elapsed_seconds = await self._call(
+            lambda: self._timed(operation),
+            ((False, SIMULATED_FAILURE_MESSAGE, None), 0.0),
+        )
+        await self._throttle(self._download_limiter, len(result[2] or b""), elapsed_seconds)
+        return result
+
+    async def _transfer(
+        self,
+        operation: Callable[[ProgressCallback | None], Awaitable[tuple[bool, str, int]]],
+        limiter: _BandwidthLimiter,
+        progress: ProgressCallback | None,
+    ) -> tuple[bool, str, int]:
+        if not limiter.active:
+            return await self._call(lambda: operation(progress), (False, SIMULATED_FAILURE_MESSAGE, 0))
+
+        result, elapsed_seconds = await self._call(
+            lambda: self._timed(lambda: operation(None)),
+            ((False, SIMULATED_FAILURE_MESSAGE, 0), 0.0),
+        )
+        await self._throttle(limiter, result[2], elapsed_seconds, progress)
+        return result
+
+    @staticmethod
+    async def _timed(operation: Callable[[], Awaitable[T]]) -> tuple[T, float]:
+        started = time.monotonic()
+        result = await operation()
+        return result, time.monotonic() - started
+
+    async def _throttle(
+        self,
+        limiter: _BandwidthLimiter,
+        size_bytes: int,
+        elapsed_seconds: float,
+        progress: ProgressCallback | None = None,
+    ) -> None:
+        remaining = max(0.0, limiter.reserve(size_bytes) - elapsed_seconds)
+        if progress is None or size_bytes <= 0:
+            await asyncio.sleep(remaining)
+            return
+
+        steps = max(1, math.ceil(remaining / PROGRESS_STEP_SECONDS))
+        reported = 0
+        for step in range(1, steps + 1):
+            await asyncio.sleep(remaining / steps)
+            target = size_bytes * step // steps
+            progress(target - reported)
+            reported = target
+
+    async def _delay(self, round_trips: int = 1) -> None:
+        latency = self._conditions.latency_ms * round_trips
+        if self._conditions.jitter_ms > 0:
+            latency += self._random.uniform(0.0, self._conditions.jitter_ms)
+        if latency > 0:
+            await asyncio.sleep(latency / 1000)
+
+    async def _should_fail(self) -> bool:
+        if self._conditions.failure_rate <= 0 or self._random.random() >= self._conditions.failure_rate:
+            return False
+        await self._delay()
+        self._logger.debug("Injecting simulated network failure")
+        return True
@@ -1,13 +1,23 @@
-from core.saves.index_service import IndexFileService
-from core.saves.models import SaveRoll, SaveScanResult, SaveSlot
-from core.saves.scanner_service import SaveScannerService
-from core.saves.world_slots import WORLD_SLOT_MAPPING
-
-__all__ = [
-    "IndexFileService",
-    "SaveRoll",
-    "SaveScanResult",
-    "SaveSlot",
-    "SaveScannerService",
-    "WORLD_SLOT_MAPPING",
-]
+from importlib import import_module
+
+_EXPORTS = {
+    "IndexFileService": "core.saves.index_service",
+    "RollIntegrity": "core.saves.models",
+    "RollIntegrityStatus": "core.saves.models",
+    "SaveRoll": "core.saves.models",
+    "SaveRootCandidate": "core.saves.models",
+    "SaveScanResult": "core.saves.models",
+    "SaveSlot": "core.saves.models",
+    "SaveScannerService": "core.saves.scanner_service",
+    "WORLD_SLOT_MAPPING": "core.saves.world_slots",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    # Loaded lazily so spawned roll verifiers importing core.saves.roll_verifier skip Qt and storage.
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name), name)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from contextlib import closing
+from datetime import datetime, timezone
+import hashlib
+import logging
+import mmap
+import os
+from pathlib import Path
+import threading
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from core.saves.models import SaveScanResult
+from storage.db import DatabaseManager
+from storage.repositories import ContentHashEntry, ContentHashRepository
+
+
+HASH_ALGORITHM = "blake2b-128"
+HASH_DIGEST_SIZE = 16
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def compute_file_digest(path: Path) -> str:
+    hasher = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+    with path.open("rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return hasher.hexdigest()
+
+        with mapped, memoryview(mapped) as view:
+            for start in range(0, len(view), HASH_CHUNK_SIZE):
+                hasher.update(view[start : start + HASH_CHUNK_SIZE])
+    return hasher.hexdigest()
+
+
+class ContentHashService:
+    def __init__(self, db_path: Path | None = None, logger: logging.Logger | None = None) -> None:
+        self._db_path = db_path
+        self._logger = logger or logging.getLogger("shroudkeeper.scanner.hashes")
+        self._lock = threading.Lock()
+
+    def hash_files(
+        self,
+        paths: Iterable[Path],
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> dict[Path, str]:
+        stats: dict[str, tuple[Path, int, int]] = {}
+        for path in paths:
+            try:
+                stat_result = path.stat()
+            except OSError:
+                continue
+            stats[self._path_key(path)] = (path, stat_result.st_size, stat_result.st_mtime_ns)
+
+        if not stats:
+            return {}
+
+        with self._lock, closing(DatabaseManager(db_path=self._db_path, logger=self._logger)) as database:
+            repository = ContentHashRepository(database.connect())
+            known = repository.get_many(list(stats))
+
+            digests: dict[Path, str] = {}
+            fresh: list[ContentHashEntry] = []
+            for key, (path, size_bytes, mtime_ns) in stats.items():
+                entry = known.get(key)
+                if (
+                    entry is not None
+                    and entry.algorithm == HASH_ALGORITHM
+                    and entry.size_bytes == size_bytes
+                    and entry.mtime_ns == mtime_ns
+                ):
+                    digests[path] = entry.digest
+                    continue
+
+                if is_cancelled is not None and is_cancelled():
+                    break
+
+                digest = self._hash_stable(path, size_bytes, mtime_ns)
+                if digest is None:
+                    continue
+
+                digests[path] = digest
+                fresh.append(
+                    ContentHashEntry(
+                        path=key,
+                        size_bytes=size_bytes,
+                        mtime_ns=mtime_ns,
+                        algorithm=HASH_ALGORITHM,
+                        digest=digest,
+                        hashed_at=datetime.now(timezone.utc).isoformat(),
+                    )
+                )
+
+            repository.upsert_many(fresh)
+
+        if fresh:
+            self._logger.info("Content hashes updated: hashed=%s reused=%s", len(fresh), len(digests) - len(fresh))
+        return digests
+
+    def hash_scan_result(
+        self,
+        result: SaveScanResult,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> dict[Path, str]:
+        paths = [roll.path for slot in result.slots for roll in slot.rolls if roll.exists]
+        return self.hash_files(paths, is_cancelled=is_cancelled)
+
+    def get_digest(self, path: Path) -> str | None:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return None
+
+        with self._lock, closing(DatabaseManager(db_path=self._db_path, logger=self._logger)) as database:
+            entry = ContentHashRepository(database.connect()).get_many([self._path_key(path)]).get(self._path_key(path))
+
+        if (
+            entry is None
+            or entry.algorithm != HASH_ALGORITHM
+            or entry.size_bytes != stat_result.st_size
+            or entry.mtime_ns != stat_result.st_mtime_ns
+        ):
+            return None
+        return entry.digest
+
+    def find_identical(self, path: Path) -> list[Path]:
+        digest = self.get_digest(path)
+        if digest is None:
+            return []
+
+        own_key = self._path_key(path)
+        matches: list[Path] = []
+        stale: list[str] = []
+
+        with self._lock, closing(DatabaseManager(db_path=self._db_path, logger=self._logger)) as database:
+            repository = ContentHashRepository(database.connect())
+            for entry in repository.list_by_digest(digest, HASH_ALGORITHM):
+                if entry.path == own_key:
+                    continue
+                candidate = Path(entry.path)
+                try:
+                    stat_result = candidate.stat()
+                except OSError:
+                    stale.append(entry.path)
+                    continue
+                if stat_result.st_size == entry.size_bytes and stat_result.st_mtime_ns == entry.mtime_ns:
+                    matches.append(candidate)
+            repository.delete_paths(stale)
+
+        return matches
+
+    def _hash_stable(self, path: Path, size_bytes: int, mtime_ns: int) -> str | None:
+        try:
+            digest = compute_file_digest(path)
+            stat_result = path.stat()
+        except OSError as error:
+            self._logger.warning("Content hash failed for %s: %s", path.name, error)
+            return None
+
+        if stat_result.st_size != size_bytes or stat_result.st_mtime_ns != mtime_ns:
+            self._logger.debug("File changed while hashing, skipped: %s", path.name)
+            return None
+        return digest
+
+    @staticmethod
+    def _path_key(path: Path) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+
+class ContentHashWorker(QObject):
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, service: ContentHashService, result: SaveScanResult) -> None:
+        super().__init__()
+        self._service = service
+        self._result = result
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            self.finished.emit(self._service.hash_scan_result(self._result, is_cancelled=lambda: self._cancelled))
+        except Exception as exc:
+            self.failed.emit(str(exc))
+
+
+_content_hash_service = ContentHashService()
+
+
+def get_content_hash_service() -> ContentHashService:
+    return _content_hash_service
@@ -10,13 +10,12 @@ class IndexFileService:
         self._logger = logger or logging.getLogger("shroudkeeper.scanner.index")
 
     def read_latest(self, index_path: Path) -> int | None:
-        if not index_path.exists():
-            return None
-
         try:
             raw_content = index_path.read_bytes()
             decoded_content = raw_content.decode("utf-8")
             payload = json.loads(decoded_content)
+        except FileNotFoundError:
+            return None
         except (OSError, UnicodeDecodeError, json.JSONDecodeError, ValueError):
             self._logger.warning("Invalid index JSON at %s", index_path.name)
             return None
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing
+from datetime import datetime, timezone
+import logging
+import os
+from pathlib import Path
+import threading
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from core.saves.models import RollIntegrity, RollIntegrityStatus, SaveScanResult
+from core.saves.roll_verifier import VERIFIER_VERSION, roll_integrity_result, verify_roll_file
+from core.system.process_pool import SpawnProcessPool
+from storage.db import DatabaseManager
+from storage.repositories import RollIntegrityEntry, RollIntegrityRepository
+
+
+POOL_THRESHOLD = 4
+
+
+class RollIntegrityService:
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        logger: logging.Logger | None = None,
+        max_workers: int | None = None,
+        pool_threshold: int = POOL_THRESHOLD,
+    ) -> None:
+        self._db_path = db_path
+        self._logger = logger or logging.getLogger("shroudkeeper.scanner.integrity")
+        self._max_workers = max(1, max_workers or min(4, os.cpu_count() or 1))
+        self._pool_threshold = max(1, pool_threshold)
+        self._lock = threading.Lock()
+
+    def verify_paths(
+        self,
+        paths: Iterable[Path],
+        use_cache: bool = True,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> dict[Path, RollIntegrity]:
+        results: dict[Path, RollIntegrity] = {}
+        stats: dict[str, tuple[Path, int, int]] = {}
+        for path in paths:
+            try:
+                stat_result = path.stat()
+            except OSError:
+                results[path] = roll_integrity_result(path, RollIntegrityStatus.MISSING, "file not found", 0, 0)
+                continue
+            stats[self._path_key(path)] = (path, stat_result.st_size, stat_result.st_mtime_ns)
+
+        if not stats:
+            return results
+
+        cached: dict[str, RollIntegrityEntry] = {}
+        if use_cache:
+            with self._lock, closing(DatabaseManager(db_path=self._db_path, logger=self._logger)) as database:
+                cached = RollIntegrityRepository(database.connect()).get_many(list(stats))
+
+        misses: list[tuple[str, Path]] = []
+        for key, (path, size_bytes, mtime_ns) in stats.items():
+            entry = cached.get(key)
+            if (
+                entry is not None
+                and entry.size_bytes == size_bytes
+                and entry.mtime_ns == mtime_ns
+                and entry.verifier_version == VERIFIER_VERSION
+            ):
+                results[path] = self._entry_to_result(path, entry)
+            else:
+                misses.append((key, path))
+
+        if not misses or (is_cancelled is not None and is_cancelled()):
+            return results
+
+        verified = self._verify_uncached([path for _key, path in misses], is_cancelled)
+
+        checked_at = datetime.now(timezone.utc).isoformat()
+        fresh: list[RollIntegrityEntry] = []
+        for key, path in misses:
+            result = verified.get(path)
+            if result is None:
+                continue
+            results[path] = result
+            _path, size_bytes, mtime_ns = stats[key]
+            if result.status == RollIntegrityStatus.MISSING:
+                continue
+            if result.size_bytes == size_bytes and result.mtime_ns == mtime_ns:
+                fresh.append(self._result_to_entry(key, result, checked_at))
+
+        if fresh:
+            with self._lock, closing(DatabaseManager(db_path=self._db_path, logger=self._logger)) as database:
+                RollIntegrityRepository(database.connect()).upsert_many(fresh)
+
+            invalid = sum(1 for entry in fresh if entry.status != RollIntegrityStatus.VALID.value)
+            self._logger.info("Roll integrity checked: verified=%s invalid=%s", len(fresh), invalid)
+        return results
+
+    def verify_scan_result(
+        self,
+        result: SaveScanResult,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> dict[Path, RollIntegrity]:
+        paths = [roll.path for slot in result.slots for roll in slot.rolls if roll.exists]
+        return self.verify_paths(paths, is_cancelled=is_cancelled)
+
+    def find_invalid(self, paths: Iterable[Path]) -> list[RollIntegrity]:
+        results = self.verify_paths(paths)
+        return [result for result in results.values() if not result.is_valid]
+
+    def _verify_uncached(
+        self,
+        paths: list[Path],
+        is_cancelled: Callable[[], bool] | None,
+    ) -> dict[Path, RollIntegrity]:
+        if len(paths) < self._pool_threshold or self._max_workers == 1:
+            return self._verify_inline(paths, is_cancelled)
+
+        workers = min(self._max_workers, len(paths))
+        results: dict[Path, RollIntegrity] = {}
+        verify_pool = get_roll_verify_pool()
+        executor: ProcessPoolExecutor | None = None
+        try:
+            executor = verify_pool.executor(workers)
+            futures = [(path, executor.submit(verify_roll_file, path)) for path in paths]
+            for path, future in futures:
+                results[path] = future.result()
+                if is_cancelled is not None and is_cancelled():
+                    for _pending_path, pending in futures:
+                        pending.cancel()
+                    break
+        except (BrokenProcessPool, OSError) as error:
+            self._logger.warning("Integrity process pool unavailable, verifying inline: %s", error)
+            if executor is not None:
+                verify_pool.discard(executor)
+            remaining = [path for path in paths if path not in results]
+            results.update(self._verify_inline(remaining, is_cancelled))
+        return results
+
+    @staticmethod
+    def _verify_inline(
+        paths: list[Path],
+        is_cancelled: Callable[[], bool] | None,
+    ) -> dict[Path, RollIntegrity]:
+        results: dict[Path, RollIntegrity] = {}
+        for path in paths:
+            if is_cancelled is not None and is_cancelled():
+                break
+            results[path] = verify_roll_file(path)
+        return results
+
+    @staticmethod
+    def _entry_to_result(path: Path, entry: RollIntegrityEntry) -> RollIntegrity:
+        return RollIntegrity(
+            path=path,
+            status=RollIntegrityStatus(entry.status),
+            message=entry.message,
+            size_bytes=entry.size_bytes,
+            mtime_ns=entry.mtime_ns,
+            frames=entry.frames,
+            decompressed_bytes=entry.decompressed_bytes,
+        )
+
+    @staticmethod
+    def _result_to_entry(path_key: str, result: RollIntegrity, checked_at: str) -> RollIntegrityEntry:
+        return RollIntegrityEntry(
+            path=path_key,
+            size_bytes=result.size_bytes,
+            mtime_ns=result.mtime_ns,
+            verifier_version=VERIFIER_VERSION,
+            status=result.status.value,
+            message=result.message,
+            frames=result.frames,
+            decompressed_bytes=result.decompressed_bytes,
+            checked_at=checked_at,
+        )
+
+    @staticmethod
+    def _path_key(path: Path) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+
+class RollIntegrityWorker(QObject):
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, service: RollIntegrityService, result: SaveScanResult) -> None:
+        super().__init__()
+        self._service = service
+        self._result = result
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            self.finished.emit(self._service.verify_scan_result(self._result, is_cancelled=lambda: self._cancelled))
+        except Exception as exc:
+            self.failed.emit(str(exc))
+
+
+_roll_integrity_service = RollIntegrityService()
+
+
+def get_roll_integrity_service() -> RollIntegrityService:
+    return _roll_integrity_service
+
+
+_roll_verify_pool = SpawnProcessPool()
+
+
+def get_roll_verify_pool() -> SpawnProcessPool:
+    return _roll_verify_pool
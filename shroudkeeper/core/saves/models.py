@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 
 
@@ -33,3 +34,31 @@ class SaveScanResult:
     root: Path
     slots: list[SaveSlot]
     warnings: list[str]
+
+
+@dataclass(slots=True)
+class SaveRootCandidate:
+    path: Path
+    score: tuple[int, int]
+
+
+class RollIntegrityStatus(str, Enum):
+    VALID = "valid"
+    TRUNCATED = "truncated"
+    CORRUPT = "corrupt"
+    MISSING = "missing"
+
+
+@dataclass(slots=True)
+class RollIntegrity:
+    path: Path
+    status: RollIntegrityStatus
+    message: str
+    size_bytes: int
+    mtime_ns: int
+    frames: int
+    decompressed_bytes: int
+
+    @property
+    def is_valid(self) -> bool:
+        return self.status == RollIntegrityStatus.VALID
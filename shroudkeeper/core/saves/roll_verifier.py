@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from pathlib import Path
+import re
+
+import zstandard
+
+from core.saves.models import RollIntegrity, RollIntegrityStatus
+
+
+VERIFIER_VERSION = 2
+
+ROLL_FILE_PATTERN = re.compile(r"^[0-9a-fA-F]{8}(?:-[0-9]+)?$")
+VERIFY_READ_SIZE = 64 * 1024
+HEADER_SCAN_LIMIT = 64 * 1024
+MAX_WINDOW_SIZE = 128 * 1024 * 1024
+
+_ZSTD_MAGIC = b"\x28\xB5\x2F\xFD"
+_SKIPPABLE_MAGIC_SUFFIX = b"\x2A\x4D\x18"
+_SKIPPABLE_HEADER_SIZE = 8
+
+
+def is_roll_file_name(name: str) -> bool:
+    return ROLL_FILE_PATTERN.match(name) is not None
+
+
+def verify_roll_file(path: Path, read_size: int = VERIFY_READ_SIZE) -> RollIntegrity:
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return roll_integrity_result(path, RollIntegrityStatus.MISSING, "file not found", 0, 0)
+
+    size_bytes = stat_result.st_size
+    mtime_ns = stat_result.st_mtime_ns
+    frames = 0
+    decompressed_bytes = 0
+
+    def build(status: RollIntegrityStatus, message: str) -> RollIntegrity:
+        return roll_integrity_result(path, status, message, size_bytes, mtime_ns, frames, decompressed_bytes)
+
+    try:
+        with path.open("rb") as handle:
+            head = handle.read(HEADER_SCAN_LIMIT)
+            offset = head.find(_ZSTD_MAGIC)
+            if offset < 0:
+                if size_bytes == 0:
+                    return build(RollIntegrityStatus.TRUNCATED, "file is empty")
+                return build(RollIntegrityStatus.CORRUPT, "no zstd frame found")
+
+            decompressor = zstandard.ZstdDecompressor(max_window_size=MAX_WINDOW_SIZE)
+            pending = head[offset:]
+
+            while True:
+                if len(pending) < _SKIPPABLE_HEADER_SIZE:
+                    pending += handle.read(read_size)
+                if not pending:
+                    break
+
+                if _is_skippable_frame(pending):
+                    skip = _SKIPPABLE_HEADER_SIZE + int.from_bytes(pending[4:8], "little")
+                    while skip > len(pending):
+                        skip -= len(pending)
+                        pending = handle.read(read_size)
+                        if not pending:
+                            return build(RollIntegrityStatus.TRUNCATED, f"skippable frame {frames} ends early")
+                    pending = pending[skip:]
+                    continue
+
+                if not pending.startswith(_ZSTD_MAGIC):
+                    return build(RollIntegrityStatus.CORRUPT, f"unexpected data after zstd frame {frames}")
+
+                frame = decompressor.decompressobj()
+                frames += 1
+                while not frame.eof:
+                    if not pending:
+                        pending = handle.read(read_size)
+                        if not pending:
+                            return build(RollIntegrityStatus.TRUNCATED, f"zstd frame {frames} ends early")
+                    chunk, pending = pending[:read_size], pending[read_size:]
+                    decompressed_bytes += len(frame.decompress(chunk))
+                pending = frame.unused_data + pending
+    except zstandard.ZstdError as error:
+        return build(RollIntegrityStatus.CORRUPT, str(error))
+    except OSError as error:
+        return build(RollIntegrityStatus.CORRUPT, f"read failed: {error}")
+
+    return build(RollIntegrityStatus.VALID, "ok")
+
+
+def roll_integrity_result(
+    path: Path,
+    status: RollIntegrityStatus,
+    message: str,
+    size_bytes: int,
+    mtime_ns: int,
+    frames: int = 0,
+    decompressed_bytes: int = 0,
+) -> RollIntegrity:
+    return RollIntegrity(
+        path=path,
+        status=status,
+        message=message,
+        size_bytes=size_bytes,
+        mtime_ns=mtime_ns,
+        frames=frames,
+        decompressed_bytes=decompressed_bytes,
+    )
+
+
+def _is_skippable_frame(data: bytes) -> bool:
+    return len(data) >= 4 and data[0] & 0xF0 == 0x50 and data[1:4] == _SKIPPABLE_MAGIC_SUFFIX
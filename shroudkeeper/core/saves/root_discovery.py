@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+from pathlib import Path
+import re
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from core.saves.models import SaveRootCandidate
+
+
+STEAM_APP_ID = "1203620"
+DEFAULT_STEAM_USERDATA_DIR = Path(r"C:\Program Files (x86)\Steam\userdata")
+SAVE_FILE_PATTERN = re.compile(r"^[0-9a-fA-F]{8}(?:-[0-9]|-index|_info(?:-[0-9]+|-index)?)?$")
+
+
+class SaveRootDiscoveryService:
+    def __init__(self, logger: logging.Logger | None = None, max_workers: int = 8) -> None:
+        self._logger = logger or logging.getLogger("shroudkeeper.scanner.discovery")
+        self._max_workers = max(1, max_workers)
+
+    def discover_candidate_roots(self, configured_root: str = "") -> list[Path]:
+        candidates: list[Path] = []
+
+        if configured_root.strip() != "":
+            candidates.append(Path(configured_root.strip()))
+
+        userprofile = os.getenv("USERPROFILE")
+        if userprofile:
+            candidates.append(Path(userprofile) / "Saved Games" / "enshrouded")
+
+        steam_install_dir = os.getenv("STEAMINSTALLDIRECTORY")
+        if steam_install_dir:
+            candidates.extend(self._steam_remote_dirs(Path(steam_install_dir) / "userdata"))
+
+        candidates.extend(self._steam_remote_dirs(DEFAULT_STEAM_USERDATA_DIR))
+
+        unique: dict[str, Path] = {}
+        for candidate in candidates:
+            try:
+                normalized = candidate.expanduser().resolve()
+            except Exception:
+                continue
+            if normalized.is_dir():
+                unique[str(normalized).lower()] = normalized
+
+        return sorted(unique.values(), key=lambda path: str(path).lower())
+
+    def rank_candidates(self, candidates: list[Path]) -> list[SaveRootCandidate]:
+        if not candidates:
+            return []
+
+        workers = min(self._max_workers, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="save-root-discovery") as executor:
+            scores = list(executor.map(self.score_candidate, candidates))
+
+        ranked = [SaveRootCandidate(path=path, score=score) for path, score in zip(candidates, scores)]
+        ranked.sort(key=lambda candidate: candidate.score, reverse=True)
+        return ranked
+
+    def discover_and_rank(self, configured_root: str = "") -> list[SaveRootCandidate]:
+        candidates = self.discover_candidate_roots(configured_root)
+        ranked = self.rank_candidates(candidates)
+        self._logger.info("Save root discovery finished: candidates=%s", len(ranked))
+        return ranked
+
+    @staticmethod
+    def score_candidate(candidate: Path) -> tuple[int, int]:
+        hit_count = 0
+        try:
+            with os.scandir(candidate) as iterator:
+                for entry in iterator:
+                    if not SAVE_FILE_PATTERN.match(entry.name):
+                        continue
+                    try:
+                        if entry.is_file():
+                            hit_count += 1
+                    except OSError:
+                        continue
+        except OSError:
+            return (0, 0)
+
+        return (1 if hit_count > 0 else 0, hit_count)
+
+    @staticmethod
+    def _steam_remote_dirs(userdata_dir: Path) -> list[Path]:
+        try:
+            with os.scandir(userdata_dir) as iterator:
+                user_dirs = [entry.path for entry in iterator if entry.is_dir()]
+        except OSError:
+            return []
+
+        return [Path(user_dir) / STEAM_APP_ID / "remote" for user_dir in user_dirs]
+
+
+class SaveRootDiscoveryWorker(QObject):
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, service: SaveRootDiscoveryService, configured_root: str) -> None:
+        super().__init__()
+        self._service = service
+        self._configured_root = configured_root
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            self.finished.emit(self._service.discover_and_rank(self._configured_root))
+        except Exception as exc:
+            self.failed.emit(str(exc))
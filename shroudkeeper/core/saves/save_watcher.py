@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QThread, QTimer, Signal
+
+from core.saves.models import SaveScanResult, SaveSlot
+from core.saves.scan_worker import SaveScanWorker
+from core.saves.scanner_service import SaveScannerService
+
+
+class SaveWatcherService(QObject):
+    slot_changed = Signal(int, object)
+    result_changed = Signal(object)
+    failed = Signal(str)
+
+    DEBOUNCE_MS = 1500
+    POLL_INTERVAL_MS = 5000
+
+    def __init__(
+        self,
+        scanner: SaveScannerService,
+        logger: logging.Logger | None = None,
+        debounce_ms: int = DEBOUNCE_MS,
+        poll_interval_ms: int = POLL_INTERVAL_MS,
+        force_polling: bool = False,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._scanner = scanner
+        self._logger = logger or logging.getLogger("shroudkeeper.scanner.watcher")
+        self._force_polling = force_polling
+
+        self._root: Path | None = None
+        self._polling = False
+        self._baseline: SaveScanResult | None = None
+        self._scan_thread: QThread | None = None
+        self._scan_worker: SaveScanWorker | None = None
+        self._rescan_pending = False
+
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_path_changed)
+        self._fs_watcher.fileChanged.connect(self._on_path_changed)
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(max(0, debounce_ms))
+        self._debounce_timer.timeout.connect(self._start_rescan)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(max(1000, poll_interval_ms))
+        self._poll_timer.timeout.connect(self._start_rescan)
+
+    def watch(self, result: SaveScanResult) -> None:
+        self._baseline = result
+        if self._root == result.root:
+            if not self._polling:
+                self._refresh_watched_files(result)
+            return
+
+        self.stop()
+        self._root = result.root
+        self._polling = self._force_polling or not self._fs_watcher.addPath(str(result.root))
+
+        if self._polling:
+            self._logger.info("Watching save root by polling: %s", result.root)
+            self._poll_timer.start()
+            return
+
+        self._logger.info("Watching save root: %s", result.root)
+        self._refresh_watched_files(result)
+
+    def stop(self) -> None:
+        if self._scan_worker is not None:
+            self._scan_worker.cancel()
+        self._debounce_timer.stop()
+        self._poll_timer.stop()
+        watched = self._fs_watcher.files() + self._fs_watcher.directories()
+        if watched:
+            self._fs_watcher.removePaths(watched)
+        self._root = None
+        self._polling = False
+        self._rescan_pending = False
+
+    def is_watching(self) -> bool:
+        return self._root is not None
+
+    def watched_root(self) -> Path | None:
+        return self._root
+
+    def rescan_now(self) -> None:
+        self._debounce_timer.stop()
+        self._start_rescan()
+
+    def _refresh_watched_files(self, result: SaveScanResult) -> None:
+        wanted = {str(slot.index_path) for slot in result.slots if slot.index_path.is_file()}
+        current = set(self._fs_watcher.files())
+
+        stale = sorted(current - wanted)
+        if stale:
+            self._fs_watcher.removePaths(stale)
+
+        added = sorted(wanted - current)
+        if added:
+            self._fs_watcher.addPaths(added)
+
+    def _on_path_changed(self, _path: str) -> None:
+        if self._root is None:
+            return
+        self._debounce_timer.start()
+
+    def _start_rescan(self) -> None:
+        if self._root is None:
+            return
+
+        if self._scan_thread is not None:
+            self._rescan_pending = True
+            return
+
+        thread = QThread(self)
+        worker = SaveScanWorker(scanner=self._scanner, root=self._root, incremental=True)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_rescan_finished)
+        worker.failed.connect(self._on_rescan_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_rescan_closed)
+
+        self._scan_thread = thread
+        self._scan_worker = worker
+        thread.start()
+
+    def _on_rescan_finished(self, result: object) -> None:
+        if not isinstance(result, SaveScanResult) or self._root is None:
+            return
+        if self._scan_worker is not None and self._scan_worker.is_cancelled():
+            return
+        if result.root != self._root:
+            return
+
+        previous = self._baseline
+        self._baseline = result
+
+        if not self._polling:
+            self._refresh_watched_files(result)
+
+        changed = self._diff_slots(previous, result)
+        if not changed and previous is not None and previous.warnings == result.warnings:
+            return
+
+        for slot_number, slot in changed:
+            self._logger.info("Save slot %s changed on disk", slot_number)
+            self.slot_changed.emit(slot_number, slot)
+        self.result_changed.emit(result)
+
+    def _on_rescan_failed(self, message: str) -> None:
+        self._logger.warning("Watched save rescan failed: %s", message)
+        self.failed.emit(message)
+
+    def _on_rescan_closed(self) -> None:
+        self._scan_thread = None
+        self._scan_worker = None
+        if self._rescan_pending:
+            self._rescan_pending = False
+            self._start_rescan()
+
+    @staticmethod
+    def _diff_slots(
+        previous: SaveScanResult | None,
+        current: SaveScanResult,
+    ) -> list[tuple[int, SaveSlot | None]]:
+        before = {slot.slot_number: slot for slot in previous.slots} if previous is not None else {}
+        after = {slot.slot_number: slot for slot in current.slots}
+
+        changed: list[tuple[int, SaveSlot | None]] = []
+        for slot_number in sorted(set(before) | set(after)):
+            old_slot = before.get(slot_number)
+            new_slot = after.get(slot_number)
+            if old_slot != new_slot:
+                changed.append((slot_number, new_slot))
+        return changed
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import uuid
+
+from core.paths import get_scan_cache_path
+
+
+CACHE_VERSION = 1
+
+FileFingerprint = tuple[int, int]
+
+
+@dataclass(slots=True)
+class CachedSlotData:
+    fingerprints: dict[str, FileFingerprint]
+    latest: int | None
+    info_resolved: bool = False
+    info_name: str | None = None
+    info_source: str = "fallback"
+    info_extractor_version: int | None = None
+
+
+class ScanCache:
+    def __init__(self, cache_path: Path | None = None, logger: logging.Logger | None = None) -> None:
+        self._cache_path = cache_path
+        self._logger = logger or logging.getLogger("shroudkeeper.scanner.cache")
+        self._lock = threading.Lock()
+        self._roots: dict[str, dict[str, CachedSlotData]] | None = None
+        self._dirty = False
+
+    def get_slot(self, root: Path, world_id: str) -> CachedSlotData | None:
+        with self._lock:
+            roots = self._ensure_loaded()
+            return roots.get(self._root_key(root), {}).get(world_id)
+
+    def put_slot(self, root: Path, world_id: str, data: CachedSlotData) -> None:
+        with self._lock:
+            roots = self._ensure_loaded()
+            roots.setdefault(self._root_key(root), {})[world_id] = data
+            self._dirty = True
+
+    def drop_slot(self, root: Path, world_id: str) -> None:
+        with self._lock:
+            roots = self._ensure_loaded()
+            slots = roots.get(self._root_key(root))
+            if slots is None or world_id not in slots:
+                return
+            del slots[world_id]
+            if not slots:
+                del roots[self._root_key(root)]
+            self._dirty = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._roots = {}
+            self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty or self._roots is None:
+                return
+
+            payload = {
+                "version": CACHE_VERSION,
+                "roots": {
+                    root_key: {world_id: self._slot_to_json(data) for world_id, data in slots.items()}
+                    for root_key, slots in self._roots.items()
+                },
+            }
+
+            path = self._resolve_path()
+            temp_path = path.with_name(f"{path.name}.tmp-{uuid.uuid4().hex}")
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+                os.replace(temp_path, path)
+                self._dirty = False
+            except OSError as error:
+                self._logger.warning("Failed to write scan cache: %s", error)
+            finally:
+                if temp_path.exists():
+                    try:
+                        temp_path.unlink()
+                    except OSError:
+                        pass
+
+    def _ensure_loaded(self) -> dict[str, dict[str, CachedSlotData]]:
+        if self._roots is None:
+            self._roots = self._load()
+        return self._roots
+
+    def _load(self) -> dict[str, dict[str, CachedSlotData]]:
+        path = self._resolve_path()
+        if not path.exists():
+            return {}
+
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            self._logger.warning("Invalid scan cache at %s - ignored", path.name)
+            return {}
+
+        if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+            return {}
+
+        roots_raw = payload.get("roots")
+        if not isinstance(roots_raw, dict):
+            return {}
+
+        roots: dict[str, dict[str, CachedSlotData]] = {}
+        for root_key, slots_raw in roots_raw.items():
+            if not isinstance(root_key, str) or not isinstance(slots_raw, dict):
+                continue
+            slots: dict[str, CachedSlotData] = {}
+            for world_id, slot_raw in slots_raw.items():
+                data = self._slot_from_json(slot_raw)
+                if isinstance(world_id, str) and data is not None:
+                    slots[world_id] = data
+            if slots:
+                roots[root_key] = slots
+        return roots
+
+    def _resolve_path(self) -> Path:
+        if self._cache_path is None:
+            self._cache_path = get_scan_cache_path()
+        return self._cache_path
+
+    @staticmethod
+    def _root_key(root: Path) -> str:
+        return os.path.normcase(str(root))
+
+    @staticmethod
+    def _slot_to_json(data: CachedSlotData) -> dict[str, object]:
+        return {
+            "files": {name: [size, mtime_ns] for name, (size, mtime_ns) in data.fingerprints.items()},
+            "latest": data.latest,
+            "info_resolved": data.info_resolved,
+            "info_name": data.info_name,
+            "info_source": data.info_source,
+            "info_extractor_version": data.info_extractor_version,
+        }
+
+    @staticmethod
+    def _slot_from_json(raw: object) -> CachedSlotData | None:
+        if not isinstance(raw, dict):
+            return None
+
+        files_raw = raw.get("files")
+        if not isinstance(files_raw, dict):
+            return None
+
+        fingerprints: dict[str, FileFingerprint] = {}
+        for name, value in files_raw.items():
+            if not isinstance(name, str) or not isinstance(value, list) or len(value) != 2:
+                return None
+            size, mtime_ns = value
+            if not isinstance(size, int) or not isinstance(mtime_ns, int):
+                return None
+            fingerprints[name] = (size, mtime_ns)
+
+        latest = raw.get("latest")
+        if latest is not None and not isinstance(latest, int):
+            return None
+
+        info_name = raw.get("info_name")
+        info_extractor_version = raw.get("info_extractor_version")
+        return CachedSlotData(
+            fingerprints=fingerprints,
+            latest=latest,
+            info_resolved=bool(raw.get("info_resolved", False)),
+            info_name=info_name if isinstance(info_name, str) else None,
+            info_source=str(raw.get("info_source", "fallback")),
+            info_extractor_version=info_extractor_version if isinstance(info_extractor_version, int) else None,
+        )
+
+
+_scan_cache = ScanCache()
+
+
+def get_scan_cache() -> ScanCache:
+    return _scan_cache
@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import logging
+import os
+from pathlib import Path
+import time
+
+from PySide6.QtCore import QObject, QThread, QTimer, Signal
+
+from core.saves.content_hash import ContentHashService, ContentHashWorker, get_content_hash_service
+from core.saves.integrity import RollIntegrityService, RollIntegrityWorker, get_roll_integrity_service
+from core.saves.models import SaveScanResult
+from core.saves.save_watcher import SaveWatcherService
+from core.saves.scan_worker import SaveScanWorker
+from core.saves.scanner_service import SaveScannerService
+from core.worldname.mapping_store import WorldNameMappingStore, get_mapping_store
+
+
+ScanFinishedCallback = Callable[[SaveScanResult], None]
+ScanFailedCallback = Callable[[str], None]
+BackgroundWorker = ContentHashWorker | RollIntegrityWorker
+BackgroundWorkerFactory = Callable[[SaveScanResult], BackgroundWorker]
+
+
+@dataclass(slots=True)
+class _ScanSubscriber:
+    on_finished: ScanFinishedCallback
+    on_failed: ScanFailedCallback | None
+
+
+@dataclass(slots=True)
+class _PendingScan:
+    root: Path
+    thread: QThread
+    worker: SaveScanWorker
+    relay: _ScanRelay
+    subscribers: list[_ScanSubscriber] = field(default_factory=list)
+    followup_subscribers: list[_ScanSubscriber] = field(default_factory=list)
+    superseded: bool = False
+
+
+class _ScanRelay(QObject):
+    finished = Signal(str, object)
+    failed = Signal(str, str)
+
+    def __init__(self, key: str, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._key = key
+
+    def on_finished(self, result: object) -> None:
+        self.finished.emit(self._key, result)
+
+    def on_failed(self, message: str) -> None:
+        self.failed.emit(self._key, message)
+
+
+class _BackgroundJob(QObject):
+    def __init__(
+        self,
+        name: str,
+        worker_factory: BackgroundWorkerFactory,
+        logger: logging.Logger,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._name = name
+        self._worker_factory = worker_factory
+        self._logger = logger
+        self._thread: QThread | None = None
+        self._worker: BackgroundWorker | None = None
+        self._queued: SaveScanResult | None = None
+
+    def schedule(self, result: SaveScanResult) -> None:
+        if self._thread is not None:
+            self._queued = result
+            return
+
+        thread = QThread(self)
+        worker = self._worker_factory(result)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.failed.connect(self._on_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_closed)
+
+        self._thread = thread
+        self._worker = worker
+        thread.start()
+
+    def cancel(self) -> None:
+        self._queued = None
+        if self._worker is not None:
+            self._worker.cancel()
+
+    def _on_failed(self, message: str) -> None:
+        self._logger.warning("Background %s failed: %s", self._name, message)
+
+    def _on_closed(self) -> None:
+        self._thread = None
+        self._worker = None
+        if self._queued is not None:
+            queued = self._queued
+            self._queued = None
+            self.schedule(queued)
+
+
+class SaveScanCoordinator(QObject):
+    scan_started = Signal(object)
+    slot_changed = Signal(object, int, object)
+    result_changed = Signal(object)
+
+    DEFAULT_MAX_AGE_SECONDS = 5.0
+
+    def __init__(
+        self,
+        scanner: SaveScannerService | None = None,
+        logger: logging.Logger | None = None,
+        hash_service: ContentHashService | None = None,
+        integrity_service: RollIntegrityService | None = None,
+        mapping_store: WorldNameMappingStore | None = None,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._logger = logger or logging.getLogger("shroudkeeper.scanner.coordinator")
+        self._scanner = scanner or SaveScannerService(logger=logger)
+        self._hash_service = hash_service or get_content_hash_service()
+        self._integrity_service = integrity_service or get_roll_integrity_service()
+        self._pending: dict[str, _PendingScan] = {}
+        self._results: dict[str, tuple[float, SaveScanResult]] = {}
+        self._background_jobs = [
+            _BackgroundJob(
+                "content hashing",
+                lambda result: ContentHashWorker(service=self._hash_service, result=result),
+                self._logger,
+                parent=self,
+            ),
+            _BackgroundJob(
+                "integrity check",
+                lambda result: RollIntegrityWorker(service=self._integrity_service, result=result),
+                self._logger,
+                parent=self,
+            ),
+        ]
+
+        self._watcher = SaveWatcherService(scanner=self._scanner, logger=logger, parent=self)
+        self._watcher.slot_changed.connect(self._on_watched_slot_changed)
+        self._watcher.result_changed.connect(self._on_watched_result_changed)
+
+        self._mapping_store = mapping_store or get_mapping_store()
+        self._mapping_store.mapping_changed.connect(self._on_mapping_changed)
+        self._mapping_store.start_watching()
+
+    def request_scan(
+        self,
+        root: Path,
+        on_finished: ScanFinishedCallback,
+        on_failed: ScanFailedCallback | None = None,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ) -> None:
+        key = self._root_key(root)
+        subscriber = _ScanSubscriber(on_finished=on_finished, on_failed=on_failed)
+
+        cached = self._results.get(key)
+        if cached is not None and max_age_seconds > 0 and time.monotonic() - cached[0] <= max_age_seconds:
+            result = cached[1]
+            QTimer.singleShot(0, lambda: on_finished(result))
+            return
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            if max_age_seconds > 0:
+                pending.subscribers.append(subscriber)
+            else:
+                pending.followup_subscribers.append(subscriber)
+            return
+
+        self._start_scan(key, Path(root), [subscriber])
+
+    def cached_result(self, root: Path) -> SaveScanResult | None:
+        cached = self._results.get(self._root_key(root))
+        return cached[1] if cached is not None else None
+
+    def is_scanning(self, root: Path | None = None) -> bool:
+        if root is None:
+            return len(self._pending) > 0
+        return self._root_key(root) in self._pending
+
+    def invalidate(self, root: Path | None = None) -> None:
+        if root is None:
+            self._results.clear()
+            self._supersede_pending()
+            return
+        key = self._root_key(root)
+        self._results.pop(key, None)
+        self._supersede_pending(key)
+
+    def cancel_all(self) -> None:
+        for pending in self._pending.values():
+            pending.worker.cancel()
+            pending.followup_subscribers = []
+        for job in self._background_jobs:
+            job.cancel()
+        self._watcher.stop()
+
+    def _start_scan(self, key: str, root: Path, subscribers: list[_ScanSubscriber]) -> None:
+        thread = QThread(self)
+        worker = SaveScanWorker(scanner=self._scanner, root=root)
+        relay = _ScanRelay(key, parent=self)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.finished.connect(relay.on_finished)
+        worker.failed.connect(relay.on_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(relay.deleteLater)
+        relay.finished.connect(self._on_scan_finished)
+        relay.failed.connect(self._on_scan_failed)
+
+        self._pending[key] = _PendingScan(
+            root=root,
+            thread=thread,
+            worker=worker,
+            relay=relay,
+            subscribers=subscribers,
+        )
+        self._logger.info("Coordinated scan started: %s (subscribers=%s)", root, len(subscribers))
+        self.scan_started.emit(root)
+        thread.start()
+
+    def _on_scan_finished(self, key: str, result: object) -> None:
+        pending = self._pending.get(key)
+        if pending is not None and pending.superseded and not pending.worker.is_cancelled():
+            self._logger.info("Coordinated scan superseded, scanning again: %s", pending.root)
+            pending.followup_subscribers = pending.subscribers + pending.followup_subscribers
+            pending.subscribers = []
+
+        pending = self._finish_pending(key)
+        if pending is None or pending.superseded or pending.worker.is_cancelled():
+            return
+        if not isinstance(result, SaveScanResult):
+            return
+
+        self._results[key] = (time.monotonic(), result)
+        self._watcher.watch(result)
+        self._schedule_background_jobs(result)
+
+        for subscriber in pending.subscribers:
+            subscriber.on_finished(result)
+
+    def _on_scan_failed(self, key: str, message: str) -> None:
+        pending = self._finish_pending(key)
+        if pending is None:
+            return
+
+        self._results.pop(key, None)
+        for subscriber in pending.subscribers:
+            if subscriber.on_failed is not None:
+                subscriber.on_failed(message)
+
+    def _supersede_pending(self, key: str | None = None) -> None:
+        for pending_key, pending in self._pending.items():
+            if key is None or pending_key == key:
+                pending.superseded = True
+
+    def _finish_pending(self, key: str) -> _PendingScan | None:
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return None
+
+        if pending.followup_subscribers:
+            self._start_scan(key, pending.root, pending.followup_subscribers)
+            pending.followup_subscribers = []
+        return pending
+
+    def _on_watched_slot_changed(self, slot_number: int, slot: object) -> None:
+        root = self._watcher.watched_root()
+        if root is not None:
+            self.slot_changed.emit(root, slot_number, slot)
+
+    def _on_watched_result_changed(self, result: object) -> None:
+        if not isinstance(result, SaveScanResult):
+            return
+
+        now = time.monotonic()
+        for key, (_stored_at, cached) in list(self._results.items()):
+            if cached.root == result.root:
+                self._results[key] = (now, result)
+        self.result_changed.emit(result)
+        self._schedule_background_jobs(result)
+
+    def _on_mapping_changed(self) -> None:
+        self._logger.info("World name mapping changed - refreshing watched slots")
+        watched_root = self._watcher.watched_root()
+        for key, (_stored_at, cached) in list(self._results.items()):
+            if watched_root is None or cached.root != watched_root:
+                del self._results[key]
+        self._supersede_pending()
+
+        if watched_root is not None:
+            self._watcher.rescan_now()
+
+    def _schedule_background_jobs(self, result: SaveScanResult) -> None:
+        for job in self._background_jobs:
+            job.schedule(result)
+
+    @staticmethod
+    def _root_key(root: Path) -> str:
+        try:
+            normalized = Path(root).expanduser().resolve()
+        except OSError:
+            normalized = Path(root)
+        return os.path.normcase(str(normalized))
@@ -12,15 +12,27 @@ class SaveScanWorker(QObject):
     finished = Signal(object)
     failed = Signal(str)
 
-    def __init__(self, scanner: SaveScannerService, root: Path) -> None:
+    def __init__(self, scanner: SaveScannerService, root: Path, incremental: bool = True) -> None:
         super().__init__()
         self._scanner = scanner
         self._root = root
+        self._incremental = incremental
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
 
     @Slot()
     def run(self) -> None:
         try:
-            result: SaveScanResult = self._scanner.scan_singleplayer(self._root)
+            result: SaveScanResult = self._scanner.scan_singleplayer(
+                self._root,
+                incremental=self._incremental,
+                is_cancelled=lambda: self._cancelled,
+            )
             self.finished.emit(result)
         except Exception as exc:
             self.failed.emit(str(exc))
@@ -1,35 +1,77 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import Executor
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 
 from core.saves.constants import MAX_ROLLS
 from core.saves.index_service import IndexFileService
 from core.saves.models import SaveRoll, SaveScanResult, SaveSlot
+from core.saves.scan_cache import CachedSlotData, FileFingerprint, ScanCache, get_scan_cache
 from core.saves.world_slots import WORLD_SLOT_MAPPING
-from core.worldname.mapping import get_world_name_with_source
+from core.worldname.extractor import EXTRACTOR_VERSION, SearchBudget
+from core.worldname.mapping import (
+    ResolvedWorldName,
+    get_mapped_world_name,
+    resolve_info_world_name,
+    resolve_info_world_names,
+    resolve_world_name,
+)
 from i18n.i18n import tr
 
 
+DirListing = dict[str, os.DirEntry[str]]
+
+
 class SaveScannerService:
-    def __init__(self, logger: logging.Logger | None = None, index_service: IndexFileService | None = None) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        index_service: IndexFileService | None = None,
+        single_pass: bool = True,
+        scan_cache: ScanCache | None = None,
+        world_name_budget: SearchBudget | None = None,
+        world_name_executor: Executor | None = None,
+        world_name_workers: int | None = None,
+    ) -> None:
         self._logger = logger or logging.getLogger("shroudkeeper.scanner")
         self._index_service = index_service or IndexFileService(self._logger)
+        self._single_pass = single_pass
+        self._scan_cache = scan_cache or get_scan_cache()
+        self._world_name_budget = world_name_budget
+        self._world_name_executor = world_name_executor
+        self._world_name_workers = world_name_workers
 
-    def scan_singleplayer(self, root: Path) -> SaveScanResult:
+    def scan_singleplayer(
+        self,
+        root: Path,
+        incremental: bool = False,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> SaveScanResult:
         safe_root = root.expanduser().resolve()
-        effective_root = self._resolve_effective_root(safe_root)
+        listing: DirListing | None = None
+        if self._single_pass or incremental:
+            effective_root, listing = self._resolve_effective_root_listing(safe_root)
+            root_exists = listing is not None
+            listing = listing if listing is not None else {}
+        else:
+            effective_root = self._resolve_effective_root(safe_root)
+            root_exists = effective_root.exists()
         self._logger.info("Scanning Singleplayer root: %s", effective_root)
 
         warnings: list[str] = []
         slots: list[SaveSlot] = []
         missing_latest_slots: list[int] = []
-        world_name_cache: dict[str, tuple[str | None, str]] = {}
+        world_name_cache: dict[str, ResolvedWorldName] = {}
 
-        if not effective_root.exists():
+        if not root_exists:
             warnings.append(tr("dashboard.warning.root_missing", root=effective_root))
             self._logger.warning("Save root does not exist")
+        else:
+            self._prefetch_world_names(effective_root, listing, world_name_cache, incremental, is_cancelled)
 
         for slot_number in range(1, 11):
             world_id = WORLD_SLOT_MAPPING[slot_number]
@@ -39,8 +81,13 @@ class SaveScannerService:
                 world_id,
                 warnings,
                 world_name_cache,
+                listing,
+                incremental,
+                is_cancelled,
             )
             if slot is None:
+                if incremental:
+                    self._scan_cache.drop_slot(effective_root, world_id)
                 continue
             slots.append(slot)
             if has_missing_latest:
@@ -54,6 +101,9 @@ class SaveScannerService:
                 )
             )
 
+        if incremental:
+            self._scan_cache.save()
+
         self._logger.info("Scan finished: slots=%s warnings=%s", len(slots), len(warnings))
         return SaveScanResult(root=effective_root, slots=slots, warnings=warnings)
 
@@ -69,6 +119,22 @@ class SaveScannerService:
 
         return root
 
+    def _resolve_effective_root_listing(self, root: Path) -> tuple[Path, DirListing | None]:
+        root_listing = self._list_directory(root)
+        root_has_saves = root_listing is not None and self._listing_contains_expected_save_files(root_listing)
+
+        remote_entry = root_listing.get(os.path.normcase("remote")) if root_listing is not None else None
+        if remote_entry is None or not self._entry_is_dir(remote_entry) or root_has_saves:
+            return root, root_listing
+
+        remote_root = (root / "remote").resolve()
+        remote_listing = self._list_directory(remote_root)
+        if remote_listing is not None and self._listing_contains_expected_save_files(remote_listing):
+            self._logger.info(tr("dashboard.scan.root_switched_remote", root=remote_root))
+            return remote_root, remote_listing
+
+        return root, root_listing
+
     def _contains_expected_save_files(self, root: Path) -> bool:
         if not root.exists() or not root.is_dir():
             return False
@@ -78,13 +144,48 @@ class SaveScannerService:
                 return True
         return False
 
+    def _listing_contains_expected_save_files(self, listing: DirListing) -> bool:
+        for world_hex in WORLD_SLOT_MAPPING.values():
+            for name in (world_hex, f"{world_hex}-index"):
+                entry = listing.get(os.path.normcase(name))
+                if entry is not None and self._entry_is_file(entry):
+                    return True
+        return False
+
+    @staticmethod
+    def _list_directory(path: Path) -> DirListing | None:
+        try:
+            with os.scandir(path) as iterator:
+                return {os.path.normcase(entry.name): entry for entry in iterator}
+        except FileNotFoundError:
+            return None
+        except OSError:
+            return {}
+
+    @staticmethod
+    def _entry_is_file(entry: os.DirEntry[str]) -> bool:
+        try:
+            return entry.is_file()
+        except OSError:
+            return False
+
+    @staticmethod
+    def _entry_is_dir(entry: os.DirEntry[str]) -> bool:
+        try:
+            return entry.is_dir()
+        except OSError:
+            return False
+
     def _scan_slot(
         self,
         root: Path,
         slot_number: int,
         world_id: str,
         warnings: list[str],
-        world_name_cache: dict[str, tuple[str | None, str]],
+        world_name_cache: dict[str, ResolvedWorldName],
+        listing: DirListing | None = None,
+        incremental: bool = False,
+        is_cancelled: Callable[[], bool] | None = None,
     ) -> tuple[SaveSlot | None, bool]:
         root_dir = root
 
@@ -93,7 +194,11 @@ class SaveScannerService:
         for roll_index in range(MAX_ROLLS):
             file_name = world_id if roll_index == 0 else f"{world_id}-{roll_index}"
             roll_path = root_dir / file_name
-            exists = roll_path.exists() and roll_path.is_file()
+            entry = listing.get(os.path.normcase(file_name)) if listing is not None else None
+            if listing is None:
+                exists = roll_path.exists() and roll_path.is_file()
+            else:
+                exists = entry is not None and self._entry_is_file(entry)
 
             size_bytes: int | None = None
             modified_at: datetime | None = None
@@ -101,7 +206,7 @@ class SaveScannerService:
             if exists:
                 existing_rolls_count += 1
                 try:
-                    stat_info = roll_path.stat()
+                    stat_info = entry.stat() if entry is not None else roll_path.stat()
                     size_bytes = int(stat_info.st_size)
                     modified_at = datetime.fromtimestamp(stat_info.st_mtime)
                 except OSError:
@@ -122,7 +227,18 @@ class SaveScannerService:
             return None, False
 
         index_path = root_dir / f"{world_id}-index"
-        latest = self._index_service.read_latest(index_path)
+        if incremental and listing is not None:
+            latest, resolved_name = self._resolve_slot_metadata_incremental(
+                root_dir,
+                world_id,
+                index_path,
+                listing,
+                world_name_cache,
+                is_cancelled,
+            )
+            world_name_cache[world_id.lower()] = resolved_name
+        else:
+            latest = self._read_latest(index_path, listing)
         has_missing_latest = latest is None
 
         display_name, world_name_source = self._load_slot_name(
@@ -130,6 +246,8 @@ class SaveScannerService:
             world_id,
             slot_number,
             world_name_cache,
+            listing,
+            is_cancelled,
         )
         last_modified = self._compute_last_modified(rolls)
         total_size = sum(roll.size_bytes or 0 for roll in rolls if roll.exists)
@@ -158,25 +276,150 @@ class SaveScannerService:
             has_missing_latest,
         )
 
+    def _read_latest(self, index_path: Path, listing: DirListing | None) -> int | None:
+        if listing is not None and os.path.normcase(index_path.name) not in listing:
+            return None
+        return self._index_service.read_latest(index_path)
+
+    def _resolve_slot_metadata_incremental(
+        self,
+        root: Path,
+        world_id: str,
+        index_path: Path,
+        listing: DirListing,
+        world_name_cache: dict[str, ResolvedWorldName],
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> tuple[int | None, ResolvedWorldName]:
+        fingerprints = self._slot_fingerprints(listing, world_id)
+        cached = self._scan_cache.get_slot(root, world_id)
+        if cached is None or cached.fingerprints != fingerprints:
+            cached = CachedSlotData(fingerprints=fingerprints, latest=self._read_latest(index_path, listing))
+            self._scan_cache.put_slot(root, world_id, cached)
+        else:
+            self._logger.info("Slot files unchanged - using cached data: world=%s", world_id)
+
+        prefix = world_id.lower()
+        mapped_name = get_mapped_world_name(prefix)
+        if mapped_name:
+            return cached.latest, ResolvedWorldName(world_name=mapped_name, source="mapping")
+
+        if not self._cached_info_is_fresh(cached):
+            resolved = world_name_cache.get(prefix) or resolve_info_world_name(
+                prefix=prefix,
+                root_dir=root,
+                file_names=self._listing_file_names(listing),
+                budget=self._world_name_budget,
+                is_cancelled=is_cancelled,
+            )
+            if not resolved.is_deterministic:
+                return cached.latest, resolved
+            cached.info_name = resolved.world_name
+            cached.info_source = resolved.source
+            cached.info_resolved = True
+            cached.info_extractor_version = EXTRACTOR_VERSION
+            self._scan_cache.put_slot(root, world_id, cached)
+
+        return cached.latest, ResolvedWorldName(world_name=cached.info_name, source=cached.info_source)
+
+    def _prefetch_world_names(
+        self,
+        root: Path,
+        listing: DirListing | None,
+        world_name_cache: dict[str, ResolvedWorldName],
+        incremental: bool,
+        is_cancelled: Callable[[], bool] | None,
+    ) -> None:
+        prefixes: list[str] = []
+        for world_id in WORLD_SLOT_MAPPING.values():
+            prefix = world_id.lower()
+            if not self._slot_has_rolls(root, world_id, listing):
+                continue
+            if incremental and listing is not None and self._cached_info_is_current(root, world_id, listing):
+                continue
+            if get_mapped_world_name(prefix):
+                continue
+            prefixes.append(prefix)
+
+        if not prefixes:
+            return
+
+        world_name_cache.update(
+            resolve_info_world_names(
+                prefixes,
+                root,
+                file_names=self._listing_file_names(listing) if listing is not None else None,
+                executor=self._world_name_executor,
+                max_workers=self._world_name_workers,
+                budget=self._world_name_budget,
+                is_cancelled=is_cancelled,
+            )
+        )
+
+    def _slot_has_rolls(self, root: Path, world_id: str, listing: DirListing | None) -> bool:
+        for roll_index in range(MAX_ROLLS):
+            file_name = world_id if roll_index == 0 else f"{world_id}-{roll_index}"
+            if listing is None:
+                if (root / file_name).is_file():
+                    return True
+                continue
+            entry = listing.get(os.path.normcase(file_name))
+            if entry is not None and self._entry_is_file(entry):
+                return True
+        return False
+
+    def _cached_info_is_current(self, root: Path, world_id: str, listing: DirListing) -> bool:
+        cached = self._scan_cache.get_slot(root, world_id)
+        if cached is None or not self._cached_info_is_fresh(cached):
+            return False
+        return cached.fingerprints == self._slot_fingerprints(listing, world_id)
+
+    @staticmethod
+    def _cached_info_is_fresh(cached: CachedSlotData) -> bool:
+        return cached.info_resolved and cached.info_extractor_version == EXTRACTOR_VERSION
+
+    def _slot_fingerprints(self, listing: DirListing, world_id: str) -> dict[str, FileFingerprint]:
+        prefix = os.path.normcase(world_id)
+        fingerprints: dict[str, FileFingerprint] = {}
+        for name, entry in listing.items():
+            if not name.startswith(prefix) or not self._entry_is_file(entry):
+                continue
+            try:
+                stat_info = entry.stat()
+            except OSError:
+                continue
+            fingerprints[name] = (int(stat_info.st_size), int(stat_info.st_mtime_ns))
+        return fingerprints
+
     def _load_slot_name(
         self,
         root: Path,
         world_id: str,
         slot_number: int,
-        world_name_cache: dict[str, tuple[str | None, str]],
+        world_name_cache: dict[str, ResolvedWorldName],
+        listing: DirListing | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
     ) -> tuple[str, str]:
         prefix = world_id.lower()
         cached = world_name_cache.get(prefix)
         if cached is None:
-            cached = get_world_name_with_source(prefix=prefix, root_dir=root)
+            file_names = self._listing_file_names(listing) if listing is not None else None
+            cached = resolve_world_name(
+                prefix=prefix,
+                root_dir=root,
+                file_names=file_names,
+                budget=self._world_name_budget,
+                is_cancelled=is_cancelled,
+            )
             world_name_cache[prefix] = cached
 
-        world_name, source = cached
-        if world_name:
-            return world_name, source
+        if cached.world_name:
+            return cached.world_name, cached.source
 
         return tr("dashboard.world_slot_name", slot=slot_number), "fallback"
 
+    def _listing_file_names(self, listing: DirListing) -> set[str]:
+        return {name for name, entry in listing.items() if self._entry_is_file(entry)}
+
     @staticmethod
     def _compute_last_modified(rolls: list[SaveRoll]) -> datetime | None:
         values = [roll.modified_at for roll in rolls if roll.modified_at is not None]
@@ -20,3 +20,5 @@ class ServerScanResult:
     latest: int | None
     rolls: list[ServerRoll]
     warnings: list[str]
+    world_name: str | None = None
+    world_name_source: str = "fallback"
@@ -6,7 +6,7 @@ import logging
 from PySide6.QtCore import QObject, Signal
 
 from core.profiles.models import Profile
-from core.remote.client_factory import create_client
+from core.remote.connection_manager import get_connection_manager
 from core.server.server_world_service import ServerWorldService
 
 
@@ -29,10 +29,15 @@ class ServerScanWorker(QObject):
             self.failed.emit(str(error))
 
     async def _run_scan(self):
-        client = create_client(profile=self._profile, password=self._password, logger=self._logger)
-
-        success, message = await client.test_connection()
-        if not success:
-            raise RuntimeError(message)
-
-        return await self._service.scan_server_world(client=client, remote_root=self._profile.remote_path)
+        client = get_connection_manager().client(profile=self._profile, password=self._password, logger=self._logger)
+
+        async with client.session():
+            success, message = await client.test_connection()
+            if not success:
+                raise RuntimeError(message)
+
+            return await self._service.scan_server_world(
+                client=client,
+                remote_root=self._profile.remote_path,
+                profile_id=self._profile.id,
+            )
@@ -4,8 +4,15 @@ import json
 import logging
 from pathlib import PurePosixPath
 
-from core.remote.client_base import RemoteClient
+from core.remote.client_base import RemoteClient, RemoteEntry
 from core.server.server_models import ServerRoll, ServerScanResult
+from core.worldname.extractor import search_world_name_in_bytes
+from core.worldname.index_files import select_info_file_name
+from core.worldname.mapping import (
+    get_mapped_world_name,
+    lookup_server_info_world_name,
+    record_server_info_world_name,
+)
 from i18n.i18n import tr
 
 
@@ -13,11 +20,17 @@ class ServerWorldService:
     SERVER_WORLD_ID = "3ad85aea"
     MAX_ROLLS = 10
     INDEX_MAX_BYTES = 64 * 1024
+    INFO_PREFIX_BYTES = 512 * 1024
 
     def __init__(self, logger: logging.Logger | None = None) -> None:
         self._logger = logger or logging.getLogger("shroudkeeper.server")
 
-    async def scan_server_world(self, client: RemoteClient, remote_root: str) -> ServerScanResult:
+    async def scan_server_world(
+        self,
+        client: RemoteClient,
+        remote_root: str,
+        profile_id: int | None = None,
+    ) -> ServerScanResult:
         normalized_root = self._normalize_remote_path(remote_root)
 
         list_success, list_message, entries = await client.list_dir_details(normalized_root)
@@ -56,14 +69,67 @@ class ServerWorldService:
                 if latest is None:
                     warnings.append(tr("server.warning.index_invalid"))
 
+        world_name, world_name_source = await self._resolve_world_name(
+            client,
+            normalized_root,
+            entry_by_name,
+            profile_id,
+        )
+
         return ServerScanResult(
             world_id_hex=self.SERVER_WORLD_ID,
             remote_root=normalized_root,
             latest=latest,
             rolls=rolls,
             warnings=warnings,
+            world_name=world_name,
+            world_name_source=world_name_source,
         )
 
+    async def _resolve_world_name(
+        self,
+        client: RemoteClient,
+        remote_root: str,
+        entry_by_name: dict[str, RemoteEntry],
+        profile_id: int | None,
+    ) -> tuple[str | None, str]:
+        prefix = self.SERVER_WORLD_ID.lower()
+        mapped_name = get_mapped_world_name(prefix)
+        if mapped_name:
+            return mapped_name, "mapping"
+
+        file_names = {name for name, entry in entry_by_name.items() if entry.is_file}
+        info_latest: int | None = None
+        info_index_name = f"{prefix}_info-index"
+        if info_index_name in file_names:
+            read_success, _read_message, payload = await client.read_file_bytes(
+                self._join_remote_path(remote_root, info_index_name),
+                max_bytes=self.INDEX_MAX_BYTES,
+            )
+            if read_success and payload is not None:
+                info_latest = self._parse_info_latest(payload)
+
+        info_name = select_info_file_name(prefix, file_names, info_latest)
+        if info_name is None:
+            return None, "fallback"
+
+        entry = entry_by_name[info_name]
+        info_path = self._join_remote_path(remote_root, info_name)
+        modified_at = entry.modified_at.isoformat() if entry.modified_at is not None else None
+        if profile_id is not None and entry.size_bytes is not None and modified_at is not None:
+            cached = lookup_server_info_world_name(profile_id, info_path, entry.size_bytes, modified_at)
+            if cached is not None:
+                return cached
+
+        read_success, read_message, payload = await client.read_file_prefix(info_path, self.INFO_PREFIX_BYTES)
+        if not read_success or payload is None:
+            self._logger.warning("Server world info read failed: %s", read_message)
+            return None, "fallback"
+
+        truncated = entry.size_bytes is None or len(payload) < entry.size_bytes
+        search = search_world_name_in_bytes(payload, truncated=truncated)
+        return record_server_info_world_name(profile_id, info_path, entry.size_bytes, modified_at, search)
+
     def _parse_latest(self, payload: bytes) -> int | None:
         try:
             decoded = payload.decode("utf-8")
@@ -80,6 +146,17 @@ class ServerWorldService:
 
         return None
 
+    def _parse_info_latest(self, payload: bytes) -> int | None:
+        try:
+            loaded = json.loads(payload.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return None
+
+        latest = loaded.get("latest") if isinstance(loaded, dict) else None
+        if isinstance(latest, int) and latest >= 0:
+            return latest
+        return None
+
     def _normalize_remote_path(self, remote_path: str) -> str:
         normalized = "/" + "/".join(part for part in remote_path.strip().split("/") if part)
         return str(PurePosixPath(normalized if normalized != "" else "/"))
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import threading
+
+
+class SpawnProcessPool:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._workers = 0
+
+    @property
+    def is_warm(self) -> bool:
+        return self._executor is not None
+
+    def executor(self, workers: int) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is not None and self._workers >= workers:
+                return self._executor
+            previous = self._executor
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            self._executor = executor
+            self._workers = workers
+        if previous is not None:
+            previous.shutdown(wait=False)
+        return executor
+
+    def discard(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self._workers = 0
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._workers = 0
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 import os
 from pathlib import Path
 import shutil
@@ -8,7 +9,10 @@ import uuid
 from core.saves.index_service import IndexFileService
 
 
-def copy_file_atomic(src: Path, dst: Path) -> int:
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def copy_file_atomic(src: Path, dst: Path, progress: Callable[[int], None] | None = None) -> int:
     source = Path(src)
     target = Path(dst)
 
@@ -19,7 +23,10 @@ def copy_file_atomic(src: Path, dst: Path) -> int:
     temp_path = target.with_name(f"{target.name}.tmp-{uuid.uuid4().hex}")
 
     try:
-        shutil.copy2(source, temp_path)
+        if progress is None:
+            shutil.copy2(source, temp_path)
+        else:
+            _copy_with_progress(source, temp_path, progress)
         os.replace(temp_path, target)
     finally:
         if temp_path.exists():
@@ -31,6 +38,17 @@ def copy_file_atomic(src: Path, dst: Path) -> int:
     return int(target.stat().st_size)
 
 
+def _copy_with_progress(source: Path, target: Path, progress: Callable[[int], None]) -> None:
+    with source.open("rb") as reader, target.open("wb") as writer:
+        while True:
+            chunk = reader.read(COPY_CHUNK_SIZE)
+            if chunk == b"":
+                break
+            writer.write(chunk)
+            progress(len(chunk))
+    shutil.copystat(source, target)
+
+
 def ensure_dir(path: Path) -> None:
     Path(path).mkdir(parents=True, exist_ok=True)
 
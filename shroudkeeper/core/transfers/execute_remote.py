@@ -1,18 +1,82 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Coroutine
+from dataclasses import dataclass
 import json
 import os
 from pathlib import Path, PurePosixPath
+from typing import Any, TypeVar
 import uuid
 
-from core.remote.client_base import RemoteClient
+from core.remote.checksums import compute_local_checksum
+from core.remote.client_base import RemoteClient, RemoteEntry
+from core.transfers.partial_transfers import DOWNLOAD, UPLOAD, get_partial_transfer_store
+from core.transfers.transfer_progress import FileTransferProgress, TransferProgress
 
 
-async def upload_local_file(client: RemoteClient, local_path: Path, remote_path_file: str) -> int:
-    success, message, copied = await client.upload_file(Path(local_path), remote_path_file)
-    if not success:
-        raise RuntimeError(message)
-    return copied
+RESUME_ATTEMPTS = 3
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class RemoteCopyResult:
+    bytes_copied: int = 0
+    files_copied: int = 0
+    bytes_skipped: int = 0
+    files_skipped: int = 0
+
+    def add(self, size_bytes: int, skipped: bool) -> None:
+        if skipped:
+            self.bytes_skipped += size_bytes
+            self.files_skipped += 1
+        else:
+            self.bytes_copied += size_bytes
+            self.files_copied += 1
+
+
+async def upload_local_file(
+    client: RemoteClient,
+    local_path: Path,
+    remote_path_file: str,
+    profile_id: int | None = None,
+    progress: TransferProgress | None = None,
+) -> int:
+    source = Path(local_path)
+    if progress is not None:
+        progress.add_total(_local_size(source))
+    return await _upload_file(client, source, remote_path_file, profile_id, progress)
+
+
+async def upload_local_files(
+    client: RemoteClient,
+    files: list[tuple[Path, str]],
+    profile_id: int | None = None,
+    skip_identical: bool = False,
+    progress: TransferProgress | None = None,
+) -> RemoteCopyResult:
+    if progress is not None:
+        progress.add_total(sum(_local_size(Path(local_path)) for local_path, _ in files))
+    entries = await _remote_entries(client, [remote_path for _, remote_path in files]) if skip_identical else {}
+    outcomes = await _run_concurrently(
+        [
+            _upload_unless_identical(
+                client,
+                Path(local_path),
+                remote_path,
+                profile_id,
+                skip_identical,
+                entries.get(remote_path),
+                progress,
+            )
+            for local_path, remote_path in files
+        ]
+    )
+    result = RemoteCopyResult()
+    for size_bytes, skipped in outcomes:
+        result.add(size_bytes, skipped)
+    return result
 
 
 async def upload_index_latest(client: RemoteClient, remote_index_path: str, latest: int) -> int:
@@ -23,25 +87,284 @@ async def upload_index_latest(client: RemoteClient, remote_index_path: str, late
     return copied
 
 
-async def download_remote_file_to_local_atomic(client: RemoteClient, remote_path_file: str, local_path: Path) -> int:
-    target = Path(local_path)
-    target.parent.mkdir(parents=True, exist_ok=True)
+async def download_remote_file_to_local_atomic(
+    client: RemoteClient,
+    remote_path_file: str,
+    local_path: Path,
+    profile_id: int | None = None,
+    progress: TransferProgress | None = None,
+) -> int:
+    needs_entries = profile_id is not None or progress is not None
+    entries = await _remote_entries(client, [remote_path_file]) if needs_entries else {}
+    entry = entries.get(remote_path_file)
+    if progress is not None and entry is not None and entry.size_bytes is not None:
+        progress.add_total(entry.size_bytes)
+    return await _download_remote_file(client, remote_path_file, Path(local_path), profile_id, entry, progress)
 
-    temp_path = target.with_name(f"{target.name}.tmp-{uuid.uuid4().hex}")
 
-    try:
-        success, message, copied = await client.download_file(remote_path_file, temp_path)
+async def download_remote_files_to_local_atomic(
+    client: RemoteClient,
+    files: list[tuple[str, Path]],
+    profile_id: int | None = None,
+    skip_identical: bool = False,
+    progress: TransferProgress | None = None,
+) -> RemoteCopyResult:
+    needs_entries = profile_id is not None or skip_identical or progress is not None
+    entries = await _remote_entries(client, [remote_path for remote_path, _ in files]) if needs_entries else {}
+    if progress is not None:
+        progress.add_total(sum(entry.size_bytes or 0 for entry in entries.values()))
+    outcomes = await _run_concurrently(
+        [
+            _download_unless_identical(
+                client,
+                remote_path,
+                Path(local_path),
+                profile_id,
+                skip_identical,
+                entries.get(remote_path),
+                progress,
+            )
+            for remote_path, local_path in files
+        ]
+    )
+    result = RemoteCopyResult()
+    for size_bytes, skipped in outcomes:
+        result.add(size_bytes, skipped)
+    return result
+
+
+def join_remote(root: str, file_name: str) -> str:
+    return str(PurePosixPath(root) / file_name)
+
+
+async def _upload_file(
+    client: RemoteClient,
+    source: Path,
+    remote_path_file: str,
+    profile_id: int | None,
+    progress: TransferProgress | None,
+) -> int:
+    callback = progress.advance if progress is not None else None
+    if profile_id is None:
+        success, message, copied = await client.upload_file(source, remote_path_file, progress=callback)
         if not success:
             raise RuntimeError(message)
-        os.replace(temp_path, target)
         return copied
+
+    store = get_partial_transfer_store()
+    stat = source.stat()
+    signature = f"{stat.st_size}:{stat.st_mtime_ns}"
+    offset = 0
+    partial = store.get(profile_id, UPLOAD, remote_path_file, source)
+    if partial is not None and partial.source_signature == signature and partial.remote_signature is not None:
+        entry = await _remote_entry(client, remote_path_file)
+        if entry is not None and _remote_signature(entry) == partial.remote_signature:
+            offset = _resumable_size(entry, stat.st_size)
+    store.save(profile_id, UPLOAD, remote_path_file, source, stat.st_size, signature)
+    file_progress = FileTransferProgress(progress) if progress is not None else None
+    callback = file_progress.advance if file_progress is not None else None
+    first_start = start = await client.upload_resume_offset(offset)
+    if progress is not None:
+        progress.exclude(first_start)
+
+    message = ""
+    for _attempt in range(RESUME_ATTEMPTS):
+        if file_progress is not None:
+            file_progress.settle(start - first_start)
+        success, message, copied = await client.upload_file(source, remote_path_file, offset, callback)
+        if success:
+            store.discard(profile_id, UPLOAD, remote_path_file, source)
+            return copied
+        entry = await _remote_entry(client, remote_path_file)
+        next_offset = _resumable_size(entry, stat.st_size)
+        if next_offset > 0 and entry is not None:
+            store.save(
+                profile_id,
+                UPLOAD,
+                remote_path_file,
+                source,
+                stat.st_size,
+                signature,
+                remote_signature=_remote_signature(entry),
+            )
+        if next_offset <= offset:
+            break
+        offset = next_offset
+        start = await client.upload_resume_offset(offset)
+    raise RuntimeError(message)
+
+
+async def _upload_unless_identical(
+    client: RemoteClient,
+    local_path: Path,
+    remote_path_file: str,
+    profile_id: int | None,
+    skip_identical: bool,
+    entry: RemoteEntry | None,
+    progress: TransferProgress | None,
+) -> tuple[int, bool]:
+    if skip_identical and await _is_identical(client, local_path, remote_path_file, entry, await client.preserves_mtime()):
+        size_bytes = local_path.stat().st_size
+        if progress is not None:
+            progress.exclude(size_bytes)
+        return size_bytes, True
+    return await _upload_file(client, local_path, remote_path_file, profile_id, progress), False
+
+
+async def _download_unless_identical(
+    client: RemoteClient,
+    remote_path_file: str,
+    local_path: Path,
+    profile_id: int | None,
+    skip_identical: bool,
+    entry: RemoteEntry | None,
+    progress: TransferProgress | None,
+) -> tuple[int, bool]:
+    if skip_identical and await _is_identical(client, local_path, remote_path_file, entry, True):
+        size_bytes = local_path.stat().st_size
+        if progress is not None:
+            progress.exclude(size_bytes)
+        return size_bytes, True
+    return await _download_remote_file(client, remote_path_file, local_path, profile_id, entry, progress), False
+
+
+async def _is_identical(
+    client: RemoteClient,
+    local_path: Path,
+    remote_path_file: str,
+    entry: RemoteEntry | None,
+    trust_mtime: bool,
+) -> bool:
+    if entry is None or not entry.is_file or entry.size_bytes is None:
+        return False
+    try:
+        local_stat = local_path.stat()
+    except OSError:
+        return False
+    if local_stat.st_size != entry.size_bytes:
+        return False
+
+    success, _message, remote_checksum = await client.checksum(remote_path_file)
+    if success and remote_checksum is not None:
+        local_digest = compute_local_checksum(local_path, remote_checksum.algorithm)
+        if local_digest is not None:
+            return local_digest == remote_checksum.digest
+
+    if not trust_mtime or entry.modified_at is None:
+        return False
+    return int(entry.modified_at.timestamp()) == int(local_stat.st_mtime)
+
+
+async def _download_remote_file(
+    client: RemoteClient,
+    remote_path_file: str,
+    target: Path,
+    profile_id: int | None,
+    entry: RemoteEntry | None,
+    progress: TransferProgress | None,
+) -> int:
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    store = get_partial_transfer_store()
+    signature = _remote_signature(entry) if profile_id is not None and entry is not None else None
+    temp_path: Path | None = None
+    offset = 0
+    if profile_id is not None and signature is not None and entry is not None and entry.size_bytes is not None:
+        partial = store.get(profile_id, DOWNLOAD, remote_path_file, target)
+        if partial is not None:
+            partial_size = _local_size(partial.temp_path) if partial.temp_path is not None else 0
+            if partial.source_signature == signature and 0 < partial_size < entry.size_bytes:
+                temp_path = partial.temp_path
+                offset = partial_size
+            else:
+                store.abandon(profile_id, DOWNLOAD, remote_path_file, target)
+        if temp_path is None:
+            temp_path = _new_temp_path(target)
+        store.save(profile_id, DOWNLOAD, remote_path_file, target, entry.size_bytes, signature, temp_path)
+    else:
+        signature = None
+        temp_path = _new_temp_path(target)
+
+    file_progress = FileTransferProgress(progress) if progress is not None else None
+    callback = file_progress.advance if file_progress is not None else None
+    first_offset = offset
+    if progress is not None:
+        progress.exclude(offset)
+
+    try:
+        message = ""
+        for _attempt in range(RESUME_ATTEMPTS):
+            if file_progress is not None:
+                file_progress.settle(offset - first_offset)
+            success, message, copied = await client.download_file(remote_path_file, temp_path, offset, callback)
+            if success:
+                os.replace(temp_path, target)
+                if entry is not None and entry.modified_at is not None:
+                    _set_local_mtime(target, entry.modified_at.timestamp())
+                if profile_id is not None and signature is not None:
+                    store.discard(profile_id, DOWNLOAD, remote_path_file, target)
+                return copied
+            if signature is None:
+                break
+            next_offset = _local_size(temp_path)
+            if next_offset <= offset:
+                break
+            offset = next_offset
+        raise RuntimeError(message)
     finally:
-        if temp_path.exists():
+        if signature is None and temp_path.exists():
             try:
                 temp_path.unlink()
             except OSError:
                 pass
 
 
-def join_remote(root: str, file_name: str) -> str:
-    return str(PurePosixPath(root) / file_name)
+async def _remote_entries(client: RemoteClient, remote_paths: list[str]) -> dict[str, RemoteEntry]:
+    success, _message, entries = await client.stat_many(remote_paths)
+    if not success:
+        return {}
+    return {remote_path: entry for remote_path, entry in entries.items() if entry is not None and entry.is_file}
+
+
+async def _remote_entry(client: RemoteClient, remote_path_file: str) -> RemoteEntry | None:
+    return (await _remote_entries(client, [remote_path_file])).get(remote_path_file)
+
+
+def _resumable_size(entry: RemoteEntry | None, source_size: int) -> int:
+    if entry is None or entry.size_bytes is None or entry.size_bytes >= source_size:
+        return 0
+    return entry.size_bytes
+
+
+def _remote_signature(entry: RemoteEntry) -> str | None:
+    if entry.size_bytes is None:
+        return None
+    modified_at = entry.modified_at.isoformat() if entry.modified_at is not None else ""
+    return f"{entry.size_bytes}:{modified_at}"
+
+
+def _set_local_mtime(path: Path, mtime: float) -> None:
+    try:
+        os.utime(path, (mtime, mtime))
+    except OSError:
+        pass
+
+
+def _new_temp_path(target: Path) -> Path:
+    return target.with_name(f"{target.name}.tmp-{uuid.uuid4().hex}")
+
+
+def _local_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+async def _run_concurrently(operations: list[Coroutine[Any, Any, T]]) -> list[T]:
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(operation) for operation in operations]
+    except ExceptionGroup as errors:
+        raise errors.exceptions[0] from None
+    return [task.result() for task in tasks]
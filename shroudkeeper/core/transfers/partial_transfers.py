@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+
+from storage.db import DatabaseManager
+from storage.repositories import PartialTransferEntry, PartialTransferRepository
+
+
+UPLOAD = "upload"
+DOWNLOAD = "download"
+
+
+@dataclass(slots=True)
+class PartialTransfer:
+    temp_path: Path | None
+    size_bytes: int
+    source_signature: str
+    remote_signature: str | None = None
+
+
+class PartialTransferStore:
+    def __init__(self, db_path: Path | None = None, logger: logging.Logger | None = None) -> None:
+        self._db_path = db_path
+        self._logger = logger or logging.getLogger("shroudkeeper.transfers.partial")
+        self._lock = threading.Lock()
+        self._database: DatabaseManager | None = None
+        self._repository: PartialTransferRepository | None = None
+
+    def get(self, profile_id: int, direction: str, remote_path: str, local_path: Path) -> PartialTransfer | None:
+        with self._lock:
+            repository = self._ensure_repository()
+            if repository is None:
+                return None
+            try:
+                entry = repository.get(profile_id, direction, remote_path, str(local_path))
+            except sqlite3.Error as error:
+                self._logger.warning("Partial transfer lookup failed: %s", error)
+                return None
+
+        if entry is None:
+            return None
+        return PartialTransfer(
+            temp_path=Path(entry.temp_path) if entry.temp_path is not None else None,
+            size_bytes=entry.size_bytes,
+            source_signature=entry.source_signature,
+            remote_signature=entry.remote_signature,
+        )
+
+    def save(
+        self,
+        profile_id: int,
+        direction: str,
+        remote_path: str,
+        local_path: Path,
+        size_bytes: int,
+        source_signature: str,
+        temp_path: Path | None = None,
+        remote_signature: str | None = None,
+    ) -> None:
+        entry = PartialTransferEntry(
+            profile_id=profile_id,
+            direction=direction,
+            remote_path=remote_path,
+            local_path=str(local_path),
+            temp_path=str(temp_path) if temp_path is not None else None,
+            size_bytes=size_bytes,
+            source_signature=source_signature,
+            updated_at=datetime.now(timezone.utc).isoformat(),
+            remote_signature=remote_signature,
+        )
+        with self._lock:
+            repository = self._ensure_repository()
+            if repository is None:
+                return
+            try:
+                repository.upsert(entry)
+            except sqlite3.Error as error:
+                self._logger.warning("Partial transfer update failed: %s", error)
+
+    def discard(self, profile_id: int, direction: str, remote_path: str, local_path: Path) -> None:
+        with self._lock:
+            repository = self._ensure_repository()
+            if repository is None:
+                return
+            try:
+                repository.delete(profile_id, direction, remote_path, str(local_path))
+            except sqlite3.Error as error:
+                self._logger.warning("Partial transfer cleanup failed: %s", error)
+
+    def abandon(self, profile_id: int, direction: str, remote_path: str, local_path: Path) -> None:
+        partial = self.get(profile_id, direction, remote_path, local_path)
+        if partial is not None and partial.temp_path is not None:
+            self._remove_temp_file(partial.temp_path)
+        self.discard(profile_id, direction, remote_path, local_path)
+
+    def abandon_profile(self, profile_id: int) -> None:
+        with self._lock:
+            repository = self._ensure_repository()
+            if repository is None:
+                return
+            try:
+                entries = repository.list_for_profile(profile_id)
+                repository.delete_for_profile(profile_id)
+            except sqlite3.Error as error:
+                self._logger.warning("Partial transfer cleanup failed: %s", error)
+                return
+
+        for entry in entries:
+            if entry.temp_path is not None:
+                self._remove_temp_file(Path(entry.temp_path))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._database is not None:
+                self._database.close()
+            self._database = None
+            self._repository = None
+
+    def _remove_temp_file(self, temp_path: Path) -> None:
+        try:
+            temp_path.unlink(missing_ok=True)
+        except OSError as error:
+            self._logger.warning("Could not remove partial transfer file %s: %s", temp_path, error)
+
+    def _ensure_repository(self) -> PartialTransferRepository | None:
+        if self._repository is not None:
+            return self._repository
+
+        database = DatabaseManager(db_path=self._db_path, logger=self._logger, check_same_thread=False)
+        try:
+            connection = database.connect()
+        except (OSError, sqlite3.Error) as error:
+            self._logger.warning("Partial transfer store unavailable: %s", error)
+            database.close()
+            return None
+
+        self._database = database
+        self._repository = PartialTransferRepository(connection)
+        return self._repository
+
+
+_partial_transfer_store = PartialTransferStore()
+
+
+def get_partial_transfer_store() -> PartialTransferStore:
+    return _partial_transfer_store
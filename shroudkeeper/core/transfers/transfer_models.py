@@ -23,6 +23,7 @@ class TransferPlan:
     roll_index: int
     files: list[tuple[str, str]]
     index_target_path: Path | str
+    skip_identical: bool = False
 
 
 @dataclass(slots=True)
@@ -31,3 +32,7 @@ class TransferResult:
     message: str
     bytes_copied: int
     files_copied: int
+    bytes_skipped: int = 0
+    files_skipped: int = 0
+    elapsed_seconds: float = 0.0
+    bytes_per_second: float = 0.0
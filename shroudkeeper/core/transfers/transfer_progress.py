@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import threading
+import time
+
+
+DEFAULT_PROGRESS_INTERVAL_SECONDS = 0.25
+
+
+@dataclass(slots=True)
+class TransferProgressSnapshot:
+    bytes_done: int
+    bytes_total: int
+    elapsed_seconds: float
+
+    @property
+    def fraction(self) -> float:
+        if self.bytes_total <= 0:
+            return 1.0
+        return min(1.0, self.bytes_done / self.bytes_total)
+
+    @property
+    def bytes_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bytes_done / self.elapsed_seconds
+
+    @property
+    def eta_seconds(self) -> float | None:
+        speed = self.bytes_per_second
+        if speed <= 0:
+            return None
+        return max(0.0, self.bytes_total - self.bytes_done) / speed
+
+
+class TransferProgress:
+    def __init__(
+        self,
+        on_update: Callable[[TransferProgressSnapshot], None] | None = None,
+        interval_seconds: float = DEFAULT_PROGRESS_INTERVAL_SECONDS,
+    ) -> None:
+        self._on_update = on_update
+        self._interval_seconds = interval_seconds
+        self._lock = threading.Lock()
+        self._bytes_done = 0
+        self._bytes_total = 0
+        self._started = time.perf_counter()
+        self._last_update = 0.0
+
+    def add_total(self, size_bytes: int) -> None:
+        with self._lock:
+            self._bytes_total += max(0, size_bytes)
+
+    def exclude(self, size_bytes: int) -> None:
+        with self._lock:
+            self._bytes_total = max(0, self._bytes_total - max(0, size_bytes))
+
+    def advance(self, size_bytes: int) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            self._bytes_done += size_bytes
+            if now - self._last_update < self._interval_seconds:
+                return
+            self._last_update = now
+            snapshot = self._snapshot(now)
+        if self._on_update is not None:
+            self._on_update(snapshot)
+
+    def snapshot(self) -> TransferProgressSnapshot:
+        with self._lock:
+            return self._snapshot(time.perf_counter())
+
+    def _snapshot(self, now: float) -> TransferProgressSnapshot:
+        return TransferProgressSnapshot(
+            bytes_done=self._bytes_done,
+            bytes_total=self._bytes_total,
+            elapsed_seconds=now - self._started,
+        )
+
+
+class FileTransferProgress:
+    def __init__(self, progress: TransferProgress) -> None:
+        self._progress = progress
+        self._bytes_counted = 0
+
+    def advance(self, size_bytes: int) -> None:
+        self._bytes_counted += size_bytes
+        self._progress.advance(size_bytes)
+
+    def settle(self, committed_bytes: int) -> None:
+        # A retry resends everything past the committed offset, so bytes reported beyond it are taken back.
+        delta = committed_bytes - self._bytes_counted
+        if delta:
+            self._bytes_counted = committed_bytes
+            self._progress.advance(delta)
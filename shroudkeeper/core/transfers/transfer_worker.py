@@ -7,13 +7,25 @@ from pathlib import Path
 from PySide6.QtCore import QObject, Signal
 
 from core.profiles.models import Profile
-from core.remote.client_factory import create_client
+from core.remote.connection_manager import get_connection_manager
+from core.saves.integrity import RollIntegrityService, get_roll_integrity_service
 from core.transfers.execute_local import copy_file_atomic, write_local_latest_index
-from core.transfers.execute_remote import download_remote_file_to_local_atomic, join_remote, upload_index_latest, upload_local_file
+from core.transfers.execute_remote import (
+    RemoteCopyResult,
+    download_remote_files_to_local_atomic,
+    join_remote,
+    upload_index_latest,
+    upload_local_files,
+)
 from core.transfers.transfer_models import TransferDirection, TransferPlan, TransferResult
+from core.transfers.transfer_progress import TransferProgress, TransferProgressSnapshot
 from i18n.i18n import tr
 
 
+COPY_PROGRESS_START = 10
+COPY_PROGRESS_END = 90
+
+
 class TransferWorker(QObject):
     progress = Signal(int, str)
     success = Signal(object)
@@ -25,12 +37,14 @@ class TransferWorker(QObject):
         logger: logging.Logger,
         profile: Profile | None = None,
         password: str | None = None,
+        integrity_service: RollIntegrityService | None = None,
     ) -> None:
         super().__init__()
         self._plan = plan
         self._logger = logger
         self._profile = profile
         self._password = password
+        self._integrity_service = integrity_service or get_roll_integrity_service()
 
     def run(self) -> None:
         try:
@@ -42,74 +56,143 @@ class TransferWorker(QObject):
     async def _execute(self) -> TransferResult:
         self.progress.emit(5, tr("transfers.progress.preparing"))
 
+        if self._plan.direction in (TransferDirection.SP_TO_SP, TransferDirection.SP_TO_SERVER):
+            self._ensure_source_rolls_valid(Path(self._plan.source_root))
+
         if self._plan.direction == TransferDirection.SP_TO_SP:
             return await self._execute_sp_to_sp()
 
         if self._profile is None or self._password is None or self._password.strip() == "":
             raise RuntimeError(tr("transfers.error.no_active_profile"))
 
-        client = create_client(profile=self._profile, password=self._password, logger=self._logger)
+        client = get_connection_manager().client(profile=self._profile, password=self._password, logger=self._logger)
 
         if self._plan.direction == TransferDirection.SP_TO_SERVER:
-            return await self._execute_sp_to_server(client)
+            async with client.session():
+                return await self._execute_sp_to_server(client)
 
         if self._plan.direction == TransferDirection.SERVER_TO_SP:
-            return await self._execute_server_to_sp(client)
+            async with client.session():
+                return await self._execute_server_to_sp(client)
 
         raise RuntimeError(tr("transfers.error.invalid_direction"))
 
+    def _ensure_source_rolls_valid(self, source_root: Path) -> None:
+        invalid = self._integrity_service.find_invalid(source_root / src_name for src_name, _dst_name in self._plan.files)
+        if not invalid:
+            return
+
+        for result in invalid:
+            self._logger.error("Roll failed integrity check: %s (%s)", result.path.name, result.message)
+        first = invalid[0]
+        raise RuntimeError(tr("transfers.error.corrupt_roll", file=first.path.name, reason=first.message))
+
     async def _execute_sp_to_sp(self) -> TransferResult:
         source_root = Path(self._plan.source_root)
         target_root = Path(self._plan.target_root)
 
         bytes_copied = 0
         files_copied = 0
+        progress = self._create_progress()
+        progress.add_total(sum((source_root / src_name).stat().st_size for src_name, _dst_name in self._plan.files))
 
+        self.progress.emit(COPY_PROGRESS_START, tr("transfers.progress.copying"))
         for src_name, dst_name in self._plan.files:
-            self.progress.emit(40, tr("transfers.progress.copying"))
-            bytes_copied += copy_file_atomic(source_root / src_name, target_root / dst_name)
+            bytes_copied += copy_file_atomic(source_root / src_name, target_root / dst_name, progress.advance)
             files_copied += 1
 
-        self.progress.emit(85, tr("transfers.progress.writing_index"))
+        self.progress.emit(COPY_PROGRESS_END, tr("transfers.progress.writing_index"))
         write_local_latest_index(Path(self._plan.index_target_path), self._plan.roll_index)
 
         self.progress.emit(100, tr("transfers.progress.done"))
-        return TransferResult(success=True, message="ok", bytes_copied=bytes_copied, files_copied=files_copied)
+        snapshot = progress.snapshot()
+        return TransferResult(
+            success=True,
+            message="ok",
+            bytes_copied=bytes_copied,
+            files_copied=files_copied,
+            elapsed_seconds=snapshot.elapsed_seconds,
+            bytes_per_second=snapshot.bytes_per_second,
+        )
 
     async def _execute_sp_to_server(self, client) -> TransferResult:
         source_root = Path(self._plan.source_root)
         target_root = str(self._plan.target_root)
 
-        bytes_copied = 0
-        files_copied = 0
-
-        for src_name, dst_name in self._plan.files:
-            self.progress.emit(40, tr("transfers.progress.copying"))
-            remote_file = join_remote(target_root, dst_name)
-            bytes_copied += await upload_local_file(client, source_root / src_name, remote_file)
-            files_copied += 1
-
-        self.progress.emit(85, tr("transfers.progress.writing_index"))
+        progress = self._create_progress()
+        self.progress.emit(COPY_PROGRESS_START, tr("transfers.progress.copying"))
+        copied = await upload_local_files(
+            client,
+            [(source_root / src_name, join_remote(target_root, dst_name)) for src_name, dst_name in self._plan.files],
+            profile_id=self._profile.id,
+            skip_identical=self._plan.skip_identical,
+            progress=progress,
+        )
+
+        self.progress.emit(COPY_PROGRESS_END, tr("transfers.progress.writing_index"))
         await upload_index_latest(client, str(self._plan.index_target_path), self._plan.roll_index)
 
         self.progress.emit(100, tr("transfers.progress.done"))
-        return TransferResult(success=True, message="ok", bytes_copied=bytes_copied, files_copied=files_copied)
+        return self._remote_result(copied, progress.snapshot())
 
     async def _execute_server_to_sp(self, client) -> TransferResult:
         source_root = str(self._plan.source_root)
         target_root = Path(self._plan.target_root)
 
-        bytes_copied = 0
-        files_copied = 0
-
-        for src_name, dst_name in self._plan.files:
-            self.progress.emit(40, tr("transfers.progress.copying"))
-            remote_file = join_remote(source_root, src_name)
-            bytes_copied += await download_remote_file_to_local_atomic(client, remote_file, target_root / dst_name)
-            files_copied += 1
-
-        self.progress.emit(85, tr("transfers.progress.writing_index"))
+        progress = self._create_progress()
+        self.progress.emit(COPY_PROGRESS_START, tr("transfers.progress.copying"))
+        copied = await download_remote_files_to_local_atomic(
+            client,
+            [(join_remote(source_root, src_name), target_root / dst_name) for src_name, dst_name in self._plan.files],
+            profile_id=self._profile.id,
+            skip_identical=self._plan.skip_identical,
+            progress=progress,
+        )
+
+        self.progress.emit(COPY_PROGRESS_END, tr("transfers.progress.writing_index"))
         write_local_latest_index(Path(self._plan.index_target_path), self._plan.roll_index)
 
         self.progress.emit(100, tr("transfers.progress.done"))
-        return TransferResult(success=True, message="ok", bytes_copied=bytes_copied, files_copied=files_copied)
+        return self._remote_result(copied, progress.snapshot())
+
+    def _create_progress(self) -> TransferProgress:
+        return TransferProgress(on_update=self._emit_copy_progress)
+
+    def _emit_copy_progress(self, snapshot: TransferProgressSnapshot) -> None:
+        span = COPY_PROGRESS_END - COPY_PROGRESS_START
+        eta_seconds = snapshot.eta_seconds
+        self.progress.emit(
+            COPY_PROGRESS_START + int(span * snapshot.fraction),
+            tr(
+                "transfers.progress.copying_detail",
+                percent=int(snapshot.fraction * 100),
+                speed=f"{snapshot.bytes_per_second / 1_000_000:.1f}",
+                eta=self._format_eta(eta_seconds) if eta_seconds is not None else tr("common.not_available"),
+            ),
+        )
+
+    @staticmethod
+    def _format_eta(seconds: float) -> str:
+        minutes, secs = divmod(int(round(seconds)), 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours > 0:
+            return f"{hours}:{minutes:02d}:{secs:02d}"
+        return f"{minutes}:{secs:02d}"
+
+    def _remote_result(self, copied: RemoteCopyResult, snapshot: TransferProgressSnapshot) -> TransferResult:
+        if copied.files_skipped > 0:
+            self._logger.info(
+                "Skipped %s identical file(s), %s bytes not transferred",
+                copied.files_skipped,
+                copied.bytes_skipped,
+            )
+        return TransferResult(
+            success=True,
+            message="ok",
+            bytes_copied=copied.bytes_copied,
+            files_copied=copied.files_copied,
+            bytes_skipped=copied.bytes_skipped,
+            files_skipped=copied.files_skipped,
+            elapsed_seconds=snapshot.elapsed_seconds,
+            bytes_per_second=snapshot.bytes_per_second,
+        )
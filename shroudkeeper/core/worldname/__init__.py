@@ -1,3 +1,10 @@
-from core.worldname.mapping import get_world_name, get_world_name_with_source
+from importlib import import_module
 
 __all__ = ["get_world_name", "get_world_name_with_source"]
+
+
+def __getattr__(name: str):
+    # Loaded lazily so spawned search workers importing core.worldname.extractor skip Qt and storage.
+    if name in __all__:
+        return getattr(import_module("core.worldname.mapping"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,72 +1,161 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from contextlib import closing
+from dataclasses import dataclass
+from enum import Enum
 import math
+import mmap
 from pathlib import Path
+import time
+
+import zstandard
 
 from core.worldname.scoring import is_plausible_world_name, score_candidate
-from core.worldname.strings import (
-    dedupe_case_insensitive,
-    extract_ascii_strings,
-    extract_utf8_strings,
-    sanitize_string,
-)
-from core.worldname.zstd_scan import find_magic_offsets, try_decompress_from_offset
+from core.worldname.strings import CandidateStrings
+from core.worldname.zstd_scan import FrameSource, iter_frame_payloads
+
+
+EXTRACTOR_VERSION = 3
+
+DEFAULT_MAX_OUTPUT_SIZE = 8 * 1024 * 1024
+
+
+class SearchStop(str, Enum):
+    COMPLETE = "complete"
+    CONFIDENT = "confident"
+    BYTE_BUDGET = "byte_budget"
+    TIME_BUDGET = "time_budget"
+    CANCELLED = "cancelled"
+
+
+@dataclass(slots=True)
+class SearchBudget:
+    max_bytes: int | None = None
+    max_ms: float | None = None
+    confidence: float | None = None
+
+
+@dataclass(slots=True)
+class WorldNameSearchResult:
+    best_guess: str | None
+    candidates: list[str]
+    stop: SearchStop
+
+    @property
+    def is_deterministic(self) -> bool:
+        return self.stop not in (SearchStop.TIME_BUDGET, SearchStop.CANCELLED)
 
 
 def extract_world_name_from_info_file(
     path: Path,
-    max_output_size: int = 8 * 1024 * 1024,
+    max_output_size: int = DEFAULT_MAX_OUTPUT_SIZE,
     top_n: int = 5,
+    budget: SearchBudget | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
 ) -> tuple[str | None, list[str]]:
+    result = search_world_name(path, budget, is_cancelled, max_output_size=max_output_size, top_n=top_n)
+    return result.best_guess, result.candidates
+
+
+def search_world_name(
+    path: Path,
+    budget: SearchBudget | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+    max_output_size: int = DEFAULT_MAX_OUTPUT_SIZE,
+    top_n: int = 5,
+) -> WorldNameSearchResult:
     try:
-        raw = path.read_bytes()
-    except Exception:
-        return None, []
-
-    offsets = find_magic_offsets(raw)
-    if not offsets:
-        return None, []
-
-    all_candidates: list[str] = []
-
-    for offset in offsets:
-        payload = try_decompress_from_offset(raw, offset, max_output_size)
-        if payload is None:
-            continue
-
-        ascii_values = extract_ascii_strings(payload, min_len=4)
-        utf8_values = extract_utf8_strings(payload, min_len=4)
-        combined = ascii_values + utf8_values
-
-        for value in combined:
-            cleaned = sanitize_string(value)
-            if cleaned:
-                all_candidates.append(cleaned)
-
-    occurrences_by_key: dict[str, int] = {}
-    for value in all_candidates:
-        key = value.casefold()
-        occurrences_by_key[key] = occurrences_by_key.get(key, 0) + 1
-
-    unique_candidates = dedupe_case_insensitive(all_candidates)
-    plausible = [value for value in unique_candidates if is_plausible_world_name(value)]
-
-    scored = sorted(
-        (
-            (
-                value,
-                score_candidate(value)
-                + min(2.0, math.log2(occurrences_by_key.get(value.casefold(), 1) + 1) * 0.5),
-            )
-            for value in plausible
-        ),
-        key=lambda item: item[1],
-        reverse=True,
+        with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _search_frames(mapped, budget, is_cancelled, max_output_size, top_n, keep_truncated=False)
+    except (OSError, ValueError):
+        return WorldNameSearchResult(best_guess=None, candidates=[], stop=SearchStop.COMPLETE)
+
+
+def search_world_name_in_bytes(
+    data: bytes,
+    budget: SearchBudget | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+    max_output_size: int = DEFAULT_MAX_OUTPUT_SIZE,
+    top_n: int = 5,
+    truncated: bool = False,
+) -> WorldNameSearchResult:
+    return _search_frames(data, budget, is_cancelled, max_output_size, top_n, keep_truncated=truncated)
+
+
+def _search_frames(
+    data: FrameSource,
+    budget: SearchBudget | None,
+    is_cancelled: Callable[[], bool] | None,
+    max_output_size: int,
+    top_n: int,
+    keep_truncated: bool,
+) -> WorldNameSearchResult:
+    budget = budget or SearchBudget()
+    deadline = time.monotonic() + budget.max_ms / 1000.0 if budget.max_ms is not None else None
+    candidates = CandidateStrings(min_len=4)
+    base_scores: dict[str, float | None] = {}
+    decompressor = zstandard.ZstdDecompressor()
+    consumed = 0
+    stop = SearchStop.COMPLETE
+
+    if is_cancelled is not None and is_cancelled():
+        return WorldNameSearchResult(best_guess=None, candidates=[], stop=SearchStop.CANCELLED)
+
+    payloads = iter_frame_payloads(
+        data,
+        max_output_size,
+        decompressor=decompressor,
+        max_total_output=budget.max_bytes,
+        keep_truncated=keep_truncated,
     )
+    with closing(payloads):
+        for payload in payloads:
+            candidates.feed(payload)
+            consumed += len(payload)
+
+            if budget.confidence is not None and _has_clear_winner(
+                _rank_candidates(candidates, base_scores),
+                budget.confidence,
+            ):
+                stop = SearchStop.CONFIDENT
+                break
+            if is_cancelled is not None and is_cancelled():
+                stop = SearchStop.CANCELLED
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                stop = SearchStop.TIME_BUDGET
+                break
 
+    if stop == SearchStop.COMPLETE and budget.max_bytes is not None and consumed >= budget.max_bytes:
+        stop = SearchStop.BYTE_BUDGET
+
+    scored = _rank_candidates(candidates, base_scores)
     if not scored:
-        return None, []
+        return WorldNameSearchResult(best_guess=None, candidates=[], stop=stop)
 
     top = [value for value, _score in scored[: max(1, top_n)]]
-    best_guess = top[0] if top else None
-    return best_guess, top
+    return WorldNameSearchResult(best_guess=top[0], candidates=top, stop=stop)
+
+
+def _rank_candidates(
+    candidates: CandidateStrings,
+    base_scores: dict[str, float | None],
+) -> list[tuple[str, float]]:
+    scored: list[tuple[str, float]] = []
+    for value, count in candidates.items():
+        if value not in base_scores:
+            base_scores[value] = score_candidate(value) if is_plausible_world_name(value) else None
+        base_score = base_scores[value]
+        if base_score is not None:
+            scored.append((value, base_score + min(2.0, math.log2(count + 1) * 0.5)))
+
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored
+
+
+def _has_clear_winner(scored: list[tuple[str, float]], confidence: float) -> bool:
+    if not scored:
+        return False
+    runner_up = scored[1][1] if len(scored) > 1 else 0.0
+    return scored[0][1] - max(runner_up, 0.0) >= confidence
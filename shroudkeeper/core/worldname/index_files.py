@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Collection
 import json
 import logging
+import os
 from pathlib import Path
 
 
 _logger = logging.getLogger("shroudkeeper.worldname")
 
 
-def resolve_info_file(root_dir: Path, prefix: str) -> Path | None:
+def resolve_info_file(root_dir: Path, prefix: str, file_names: Collection[str] | None = None) -> Path | None:
     index_path = root_dir / f"{prefix}_info-index"
 
-    if index_path.exists() and index_path.is_file():
+    if _is_listed_file(index_path, file_names):
         try:
             payload = json.loads(index_path.read_text(encoding="utf-8"))
             latest = int(payload.get("latest"))
@@ -20,27 +22,46 @@ def resolve_info_file(root_dir: Path, prefix: str) -> Path | None:
             else:
                 candidate = root_dir / f"{prefix}_info-{latest}"
 
-            if candidate.exists() and candidate.is_file():
+            if _is_listed_file(candidate, file_names):
                 return candidate
 
-            return _resolve_without_index(root_dir, prefix)
+            return _resolve_without_index(root_dir, prefix, file_names)
         except Exception:
             _logger.warning("Invalid _info-index for prefix: %s", prefix)
-            return _resolve_without_index(root_dir, prefix)
+            return _resolve_without_index(root_dir, prefix, file_names)
 
-    return _resolve_without_index(root_dir, prefix)
+    return _resolve_without_index(root_dir, prefix, file_names)
 
 
-def _resolve_without_index(root_dir: Path, prefix: str) -> Path | None:
+def select_info_file_name(prefix: str, file_names: Collection[str], latest: int | None = None) -> str | None:
+    if latest is not None:
+        candidate = f"{prefix}_info" if latest == 0 else f"{prefix}_info-{latest}"
+        if candidate in file_names:
+            return candidate
+
+    base = f"{prefix}_info"
+    if base in file_names:
+        return base
+
+    highest: tuple[int, str] | None = None
+    pattern = f"{prefix}_info-"
+    for name in file_names:
+        if not name.startswith(pattern):
+            continue
+        suffix = name[len(pattern) :]
+        if suffix.isdigit() and (highest is None or int(suffix) > highest[0]):
+            highest = (int(suffix), name)
+    return highest[1] if highest is not None else None
+
+
+def _resolve_without_index(root_dir: Path, prefix: str, file_names: Collection[str] | None = None) -> Path | None:
     base = root_dir / f"{prefix}_info"
-    if base.exists() and base.is_file():
+    if _is_listed_file(base, file_names):
         return base
 
     highest: tuple[int, Path] | None = None
     pattern = f"{prefix}_info-"
-    for entry in root_dir.glob(f"{prefix}_info-*"):
-        if not entry.is_file():
-            continue
+    for entry in _iter_info_candidates(root_dir, prefix, file_names):
         name = entry.name
         if not name.startswith(pattern):
             continue
@@ -54,3 +75,17 @@ def _resolve_without_index(root_dir: Path, prefix: str) -> Path | None:
     if highest is None:
         return None
     return highest[1]
+
+
+def _is_listed_file(path: Path, file_names: Collection[str] | None) -> bool:
+    if file_names is None:
+        return path.exists() and path.is_file()
+    return os.path.normcase(path.name) in file_names
+
+
+def _iter_info_candidates(root_dir: Path, prefix: str, file_names: Collection[str] | None) -> list[Path]:
+    if file_names is None:
+        return [entry for entry in root_dir.glob(f"{prefix}_info-*") if entry.is_file()]
+
+    pattern = os.path.normcase(f"{prefix}_info-")
+    return [root_dir / name for name in sorted(file_names) if name.startswith(pattern)]
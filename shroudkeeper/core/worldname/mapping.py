@@ -1,67 +1,282 @@
 from __future__ import annotations
 
-import json
+from collections.abc import Callable, Collection, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+import logging
+import os
 from pathlib import Path
 
-from core.paths import get_app_data_dir
-from core.resources import resource_path
-from core.worldname.extractor import extract_world_name_from_info_file
+from core.worldname.extractor import EXTRACTOR_VERSION, SearchBudget, WorldNameSearchResult, search_world_name
 from core.worldname.index_files import resolve_info_file
+from core.worldname.mapping_store import get_mapping_store
+from core.worldname.name_cache import CachedWorldName, get_world_name_cache
+from core.worldname.search_pool import get_world_name_search_pool, should_use_process_pool
 
 
 _SOURCE_MAPPING = "mapping"
 _SOURCE_INFO = "info"
 _SOURCE_FALLBACK = "fallback"
 
+_logger = logging.getLogger("shroudkeeper.worldname")
+
+
+@dataclass(slots=True)
+class ResolvedWorldName:
+    world_name: str | None
+    source: str
+    is_deterministic: bool = True
+
+    def as_tuple(self) -> tuple[str | None, str]:
+        return self.world_name, self.source
+
+
+@dataclass(slots=True)
+class InfoFileSignature:
+    path: Path
+    size_bytes: int
+    mtime_ns: int
+
 
 def get_world_name(prefix: str, root_dir: Path) -> str | None:
     name, _source = get_world_name_with_source(prefix, root_dir)
     return name
 
 
-def get_world_name_with_source(prefix: str, root_dir: Path) -> tuple[str | None, str]:
-    merged_mapping = _load_merged_mapping()
+def get_world_name_with_source(
+    prefix: str,
+    root_dir: Path,
+    file_names: Collection[str] | None = None,
+    budget: SearchBudget | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> tuple[str | None, str]:
+    return resolve_world_name(prefix, root_dir, file_names, budget, is_cancelled).as_tuple()
+
 
-    mapped_name = merged_mapping.get(prefix)
+def resolve_world_name(
+    prefix: str,
+    root_dir: Path,
+    file_names: Collection[str] | None = None,
+    budget: SearchBudget | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> ResolvedWorldName:
+    mapped_name = get_mapped_world_name(prefix)
     if mapped_name:
-        return mapped_name, _SOURCE_MAPPING
+        return ResolvedWorldName(world_name=mapped_name, source=_SOURCE_MAPPING)
+
+    return resolve_info_world_name(prefix, root_dir, file_names, budget, is_cancelled)
+
+
+def get_mapped_world_name(prefix: str) -> str | None:
+    return get_mapping_store().get(prefix)
+
+
+def get_info_world_name_with_source(
+    prefix: str,
+    root_dir: Path,
+    file_names: Collection[str] | None = None,
+    budget: SearchBudget | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> tuple[str | None, str]:
+    return resolve_info_world_name(prefix, root_dir, file_names, budget, is_cancelled).as_tuple()
+
+
+def resolve_info_world_name(
+    prefix: str,
+    root_dir: Path,
+    file_names: Collection[str] | None = None,
+    budget: SearchBudget | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> ResolvedWorldName:
+    signature = stat_info_file(prefix, root_dir, file_names)
+    if signature is None:
+        return ResolvedWorldName(world_name=None, source=_SOURCE_FALLBACK)
+
+    cached = lookup_info_world_name(signature)
+    if cached is not None:
+        return ResolvedWorldName(world_name=cached[0], source=cached[1])
+
+    return record_info_world_name(signature, search_world_name(signature.path, budget, is_cancelled))
+
+
+def resolve_info_world_names(
+    prefixes: Iterable[str],
+    root_dir: Path,
+    file_names: Collection[str] | None = None,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    budget: SearchBudget | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> dict[str, ResolvedWorldName]:
+    results: dict[str, ResolvedWorldName] = {}
+    misses: dict[str, InfoFileSignature] = {}
+    for prefix in prefixes:
+        signature = stat_info_file(prefix, root_dir, file_names)
+        if signature is None:
+            results[prefix] = ResolvedWorldName(world_name=None, source=_SOURCE_FALLBACK)
+            continue
+
+        cached = lookup_info_world_name(signature)
+        if cached is not None:
+            results[prefix] = ResolvedWorldName(world_name=cached[0], source=cached[1])
+        else:
+            misses[prefix] = signature
 
-    info_path = resolve_info_file(root_dir, prefix)
+    if not misses or (is_cancelled is not None and is_cancelled()):
+        return results
+
+    searches = _search_info_files(misses, executor, max_workers, budget, is_cancelled)
+    for prefix, search in searches.items():
+        results[prefix] = record_info_world_name(misses[prefix], search)
+    return results
+
+
+def stat_info_file(
+    prefix: str,
+    root_dir: Path,
+    file_names: Collection[str] | None = None,
+) -> InfoFileSignature | None:
+    info_path = resolve_info_file(root_dir, prefix, file_names)
     if info_path is None:
-        return None, _SOURCE_FALLBACK
+        return None
+
+    try:
+        stat_result = info_path.stat()
+    except OSError:
+        return None
+    return InfoFileSignature(path=info_path, size_bytes=stat_result.st_size, mtime_ns=stat_result.st_mtime_ns)
+
+
+def lookup_info_world_name(signature: InfoFileSignature) -> tuple[str | None, str] | None:
+    cached = get_world_name_cache().lookup(
+        signature.path,
+        signature.size_bytes,
+        signature.mtime_ns,
+        EXTRACTOR_VERSION,
+    )
+    if cached is None:
+        return None
+    return cached.world_name, cached.source
+
+
+def record_info_world_name(signature: InfoFileSignature, search: WorldNameSearchResult) -> ResolvedWorldName:
+    resolved = ResolvedWorldName(
+        world_name=search.best_guess or None,
+        source=_SOURCE_INFO if search.best_guess else _SOURCE_FALLBACK,
+        is_deterministic=search.is_deterministic,
+    )
+    if not search.is_deterministic:
+        return resolved
+
+    try:
+        unchanged = signature.path.stat()
+    except OSError:
+        return resolved
+
+    if unchanged.st_size == signature.size_bytes and unchanged.st_mtime_ns == signature.mtime_ns:
+        get_world_name_cache().store(
+            signature.path,
+            signature.size_bytes,
+            signature.mtime_ns,
+            EXTRACTOR_VERSION,
+            CachedWorldName(world_name=resolved.world_name, source=resolved.source, candidates=search.candidates),
+        )
+    return resolved
+
+
+def lookup_server_info_world_name(
+    profile_id: int,
+    remote_path: str,
+    size_bytes: int,
+    modified_at: str,
+) -> tuple[str | None, str] | None:
+    cached = get_world_name_cache().lookup_server(profile_id, remote_path, size_bytes, modified_at, EXTRACTOR_VERSION)
+    if cached is None:
+        return None
+    return cached.world_name, cached.source
 
-    best_guess, _top_candidates = extract_world_name_from_info_file(info_path)
-    if best_guess:
-        return best_guess, _SOURCE_INFO
 
-    return None, _SOURCE_FALLBACK
+def record_server_info_world_name(
+    profile_id: int | None,
+    remote_path: str,
+    size_bytes: int | None,
+    modified_at: str | None,
+    search: WorldNameSearchResult,
+) -> tuple[str | None, str]:
+    resolved = (search.best_guess, _SOURCE_INFO) if search.best_guess else (None, _SOURCE_FALLBACK)
+    if profile_id is None or size_bytes is None or modified_at is None or not search.is_deterministic:
+        return resolved
 
+    get_world_name_cache().store_server(
+        profile_id,
+        remote_path,
+        size_bytes,
+        modified_at,
+        EXTRACTOR_VERSION,
+        CachedWorldName(world_name=resolved[0], source=resolved[1], candidates=search.candidates),
+    )
+    return resolved
 
-def _load_merged_mapping() -> dict[str, str]:
-    default_mapping = _load_mapping_file(resource_path("assets/worldname-mapping.json"))
-    user_mapping = _load_mapping_file(get_app_data_dir() / "worldname-mapping.json")
 
-    merged = dict(default_mapping)
-    merged.update(user_mapping)
-    return merged
+def _search_info_files(
+    signatures: dict[str, InfoFileSignature],
+    executor: Executor | None,
+    max_workers: int | None,
+    budget: SearchBudget | None,
+    is_cancelled: Callable[[], bool] | None,
+) -> dict[str, WorldNameSearchResult]:
+    results: dict[str, WorldNameSearchResult] = {}
+    if executor is not None:
+        _search_with_executor(executor, signatures, results, budget, is_cancelled)
+        return results
 
+    workers = min(len(signatures), max(1, max_workers or os.cpu_count() or 1))
+    total_bytes = sum(signature.size_bytes for signature in signatures.values())
+    search_pool = get_world_name_search_pool()
+    if not should_use_process_pool(len(signatures), total_bytes, workers, search_pool.is_warm):
+        _search_inline(signatures, results, budget, is_cancelled)
+        return results
 
-def _load_mapping_file(path: Path) -> dict[str, str]:
+    pool: ProcessPoolExecutor | None = None
     try:
-        if not path.exists() or not path.is_file():
-            return {}
-
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        if not isinstance(payload, dict):
-            return {}
-
-        result: dict[str, str] = {}
-        for key, value in payload.items():
-            if isinstance(key, str) and isinstance(value, str):
-                normalized_key = key.strip().lower()
-                normalized_value = value.strip()
-                if normalized_key and normalized_value:
-                    result[normalized_key] = normalized_value
-        return result
-    except Exception:
-        return {}
+        pool = search_pool.executor(workers)
+        _search_with_executor(pool, signatures, results, budget, is_cancelled)
+    except (BrokenProcessPool, OSError) as error:
+        _logger.warning("World name process pool unavailable, resolving inline: %s", error)
+        if pool is not None:
+            search_pool.discard(pool)
+        remaining = {prefix: signature for prefix, signature in signatures.items() if prefix not in results}
+        _search_inline(remaining, results, budget, is_cancelled)
+    return results
+
+
+def _search_with_executor(
+    executor: Executor,
+    signatures: dict[str, InfoFileSignature],
+    results: dict[str, WorldNameSearchResult],
+    budget: SearchBudget | None,
+    is_cancelled: Callable[[], bool] | None,
+) -> None:
+    futures = {
+        executor.submit(search_world_name, signature.path, budget): prefix
+        for prefix, signature in signatures.items()
+    }
+    for future in as_completed(futures):
+        results[futures[future]] = future.result()
+        if is_cancelled is not None and is_cancelled():
+            for pending in futures:
+                pending.cancel()
+            return
+
+
+def _search_inline(
+    signatures: dict[str, InfoFileSignature],
+    results: dict[str, WorldNameSearchResult],
+    budget: SearchBudget | None,
+    is_cancelled: Callable[[], bool] | None,
+) -> None:
+    for prefix, signature in signatures.items():
+        if is_cancelled is not None and is_cancelled():
+            return
+        results[prefix] = search_world_name(signature.path, budget, is_cancelled)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+import threading
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, Signal
+
+from core.paths import get_app_data_dir
+from core.resources import resource_path
+
+
+MAPPING_FILE_NAME = "worldname-mapping.json"
+
+FileSignature = tuple[int, int]
+
+
+def load_mapping_file(path: Path) -> dict[str, str]:
+    try:
+        if not path.exists() or not path.is_file():
+            return {}
+
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(payload, dict):
+            return {}
+
+        result: dict[str, str] = {}
+        for key, value in payload.items():
+            if isinstance(key, str) and isinstance(value, str):
+                normalized_key = key.strip().lower()
+                normalized_value = value.strip()
+                if normalized_key and normalized_value:
+                    result[normalized_key] = normalized_value
+        return result
+    except Exception:
+        return {}
+
+
+class WorldNameMappingStore(QObject):
+    mapping_changed = Signal()
+
+    def __init__(
+        self,
+        default_path: Path | None = None,
+        user_path: Path | None = None,
+        logger: logging.Logger | None = None,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._default_path = default_path
+        self._user_path = user_path
+        self._logger = logger or logging.getLogger("shroudkeeper.worldname.mapping")
+        self._lock = threading.Lock()
+
+        self._signatures: dict[Path, FileSignature | None] = {}
+        self._mappings: dict[Path, dict[str, str]] = {}
+        self._merged: dict[str, str] = {}
+        self._loaded = False
+        self._fs_watcher: QFileSystemWatcher | None = None
+
+    def get_merged(self) -> dict[str, str]:
+        with self._lock:
+            changed = self._refresh_locked()
+            merged = self._merged
+        if changed:
+            self.mapping_changed.emit()
+        return merged
+
+    def get(self, prefix: str) -> str | None:
+        return self.get_merged().get(prefix)
+
+    def refresh(self) -> bool:
+        with self._lock:
+            changed = self._refresh_locked()
+        if changed:
+            self.mapping_changed.emit()
+        return changed
+
+    def user_mapping_path(self) -> Path:
+        if self._user_path is None:
+            self._user_path = get_app_data_dir() / MAPPING_FILE_NAME
+        return self._user_path
+
+    def start_watching(self) -> None:
+        if self._fs_watcher is not None:
+            return
+
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_path_changed)
+        self._fs_watcher.fileChanged.connect(self._on_path_changed)
+        self._fs_watcher.addPath(str(self.user_mapping_path().parent))
+        self._watch_user_file()
+
+    def _on_path_changed(self, _path: str) -> None:
+        self._watch_user_file()
+        if self.refresh():
+            self._logger.info("World name mapping changed: %s", self.user_mapping_path().name)
+
+    def _watch_user_file(self) -> None:
+        if self._fs_watcher is None:
+            return
+        user_path = str(self.user_mapping_path())
+        if user_path not in self._fs_watcher.files() and self.user_mapping_path().is_file():
+            self._fs_watcher.addPath(user_path)
+
+    def _default_mapping_path(self) -> Path:
+        if self._default_path is None:
+            self._default_path = resource_path(f"assets/{MAPPING_FILE_NAME}")
+        return self._default_path
+
+    def _refresh_locked(self) -> bool:
+        sources = [self._default_mapping_path(), self.user_mapping_path()]
+        reloaded = False
+        for path in sources:
+            signature = self._file_signature(path)
+            if path in self._signatures and self._signatures[path] == signature:
+                continue
+            self._signatures[path] = signature
+            self._mappings[path] = load_mapping_file(path) if signature is not None else {}
+            reloaded = True
+
+        if not reloaded:
+            return False
+
+        merged: dict[str, str] = {}
+        for path in sources:
+            merged.update(self._mappings.get(path, {}))
+
+        changed = self._loaded and merged != self._merged
+        self._merged = merged
+        self._loaded = True
+        return changed
+
+    @staticmethod
+    def _file_signature(path: Path) -> FileSignature | None:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return None
+        return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+_mapping_store = WorldNameMappingStore()
+
+
+def get_mapping_store() -> WorldNameMappingStore:
+    return _mapping_store
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+
+from storage.db import DatabaseManager
+from storage.repositories import (
+    ServerWorldNameCacheEntry,
+    ServerWorldNameCacheRepository,
+    WorldNameCacheEntry,
+    WorldNameCacheRepository,
+)
+
+
+@dataclass(slots=True)
+class CachedWorldName:
+    world_name: str | None
+    source: str
+    candidates: list[str]
+
+
+class WorldNameCache:
+    def __init__(self, db_path: Path | None = None, logger: logging.Logger | None = None) -> None:
+        self._db_path = db_path
+        self._logger = logger or logging.getLogger("shroudkeeper.worldname.cache")
+        self._lock = threading.Lock()
+        self._database: DatabaseManager | None = None
+        self._repository: WorldNameCacheRepository | None = None
+        self._server_repository: ServerWorldNameCacheRepository | None = None
+
+    def lookup(self, info_path: Path, size_bytes: int, mtime_ns: int, extractor_version: int) -> CachedWorldName | None:
+        with self._lock:
+            repository = self._ensure_repository()
+            if repository is None:
+                return None
+            try:
+                entry = repository.get(self._path_key(info_path))
+            except sqlite3.Error as error:
+                self._logger.warning("World name cache lookup failed: %s", error)
+                return None
+
+        if (
+            entry is None
+            or entry.size_bytes != size_bytes
+            or entry.mtime_ns != mtime_ns
+            or entry.extractor_version != extractor_version
+        ):
+            return None
+        return CachedWorldName(world_name=entry.world_name, source=entry.source, candidates=entry.candidates)
+
+    def store(
+        self,
+        info_path: Path,
+        size_bytes: int,
+        mtime_ns: int,
+        extractor_version: int,
+        value: CachedWorldName,
+    ) -> None:
+        entry = WorldNameCacheEntry(
+            path=self._path_key(info_path),
+            size_bytes=size_bytes,
+            mtime_ns=mtime_ns,
+            extractor_version=extractor_version,
+            world_name=value.world_name,
+            source=value.source,
+            candidates=list(value.candidates),
+            resolved_at=datetime.now(timezone.utc).isoformat(),
+        )
+        with self._lock:
+            repository = self._ensure_repository()
+            if repository is None:
+                return
+            try:
+                repository.upsert(entry)
+            except sqlite3.Error as error:
+                self._logger.warning("World name cache update failed: %s", error)
+
+    def lookup_server(
+        self,
+        profile_id: int,
+        remote_path: str,
+        size_bytes: int,
+        modified_at: str,
+        extractor_version: int,
+    ) -> CachedWorldName | None:
+        with self._lock:
+            repository = self._ensure_server_repository()
+            if repository is None:
+                return None
+            try:
+                entry = repository.get(profile_id, remote_path)
+            except sqlite3.Error as error:
+                self._logger.warning("Server world name cache lookup failed: %s", error)
+                return None
+
+        if (
+            entry is None
+            or entry.size_bytes != size_bytes
+            or entry.modified_at != modified_at
+            or entry.extractor_version != extractor_version
+        ):
+            return None
+        return CachedWorldName(world_name=entry.world_name, source=entry.source, candidates=entry.candidates)
+
+    def store_server(
+        self,
+        profile_id: int,
+        remote_path: str,
+        size_bytes: int,
+        modified_at: str,
+        extractor_version: int,
+        value: CachedWorldName,
+    ) -> None:
+        entry = ServerWorldNameCacheEntry(
+            profile_id=profile_id,
+            remote_path=remote_path,
+            size_bytes=size_bytes,
+            modified_at=modified_at,
+            extractor_version=extractor_version,
+            world_name=value.world_name,
+            source=value.source,
+            candidates=list(value.candidates),
+            resolved_at=datetime.now(timezone.utc).isoformat(),
+        )
+        with self._lock:
+            repository = self._ensure_server_repository()
+            if repository is None:
+                return
+            try:
+                repository.upsert(entry)
+            except sqlite3.Error as error:
+                self._logger.warning("Server world name cache update failed: %s", error)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._database is not None:
+                self._database.close()
+            self._database = None
+            self._repository = None
+            self._server_repository = None
+
+    def _ensure_repository(self) -> WorldNameCacheRepository | None:
+        if self._repository is None:
+            connection = self._ensure_connection()
+            if connection is not None:
+                self._repository = WorldNameCacheRepository(connection)
+        return self._repository
+
+    def _ensure_server_repository(self) -> ServerWorldNameCacheRepository | None:
+        if self._server_repository is None:
+            connection = self._ensure_connection()
+            if connection is not None:
+                self._server_repository = ServerWorldNameCacheRepository(connection)
+        return self._server_repository
+
+    def _ensure_connection(self) -> sqlite3.Connection | None:
+        if self._database is not None:
+            return self._database.connect()
+
+        database = DatabaseManager(db_path=self._db_path, logger=self._logger, check_same_thread=False)
+        try:
+            connection = database.connect()
+        except (OSError, sqlite3.Error) as error:
+            self._logger.warning("World name cache unavailable: %s", error)
+            database.close()
+            return None
+
+        self._database = database
+        return connection
+
+    @staticmethod
+    def _path_key(path: Path) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+
+_world_name_cache = WorldNameCache()
+
+
+def get_world_name_cache() -> WorldNameCache:
+    return _world_name_cache
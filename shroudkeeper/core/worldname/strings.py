@@ -1,57 +1,74 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import re
 
 
-_ASCII_PATTERN = re.compile(rb"[\x20-\x7E]{4,}")
+_NON_PRINTABLE_CONTROL = r"\x00-\x1F\x7F-\x9F"
 
 
-def extract_ascii_strings(payload: bytes, min_len: int = 4) -> list[str]:
-    pattern = re.compile(rb"[\x20-\x7E]{" + str(min_len).encode("ascii") + rb",}")
-    results: list[str] = []
-    for match in pattern.finditer(payload):
-        try:
-            value = match.group(0).decode("ascii", errors="ignore")
-        except Exception:
-            continue
-        if value:
-            results.append(value)
-    return results
+@lru_cache(maxsize=8)
+def _ascii_run_pattern(min_len: int) -> re.Pattern[bytes]:
+    return re.compile(rb"[\x20-\x7E]{" + str(max(1, min_len)).encode("ascii") + rb",}")
 
 
-def extract_utf8_strings(payload: bytes, min_len: int = 4) -> list[str]:
-    text = payload.decode("utf-8", errors="ignore")
-    current: list[str] = []
-    results: list[str] = []
+@lru_cache(maxsize=8)
+def _candidate_run_pattern(min_len: int) -> re.Pattern[str]:
+    return re.compile("[^" + _NON_PRINTABLE_CONTROL + "]{" + str(max(1, min_len)) + ",}")
 
-    for char in text:
-        if char.isprintable() and char not in {"\x00", "\x0b", "\x0c"}:
-            current.append(char)
-            continue
 
-        if len(current) >= min_len:
-            results.append("".join(current))
-        current = []
+class CandidateStrings:
+    def __init__(self, min_len: int = 4) -> None:
+        self._min_len = max(1, min_len)
+        self._ascii_pattern = _ascii_run_pattern(self._min_len)
+        self._text_pattern = _candidate_run_pattern(self._min_len)
+        self._values: dict[str, str] = {}
+        self._counts: dict[str, int] = {}
 
-    if len(current) >= min_len:
-        results.append("".join(current))
+    def feed(self, payload: bytes) -> None:
+        for match in self._ascii_pattern.finditer(payload):
+            self._add(match.group(0).decode("ascii"))
 
-    return results
+        text = payload.decode("utf-8", errors="ignore")
+        for match in self._text_pattern.finditer(text):
+            for run in self._printable_runs(match.group(0)):
+                self._add(run)
+
+    def items(self) -> list[tuple[str, int]]:
+        return [(value, self._counts[key]) for key, value in self._values.items()]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _add(self, value: str) -> None:
+        cleaned = sanitize_string(value)
+        if not cleaned:
+            return
+        key = cleaned.casefold()
+        count = self._counts.get(key)
+        if count is None:
+            self._values[key] = cleaned
+            self._counts[key] = 1
+        else:
+            self._counts[key] = count + 1
+
+    def _printable_runs(self, text: str) -> list[str]:
+        if text.isprintable():
+            return [text]
+
+        runs: list[str] = []
+        current: list[str] = []
+        for char in text:
+            if char.isprintable():
+                current.append(char)
+                continue
+            if len(current) >= self._min_len:
+                runs.append("".join(current))
+            current = []
+        if len(current) >= self._min_len:
+            runs.append("".join(current))
+        return runs
 
 
 def sanitize_string(value: str) -> str:
-    text = value.replace("\x00", " ").strip()
-    text = re.sub(r"\s+", " ", text)
-    return text
-
-
-def dedupe_case_insensitive(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for value in values:
-        key = value.casefold()
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(value)
-    return deduped
+    return " ".join(value.replace("\x00", " ").split())
@@ -1,28 +1,100 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+import mmap
+
 import zstandard
 
 _ZSTD_MAGIC = b"\x28\xB5\x2F\xFD"
+_SKIPPABLE_MAGIC_SUFFIX = b"\x2A\x4D\x18"
+_SKIPPABLE_HEADER_SIZE = 8
+
+FRAME_READ_SIZE = 128 * 1024
+
+FrameSource = bytes | bytearray | mmap.mmap
+
+
+def iter_frame_payloads(
+    data: FrameSource,
+    max_output_size: int,
+    decompressor: zstandard.ZstdDecompressor | None = None,
+    read_size: int = FRAME_READ_SIZE,
+    max_total_output: int | None = None,
+    keep_truncated: bool = False,
+) -> Iterator[bytes]:
+    decompressor = decompressor or zstandard.ZstdDecompressor()
+    remaining = max_total_output
+    with memoryview(data) as view:
+        position = _next_frame_offset(data, view, 0)
+        while position is not None and (remaining is None or remaining > 0):
+            limit = max_output_size if remaining is None else min(max_output_size, remaining)
+            payload, frame_end = _decompress_frame(
+                decompressor,
+                view,
+                position,
+                limit,
+                read_size,
+                stop_at_limit=limit == remaining,
+                keep_truncated=keep_truncated,
+            )
+            if payload is None:
+                position = _next_frame_offset(data, view, position + 1)
+                continue
 
+            yield payload
+            if remaining is not None:
+                remaining -= len(payload)
+            position = _next_frame_offset(data, view, frame_end)
 
-def find_magic_offsets(raw: bytes) -> list[int]:
-    offsets: list[int] = []
-    start = 0
-    while True:
-        position = raw.find(_ZSTD_MAGIC, start)
-        if position == -1:
-            break
-        offsets.append(position)
-        start = position + 1
-    return offsets
 
+def _next_frame_offset(data: FrameSource, view: memoryview, start: int) -> int | None:
+    total = len(view)
+    while 0 <= start <= total - len(_ZSTD_MAGIC):
+        head = view[start : start + len(_ZSTD_MAGIC)]
+        if head == _ZSTD_MAGIC:
+            return start
+        if head[0] & 0xF0 == 0x50 and head[1:] == _SKIPPABLE_MAGIC_SUFFIX:
+            if start + _SKIPPABLE_HEADER_SIZE > total:
+                return None
+            start += _SKIPPABLE_HEADER_SIZE + int.from_bytes(view[start + 4 : start + 8], "little")
+            continue
 
-def try_decompress_from_offset(raw: bytes, offset: int, max_output_size: int) -> bytes | None:
-    if offset < 0 or offset >= len(raw):
-        return None
+        position = data.find(_ZSTD_MAGIC, start)
+        return position if position >= 0 else None
+    return None
+
+
+def _decompress_frame(
+    decompressor: zstandard.ZstdDecompressor,
+    view: memoryview,
+    position: int,
+    max_output_size: int,
+    read_size: int,
+    stop_at_limit: bool = False,
+    keep_truncated: bool = False,
+) -> tuple[bytes | None, int]:
+    frame = decompressor.decompressobj()
+    chunks: list[bytes] = []
+    produced = 0
+    offset = position
+    total = len(view)
 
     try:
-        decompressor = zstandard.ZstdDecompressor()
-        return decompressor.decompress(raw[offset:], max_output_size=max_output_size)
-    except Exception:
-        return None
+        while offset < total:
+            end = min(offset + read_size, total)
+            output = frame.decompress(view[offset:end])
+            if produced < max_output_size and output:
+                chunks.append(output[: max_output_size - produced])
+            produced += len(output)
+
+            if frame.eof:
+                return b"".join(chunks), end - len(frame.unused_data)
+            if stop_at_limit and produced >= max_output_size:
+                return b"".join(chunks), end
+            offset = end
+    except zstandard.ZstdError:
+        return None, position
+
+    if keep_truncated and chunks:
+        return b"".join(chunks), total
+    return None, position
@@ -7,19 +7,25 @@ from pathlib import Path
 from core.paths import get_database_path
 from core.resources import get_schema_path
 
-SCHEMA_VERSION = 3
+SCHEMA_VERSION = 12
 
 
 class DatabaseManager:
-    def __init__(self, db_path: Path | None = None, logger: logging.Logger | None = None) -> None:
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        logger: logging.Logger | None = None,
+        check_same_thread: bool = True,
+    ) -> None:
         self._db_path = db_path or get_database_path()
         self._logger = logger or logging.getLogger("shroudkeeper.storage")
+        self._check_same_thread = check_same_thread
         self._connection: sqlite3.Connection | None = None
 
     def connect(self) -> sqlite3.Connection:
         if self._connection is None:
             self._db_path.parent.mkdir(parents=True, exist_ok=True)
-            self._connection = sqlite3.connect(self._db_path)
+            self._connection = sqlite3.connect(self._db_path, check_same_thread=self._check_same_thread)
             self._connection.row_factory = sqlite3.Row
             self._connection.execute("PRAGMA foreign_keys = ON")
             self._initialize_schema_if_needed()
@@ -51,6 +57,42 @@ class DatabaseManager:
         if current_version < 3:
             self._migrate_to_v3()
 
+        current_version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if current_version < 4:
+            self._migrate_to_v4()
+
+        current_version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if current_version < 5:
+            self._migrate_to_v5()
+
+        current_version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if current_version < 6:
+            self._migrate_to_v6()
+
+        current_version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if current_version < 7:
+            self._migrate_to_v7()
+
+        current_version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if current_version < 8:
+            self._migrate_to_v8()
+
+        current_version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if current_version < 9:
+            self._migrate_to_v9()
+
+        current_version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if current_version < 10:
+            self._migrate_to_v10()
+
+        current_version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if current_version < 11:
+            self._migrate_to_v11()
+
+        current_version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if current_version < 12:
+            self._migrate_to_v12()
+
     def _migrate_to_v2(self) -> None:
         if self._connection is None:
             raise RuntimeError("Database connection not initialized")
@@ -167,6 +209,194 @@ class DatabaseManager:
         self._connection.commit()
         self._logger.info("Database schema migration to user_version=3 completed")
 
+    def _migrate_to_v4(self) -> None:
+        if self._connection is None:
+            raise RuntimeError("Database connection not initialized")
+
+        self._logger.info("Migrating database schema to user_version=4")
+
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS content_hashes (
+                path TEXT PRIMARY KEY,
+                size_bytes INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                algorithm TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                hashed_at TEXT NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_content_hashes_digest ON content_hashes(digest);
+            """
+        )
+        self._connection.execute("PRAGMA user_version = 4")
+        self._connection.commit()
+        self._logger.info("Database schema migration to user_version=4 completed")
+
+    def _migrate_to_v5(self) -> None:
+        if self._connection is None:
+            raise RuntimeError("Database connection not initialized")
+
+        self._logger.info("Migrating database schema to user_version=5")
+
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS roll_integrity (
+                path TEXT PRIMARY KEY,
+                size_bytes INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                message TEXT NOT NULL,
+                frames INTEGER NOT NULL,
+                decompressed_bytes INTEGER NOT NULL,
+                checked_at TEXT NOT NULL
+            );
+            """
+        )
+        self._connection.execute("PRAGMA user_version = 5")
+        self._connection.commit()
+        self._logger.info("Database schema migration to user_version=5 completed")
+
+    def _migrate_to_v6(self) -> None:
+        if self._connection is None:
+            raise RuntimeError("Database connection not initialized")
+
+        self._logger.info("Migrating database schema to user_version=6")
+
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS world_name_cache (
+                path TEXT PRIMARY KEY,
+                size_bytes INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                extractor_version INTEGER NOT NULL,
+                world_name TEXT,
+                source TEXT NOT NULL,
+                candidates TEXT NOT NULL,
+                resolved_at TEXT NOT NULL
+            );
+            """
+        )
+        self._connection.execute("PRAGMA user_version = 6")
+        self._connection.commit()
+        self._logger.info("Database schema migration to user_version=6 completed")
+
+    def _migrate_to_v7(self) -> None:
+        if self._connection is None:
+            raise RuntimeError("Database connection not initialized")
+
+        self._logger.info("Migrating database schema to user_version=7")
+
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS server_world_name_cache (
+                profile_id INTEGER NOT NULL,
+                remote_path TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                modified_at TEXT NOT NULL,
+                extractor_version INTEGER NOT NULL,
+                world_name TEXT,
+                source TEXT NOT NULL,
+                candidates TEXT NOT NULL,
+                resolved_at TEXT NOT NULL,
+                PRIMARY KEY (profile_id, remote_path),
+                FOREIGN KEY (profile_id) REFERENCES profiles(id) ON DELETE CASCADE
+            );
+            """
+        )
+        self._connection.execute("PRAGMA user_version = 7")
+        self._connection.commit()
+        self._logger.info("Database schema migration to user_version=7 completed")
+
+    def _migrate_to_v8(self) -> None:
+        if self._connection is None:
+            raise RuntimeError("Database connection not initialized")
+
+        self._logger.info("Migrating database schema to user_version=8")
+
+        self._connection.executescript(
+            """
+            ALTER TABLE profiles ADD COLUMN transfer_concurrency INTEGER NOT NULL DEFAULT 4;
+            """
+        )
+        self._connection.execute("PRAGMA user_version = 8")
+        self._connection.commit()
+        self._logger.info("Database schema migration to user_version=8 completed")
+
+    def _migrate_to_v9(self) -> None:
+        if self._connection is None:
+            raise RuntimeError("Database connection not initialized")
+
+        self._logger.info("Migrating database schema to user_version=9")
+
+        self._connection.executescript(
+            """
+            ALTER TABLE profiles ADD COLUMN transfer_block_size INTEGER NOT NULL DEFAULT 0;
+            ALTER TABLE profiles ADD COLUMN transfer_max_requests INTEGER NOT NULL DEFAULT 0;
+            ALTER TABLE profiles ADD COLUMN ssh_compression INTEGER NOT NULL DEFAULT 0;
+            ALTER TABLE profiles ADD COLUMN transfer_auto_tune INTEGER NOT NULL DEFAULT 0;
+            """
+        )
+        self._connection.execute("PRAGMA user_version = 9")
+        self._connection.commit()
+        self._logger.info("Database schema migration to user_version=9 completed")
+
+    def _migrate_to_v10(self) -> None:
+        if self._connection is None:
+            raise RuntimeError("Database connection not initialized")
+
+        self._logger.info("Migrating database schema to user_version=10")
+
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS partial_transfers (
+                profile_id INTEGER NOT NULL,
+                direction TEXT NOT NULL,
+                remote_path TEXT NOT NULL,
+                local_path TEXT NOT NULL,
+                temp_path TEXT,
+                size_bytes INTEGER NOT NULL,
+                source_signature TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (profile_id, direction, remote_path, local_path),
+                FOREIGN KEY (profile_id) REFERENCES profiles(id) ON DELETE CASCADE
+            );
+            """
+        )
+        self._connection.execute("PRAGMA user_version = 10")
+        self._connection.commit()
+        self._logger.info("Database schema migration to user_version=10 completed")
+
+    def _migrate_to_v11(self) -> None:
+        if self._connection is None:
+            raise RuntimeError("Database connection not initialized")
+
+        self._logger.info("Migrating database schema to user_version=11")
+
+        self._connection.executescript(
+            """
+            ALTER TABLE partial_transfers ADD COLUMN remote_signature TEXT;
+            """
+        )
+        self._connection.execute("PRAGMA user_version = 11")
+        self._connection.commit()
+        self._logger.info("Database schema migration to user_version=11 completed")
+
+    def _migrate_to_v12(self) -> None:
+        if self._connection is None:
+            raise RuntimeError("Database connection not initialized")
+
+        self._logger.info("Migrating database schema to user_version=12")
+
+        self._connection.executescript(
+            """
+            ALTER TABLE roll_integrity ADD COLUMN verifier_version INTEGER NOT NULL DEFAULT 0;
+            """
+        )
+        self._connection.execute("PRAGMA user_version = 12")
+        self._connection.commit()
+        self._logger.info("Database schema migration to user_version=12 completed")
+
     @property
     def connection(self) -> sqlite3.Connection:
         return self.connect()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import json
 import sqlite3
 
 from core.automations.models import AutomationJob, AutomationJobType, AutomationRun
@@ -30,6 +31,67 @@ class JobRun:
     message: str | None
 
 
+@dataclass(slots=True)
+class ContentHashEntry:
+    path: str
+    size_bytes: int
+    mtime_ns: int
+    algorithm: str
+    digest: str
+    hashed_at: str
+
+
+@dataclass(slots=True)
+class RollIntegrityEntry:
+    path: str
+    size_bytes: int
+    mtime_ns: int
+    verifier_version: int
+    status: str
+    message: str
+    frames: int
+    decompressed_bytes: int
+    checked_at: str
+
+
+@dataclass(slots=True)
+class WorldNameCacheEntry:
+    path: str
+    size_bytes: int
+    mtime_ns: int
+    extractor_version: int
+    world_name: str | None
+    source: str
+    candidates: list[str]
+    resolved_at: str
+
+
+@dataclass(slots=True)
+class ServerWorldNameCacheEntry:
+    profile_id: int
+    remote_path: str
+    size_bytes: int
+    modified_at: str
+    extractor_version: int
+    world_name: str | None
+    source: str
+    candidates: list[str]
+    resolved_at: str
+
+
+@dataclass(slots=True)
+class PartialTransferEntry:
+    profile_id: int
+    direction: str
+    remote_path: str
+    local_path: str
+    temp_path: str | None
+    size_bytes: int
+    source_signature: str
+    updated_at: str
+    remote_signature: str | None = None
+
+
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -57,6 +119,11 @@ class ProfileRepository:
                 remote_path,
                 passive_mode,
                 verify_host_key,
+                transfer_concurrency,
+                transfer_block_size,
+                transfer_max_requests,
+                ssh_compression,
+                transfer_auto_tune,
                 created_at,
                 updated_at
             FROM profiles
@@ -78,6 +145,11 @@ class ProfileRepository:
                 remote_path,
                 passive_mode,
                 verify_host_key,
+                transfer_concurrency,
+                transfer_block_size,
+                transfer_max_requests,
+                ssh_compression,
+                transfer_auto_tune,
                 created_at,
                 updated_at
             FROM profiles
@@ -102,10 +174,15 @@ class ProfileRepository:
                 remote_path,
                 passive_mode,
                 verify_host_key,
+                transfer_concurrency,
+                transfer_block_size,
+                transfer_max_requests,
+                ssh_compression,
+                transfer_auto_tune,
                 created_at,
                 updated_at
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 profile.name,
@@ -116,6 +193,11 @@ class ProfileRepository:
                 profile.remote_path,
                 1 if profile.passive_mode else 0,
                 1 if profile.verify_host_key else 0,
+                profile.transfer_concurrency,
+                profile.transfer_block_size,
+                profile.transfer_max_requests,
+                1 if profile.ssh_compression else 0,
+                1 if profile.transfer_auto_tune else 0,
                 now,
                 now,
             ),
@@ -140,6 +222,11 @@ class ProfileRepository:
                 remote_path = ?,
                 passive_mode = ?,
                 verify_host_key = ?,
+                transfer_concurrency = ?,
+                transfer_block_size = ?,
+                transfer_max_requests = ?,
+                ssh_compression = ?,
+                transfer_auto_tune = ?,
                 updated_at = ?
             WHERE id = ?
             """,
@@ -152,6 +239,11 @@ class ProfileRepository:
                 profile.remote_path,
                 1 if profile.passive_mode else 0,
                 1 if profile.verify_host_key else 0,
+                profile.transfer_concurrency,
+                profile.transfer_block_size,
+                profile.transfer_max_requests,
+                1 if profile.ssh_compression else 0,
+                1 if profile.transfer_auto_tune else 0,
                 now,
                 profile.id,
             ),
@@ -173,6 +265,11 @@ class ProfileRepository:
             remote_path=str(row["remote_path"]),
             passive_mode=bool(row["passive_mode"]),
             verify_host_key=bool(row["verify_host_key"]),
+            transfer_concurrency=int(row["transfer_concurrency"]),
+            transfer_block_size=int(row["transfer_block_size"]),
+            transfer_max_requests=int(row["transfer_max_requests"]),
+            ssh_compression=bool(row["ssh_compression"]),
+            transfer_auto_tune=bool(row["transfer_auto_tune"]),
             created_at=str(row["created_at"]),
             updated_at=str(row["updated_at"]),
         )
@@ -489,3 +586,433 @@ class AutomationJobRepository:
             )
             for row in rows
         ]
+
+
+class ContentHashRepository:
+    _BATCH_SIZE = 500
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def get_many(self, paths: list[str]) -> dict[str, ContentHashEntry]:
+        entries: dict[str, ContentHashEntry] = {}
+        for start in range(0, len(paths), self._BATCH_SIZE):
+            batch = paths[start : start + self._BATCH_SIZE]
+            placeholders = ", ".join("?" for _ in batch)
+            rows = self._connection.execute(
+                f"""
+                SELECT path, size_bytes, mtime_ns, algorithm, digest, hashed_at
+                FROM content_hashes
+                WHERE path IN ({placeholders})
+                """,
+                batch,
+            ).fetchall()
+            for row in rows:
+                entry = self._row_to_entry(row)
+                entries[entry.path] = entry
+        return entries
+
+    def list_by_digest(self, digest: str, algorithm: str) -> list[ContentHashEntry]:
+        rows = self._connection.execute(
+            """
+            SELECT path, size_bytes, mtime_ns, algorithm, digest, hashed_at
+            FROM content_hashes
+            WHERE digest = ? AND algorithm = ?
+            ORDER BY path
+            """,
+            (digest, algorithm),
+        ).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def upsert_many(self, entries: list[ContentHashEntry]) -> None:
+        if not entries:
+            return
+        self._connection.executemany(
+            """
+            INSERT INTO content_hashes (path, size_bytes, mtime_ns, algorithm, digest, hashed_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                size_bytes = excluded.size_bytes,
+                mtime_ns = excluded.mtime_ns,
+                algorithm = excluded.algorithm,
+                digest = excluded.digest,
+                hashed_at = excluded.hashed_at
+            """,
+            [
+                (entry.path, entry.size_bytes, entry.mtime_ns, entry.algorithm, entry.digest, entry.hashed_at)
+                for entry in entries
+            ],
+        )
+        self._connection.commit()
+
+    def delete_paths(self, paths: list[str]) -> None:
+        if not paths:
+            return
+        self._connection.executemany("DELETE FROM content_hashes WHERE path = ?", [(path,) for path in paths])
+        self._connection.commit()
+
+    def _row_to_entry(self, row: sqlite3.Row) -> ContentHashEntry:
+        return ContentHashEntry(
+            path=str(row["path"]),
+            size_bytes=int(row["size_bytes"]),
+            mtime_ns=int(row["mtime_ns"]),
+            algorithm=str(row["algorithm"]),
+            digest=str(row["digest"]),
+            hashed_at=str(row["hashed_at"]),
+        )
+
+
+class RollIntegrityRepository:
+    _BATCH_SIZE = 500
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def get_many(self, paths: list[str]) -> dict[str, RollIntegrityEntry]:
+        entries: dict[str, RollIntegrityEntry] = {}
+        for start in range(0, len(paths), self._BATCH_SIZE):
+            batch = paths[start : start + self._BATCH_SIZE]
+            placeholders = ", ".join("?" for _ in batch)
+            rows = self._connection.execute(
+                f"""
+                SELECT path, size_bytes, mtime_ns, verifier_version, status, message, frames, decompressed_bytes, checked_at
+                FROM roll_integrity
+                WHERE path IN ({placeholders})
+                """,
+                batch,
+            ).fetchall()
+            for row in rows:
+                entry = self._row_to_entry(row)
+                entries[entry.path] = entry
+        return entries
+
+    def upsert_many(self, entries: list[RollIntegrityEntry]) -> None:
+        if not entries:
+            return
+        self._connection.executemany(
+            """
+            INSERT INTO roll_integrity (
+                path,
+                size_bytes,
+                mtime_ns,
+                verifier_version,
+                status,
+                message,
+                frames,
+                decompressed_bytes,
+                checked_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                size_bytes = excluded.size_bytes,
+                mtime_ns = excluded.mtime_ns,
+                verifier_version = excluded.verifier_version,
+                status = excluded.status,
+                message = excluded.message,
+                frames = excluded.frames,
+                decompressed_bytes = excluded.decompressed_bytes,
+                checked_at = excluded.checked_at
+            """,
+            [
+                (
+                    entry.path,
+                    entry.size_bytes,
+                    entry.mtime_ns,
+                    entry.verifier_version,
+                    entry.status,
+                    entry.message,
+                    entry.frames,
+                    entry.decompressed_bytes,
+                    entry.checked_at,
+                )
+                for entry in entries
+            ],
+        )
+        self._connection.commit()
+
+    def _row_to_entry(self, row: sqlite3.Row) -> RollIntegrityEntry:
+        return RollIntegrityEntry(
+            path=str(row["path"]),
+            size_bytes=int(row["size_bytes"]),
+            mtime_ns=int(row["mtime_ns"]),
+            verifier_version=int(row["verifier_version"]),
+            status=str(row["status"]),
+            message=str(row["message"]),
+            frames=int(row["frames"]),
+            decompressed_bytes=int(row["decompressed_bytes"]),
+            checked_at=str(row["checked_at"]),
+        )
+
+
+class WorldNameCacheRepository:
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def get(self, path: str) -> WorldNameCacheEntry | None:
+        row = self._connection.execute(
+            """
+            SELECT
+                path,
+                size_bytes,
+                mtime_ns,
+                extractor_version,
+                world_name,
+                source,
+                candidates,
+                resolved_at
+            FROM world_name_cache
+            WHERE path = ?
+            """,
+            (path,),
+        ).fetchone()
+        if row is None:
+            return None
+        return self._row_to_entry(row)
+
+    def upsert(self, entry: WorldNameCacheEntry) -> None:
+        self._connection.execute(
+            """
+            INSERT INTO world_name_cache (
+                path,
+                size_bytes,
+                mtime_ns,
+                extractor_version,
+                world_name,
+                source,
+                candidates,
+                resolved_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                size_bytes = excluded.size_bytes,
+                mtime_ns = excluded.mtime_ns,
+                extractor_version = excluded.extractor_version,
+                world_name = excluded.world_name,
+                source = excluded.source,
+                candidates = excluded.candidates,
+                resolved_at = excluded.resolved_at
+            """,
+            (
+                entry.path,
+                entry.size_bytes,
+                entry.mtime_ns,
+                entry.extractor_version,
+                entry.world_name,
+                entry.source,
+                json.dumps(entry.candidates, ensure_ascii=False),
+                entry.resolved_at,
+            ),
+        )
+        self._connection.commit()
+
+    def _row_to_entry(self, row: sqlite3.Row) -> WorldNameCacheEntry:
+        try:
+            candidates_raw = json.loads(str(row["candidates"]))
+        except json.JSONDecodeError:
+            candidates_raw = []
+        candidates = [str(value) for value in candidates_raw] if isinstance(candidates_raw, list) else []
+
+        return WorldNameCacheEntry(
+            path=str(row["path"]),
+            size_bytes=int(row["size_bytes"]),
+            mtime_ns=int(row["mtime_ns"]),
+            extractor_version=int(row["extractor_version"]),
+            world_name=str(row["world_name"]) if row["world_name"] is not None else None,
+            source=str(row["source"]),
+            candidates=candidates,
+            resolved_at=str(row["resolved_at"]),
+        )
+
+
+class ServerWorldNameCacheRepository:
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def get(self, profile_id: int, remote_path: str) -> ServerWorldNameCacheEntry | None:
+        row = self._connection.execute(
+            """
+            SELECT
+                profile_id,
+                remote_path,
+                size_bytes,
+                modified_at,
+                extractor_version,
+                world_name,
+                source,
+                candidates,
+                resolved_at
+            FROM server_world_name_cache
+            WHERE profile_id = ? AND remote_path = ?
+            """,
+            (profile_id, remote_path),
+        ).fetchone()
+        if row is None:
+            return None
+        return self._row_to_entry(row)
+
+    def upsert(self, entry: ServerWorldNameCacheEntry) -> None:
+        self._connection.execute(
+            """
+            INSERT INTO server_world_name_cache (
+                profile_id,
+                remote_path,
+                size_bytes,
+                modified_at,
+                extractor_version,
+                world_name,
+                source,
+                candidates,
+                resolved_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(profile_id, remote_path) DO UPDATE SET
+                size_bytes = excluded.size_bytes,
+                modified_at = excluded.modified_at,
+                extractor_version = excluded.extractor_version,
+                world_name = excluded.world_name,
+                source = excluded.source,
+                candidates = excluded.candidates,
+                resolved_at = excluded.resolved_at
+            """,
+            (
+                entry.profile_id,
+                entry.remote_path,
+                entry.size_bytes,
+                entry.modified_at,
+                entry.extractor_version,
+                entry.world_name,
+                entry.source,
+                json.dumps(entry.candidates, ensure_ascii=False),
+                entry.resolved_at,
+            ),
+        )
+        self._connection.commit()
+
+    def _row_to_entry(self, row: sqlite3.Row) -> ServerWorldNameCacheEntry:
+        try:
+            candidates_raw = json.loads(str(row["candidates"]))
+        except json.JSONDecodeError:
+            candidates_raw = []
+        candidates = [str(value) for value in candidates_raw] if isinstance(candidates_raw, list) else []
+
+        return ServerWorldNameCacheEntry(
+            profile_id=int(row["profile_id"]),
+            remote_path=str(row["remote_path"]),
+            size_bytes=int(row["size_bytes"]),
+            modified_at=str(row["modified_at"]),
+            extractor_version=int(row["extractor_version"]),
+            world_name=str(row["world_name"]) if row["world_name"] is not None else None,
+            source=str(row["source"]),
+            candidates=candidates,
+            resolved_at=str(row["resolved_at"]),
+        )
+
+
+class PartialTransferRepository:
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def get(self, profile_id: int, direction: str, remote_path: str, local_path: str) -> PartialTransferEntry | None:
+        row = self._connection.execute(
+            """
+            SELECT
+                profile_id,
+                direction,
+                remote_path,
+                local_path,
+                temp_path,
+                size_bytes,
+                source_signature,
+                updated_at,
+                remote_signature
+            FROM partial_transfers
+            WHERE profile_id = ? AND direction = ? AND remote_path = ? AND local_path = ?
+            """,
+            (profile_id, direction, remote_path, local_path),
+        ).fetchone()
+        if row is None:
+            return None
+        return self._row_to_entry(row)
+
+    def list_for_profile(self, profile_id: int) -> list[PartialTransferEntry]:
+        rows = self._connection.execute(
+            """
+            SELECT
+                profile_id,
+                direction,
+                remote_path,
+                local_path,
+                temp_path,
+                size_bytes,
+                source_signature,
+                updated_at,
+                remote_signature
+            FROM partial_transfers
+            WHERE profile_id = ?
+            """,
+            (profile_id,),
+        ).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def upsert(self, entry: PartialTransferEntry) -> None:
+        self._connection.execute(
+            """
+            INSERT INTO partial_transfers (
+                profile_id,
+                direction,
+                remote_path,
+                local_path,
+                temp_path,
+                size_bytes,
+                source_signature,
+                updated_at,
+                remote_signature
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(profile_id, direction, remote_path, local_path) DO UPDATE SET
+                temp_path = excluded.temp_path,
+                size_bytes = excluded.size_bytes,
+                source_signature = excluded.source_signature,
+                updated_at = excluded.updated_at,
+                remote_signature = excluded.remote_signature
+            """,
+            (
+                entry.profile_id,
+                entry.direction,
+                entry.remote_path,
+                entry.local_path,
+                entry.temp_path,
+                entry.size_bytes,
+                entry.source_signature,
+                entry.updated_at,
+                entry.remote_signature,
+            ),
+        )
+        self._connection.commit()
+
+    def delete(self, profile_id: int, direction: str, remote_path: str, local_path: str) -> None:
+        self._connection.execute(
+            """
+            DELETE FROM partial_transfers
+            WHERE profile_id = ? AND direction = ? AND remote_path = ? AND local_path = ?
+            """,
+            (profile_id, direction, remote_path, local_path),
+        )
+        self._connection.commit()
+
+    def delete_for_profile(self, profile_id: int) -> None:
+        self._connection.execute("DELETE FROM partial_transfers WHERE profile_id = ?", (profile_id,))
+        self._connection.commit()
+
+    def _row_to_entry(self, row: sqlite3.Row) -> PartialTransferEntry:
+        return PartialTransferEntry(
+            profile_id=int(row["profile_id"]),
+            direction=str(row["direction"]),
+            remote_path=str(row["remote_path"]),
+            local_path=str(row["local_path"]),
+            temp_path=str(row["temp_path"]) if row["temp_path"] is not None else None,
+            size_bytes=int(row["size_bytes"]),
+            source_signature=str(row["source_signature"]),
+            updated_at=str(row["updated_at"]),
+            remote_signature=str(row["remote_signature"]) if row["remote_signature"] is not None else None,
+        )
@@ -10,6 +10,11 @@ CREATE TABLE IF NOT EXISTS profiles (
     remote_path TEXT NOT NULL,
     passive_mode INTEGER NOT NULL DEFAULT 1,
     verify_host_key INTEGER NOT NULL DEFAULT 1,
+    transfer_concurrency INTEGER NOT NULL DEFAULT 4,
+    transfer_block_size INTEGER NOT NULL DEFAULT 0,
+    transfer_max_requests INTEGER NOT NULL DEFAULT 0,
+    ssh_compression INTEGER NOT NULL DEFAULT 0,
+    transfer_auto_tune INTEGER NOT NULL DEFAULT 0,
     created_at TEXT NOT NULL,
     updated_at TEXT NOT NULL
 );
@@ -68,4 +73,66 @@ CREATE TABLE IF NOT EXISTS automation_runs (
     FOREIGN KEY (job_id) REFERENCES automation_jobs(id) ON DELETE CASCADE
 );
 
+CREATE TABLE IF NOT EXISTS content_hashes (
+    path TEXT PRIMARY KEY,
+    size_bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    algorithm TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    hashed_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_content_hashes_digest ON content_hashes(digest);
+
+CREATE TABLE IF NOT EXISTS roll_integrity (
+    path TEXT PRIMARY KEY,
+    size_bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    verifier_version INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    message TEXT NOT NULL,
+    frames INTEGER NOT NULL,
+    decompressed_bytes INTEGER NOT NULL,
+    checked_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS world_name_cache (
+    path TEXT PRIMARY KEY,
+    size_bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    extractor_version INTEGER NOT NULL,
+    world_name TEXT,
+    source TEXT NOT NULL,
+    candidates TEXT NOT NULL,
+    resolved_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS server_world_name_cache (
+    profile_id INTEGER NOT NULL,
+    remote_path TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    modified_at TEXT NOT NULL,
+    extractor_version INTEGER NOT NULL,
+    world_name TEXT,
+    source TEXT NOT NULL,
+    candidates TEXT NOT NULL,
+    resolved_at TEXT NOT NULL,
+    PRIMARY KEY (profile_id, remote_path),
+    FOREIGN KEY (profile_id) REFERENCES profiles(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS partial_transfers (
+    profile_id INTEGER NOT NULL,
+    direction TEXT NOT NULL,
+    remote_path TEXT NOT NULL,
+    local_path TEXT NOT NULL,
+    temp_path TEXT,
+    size_bytes INTEGER NOT NULL,
+    source_signature TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    remote_signature TEXT,
+    PRIMARY KEY (profile_id, direction, remote_path, local_path),
+    FOREIGN KEY (profile_id) REFERENCES profiles(id) ON DELETE CASCADE
+);
+
 COMMIT;
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from core.worldname.strings import CandidateStrings
+
+
+def _counts(payload: bytes) -> dict[str, int]:
+    candidates = CandidateStrings(min_len=4)
+    candidates.feed(payload)
+    return dict(candidates.items())
+
+
+def test_ascii_runs_are_counted_by_both_extractors() -> None:
+    assert _counts(b"\x00Emberveil Hollow\x00") == {"Emberveil Hollow": 2}
+
+
+def test_utf8_runs_join_across_invalid_bytes() -> None:
+    counts = _counts("Fête".encode("utf-8") + b"\xffFest\x00")
+
+    assert counts == {"Fest": 1, "FêteFest": 1}
+
+
+def test_first_spelling_wins_and_counts_merge_case_insensitively() -> None:
+    counts = _counts(b"KINDLEWASTES\x00kindlewastes\x00")
+
+    assert counts == {"KINDLEWASTES": 4}
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+from pathlib import Path
+
+import pytest
+
+from benchmarks.remote_servers import LOCAL_PASSWORD, LocalRemoteServers
+from core.profiles.models import Profile
+from core.remote import connection_manager
+from core.remote.connection_manager import RemoteConnectionManager, connection_key
+from core.remote.sftp_client import SFTPClient
+
+
+class SlowSessionClient:
+    opened = 0
+    closed = 0
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[SlowSessionClient]:
+        await asyncio.sleep(0.01)
+        SlowSessionClient.opened += 1
+        try:
+            yield self
+        finally:
+            SlowSessionClient.closed += 1
+
+
+def test_concurrent_acquire_opens_one_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(connection_manager, "create_client", lambda **_kwargs: SlowSessionClient())
+    monkeypatch.setattr(SlowSessionClient, "opened", 0)
+    monkeypatch.setattr(SlowSessionClient, "closed", 0)
+    manager = RemoteConnectionManager(max_connections=2)
+    profile = Profile(id=1, name="test", protocol="sftp", host="localhost", port=22, username="user", remote_path="/")
+    key = connection_key(profile, "secret")
+
+    async def run() -> None:
+        first, second = await asyncio.gather(
+            manager._acquire(key, profile, "secret", logging.getLogger("test")),
+            manager._acquire(key, profile, "secret", logging.getLogger("test")),
+        )
+        assert first is second
+        assert first.active == 2
+        await manager._close_all()
+
+    asyncio.run(run())
+    assert SlowSessionClient.opened == 1
+    assert SlowSessionClient.closed == 1
+
+
+def test_sftp_operation_error_closes_only_its_channel(tmp_path: Path) -> None:
+    with LocalRemoteServers(tmp_path / "servers") as servers:
+        profile = servers.server("sftp").profile(transfer_concurrency=2)
+        client = SFTPClient(profile, LOCAL_PASSWORD)
+
+        async def run() -> None:
+            async with client.session():
+                async with client._open_sftp() as healthy:
+                    connection = client._session_connection
+                    with pytest.raises(RuntimeError):
+                        async with client._open_sftp():
+                            raise RuntimeError("operation failed")
+
+                    assert client._session_connection is connection
+                    assert await healthy.realpath(".")
+                assert client._session_idle_channels == [healthy]
+
+        asyncio.run(run())
+
+
+def test_sftp_checksum_falls_back_without_private_request_api(tmp_path: Path) -> None:
+    with LocalRemoteServers(tmp_path / "servers") as servers:
+        server = servers.server("sftp")
+        (server.root / "world").write_bytes(b"payload")
+        client = SFTPClient(server.profile(), LOCAL_PASSWORD)
+
+        async def run() -> None:
+            async with client.session():
+                async with client._open_sftp() as sftp:
+                    handler = sftp._handler
+                    sftp._handler = object()
+                    try:
+                        assert await client._request_extension(sftp, b"md5-hash") is None
+                    finally:
+                        sftp._handler = handler
+                assert await client.checksum("/world") == (True, "ok", None)
+
+        asyncio.run(run())
+    assert b"md5-hash" in client._unsupported_extensions
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import closing
+from pathlib import Path
+import struct
+import subprocess
+import sys
+
+import pytest
+import zstandard
+
+from core.saves import integrity
+from core.saves.integrity import RollIntegrityService
+from core.saves.models import RollIntegrityStatus
+from core.saves.roll_verifier import VERIFIER_VERSION, verify_roll_file
+from core.system.process_pool import SpawnProcessPool
+from storage.db import DatabaseManager
+from storage.repositories import RollIntegrityEntry, RollIntegrityRepository
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _frame(payload: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=3).compress(payload)
+
+
+def _roll(tmp_path: Path, name: str, data: bytes) -> Path:
+    path = tmp_path / name
+    path.write_bytes(data)
+    return path
+
+
+def _skippable(payload: bytes) -> bytes:
+    return b"\x50\x2A\x4D\x18" + struct.pack("<I", len(payload)) + payload
+
+
+def test_single_prefixed_frame_is_valid(tmp_path: Path) -> None:
+    frame = _frame(b"roll" * 4096)
+    result = verify_roll_file(_roll(tmp_path, "3ad85aea", struct.pack("<I", len(frame)) + frame))
+
+    assert result.status == RollIntegrityStatus.VALID
+    assert result.frames == 1
+    assert result.decompressed_bytes == 4 * 4096
+
+
+def test_every_frame_is_walked_to_eof(tmp_path: Path) -> None:
+    data = _frame(b"first" * 1000) + _skippable(b"meta") + _frame(b"second" * 1000)
+    result = verify_roll_file(_roll(tmp_path, "3ad85aea-1", data), read_size=64)
+
+    assert result.status == RollIntegrityStatus.VALID
+    assert result.frames == 2
+    assert result.decompressed_bytes == 11000
+
+
+def test_trailing_garbage_after_first_frame_is_corrupt(tmp_path: Path) -> None:
+    result = verify_roll_file(_roll(tmp_path, "3ad85aea-2", _frame(b"roll" * 100) + b"\x00garbage"))
+
+    assert result.status == RollIntegrityStatus.CORRUPT
+    assert result.frames == 1
+
+
+def test_truncated_later_frame_is_reported(tmp_path: Path) -> None:
+    second = _frame(bytes(range(256)) * 64)
+    result = verify_roll_file(_roll(tmp_path, "3ad85aea-3", _frame(b"roll" * 100) + second[: len(second) // 2]))
+
+    assert result.status == RollIntegrityStatus.TRUNCATED
+    assert result.frames == 2
+
+
+def test_truncated_skippable_frame_is_reported(tmp_path: Path) -> None:
+    result = verify_roll_file(_roll(tmp_path, "3ad85aea-4", _frame(b"roll") + _skippable(b"meta" * 10)[:12]))
+
+    assert result.status == RollIntegrityStatus.TRUNCATED
+
+
+def test_empty_and_missing_rolls(tmp_path: Path) -> None:
+    assert verify_roll_file(_roll(tmp_path, "3ad85aea-5", b"")).status == RollIntegrityStatus.TRUNCATED
+    assert verify_roll_file(tmp_path / "absent").status == RollIntegrityStatus.MISSING
+
+
+@pytest.fixture()
+def verify_pool(monkeypatch: pytest.MonkeyPatch) -> Iterator[SpawnProcessPool]:
+    pool = SpawnProcessPool()
+    monkeypatch.setattr(integrity, "get_roll_verify_pool", lambda: pool)
+    yield pool
+    pool.shutdown()
+
+
+def test_service_reuses_one_verify_pool(tmp_path: Path, verify_pool: SpawnProcessPool) -> None:
+    service = RollIntegrityService(db_path=tmp_path / "db.sqlite", max_workers=2, pool_threshold=2)
+    good = [_roll(tmp_path, f"0000000{index}", _frame(b"ok" * 100)) for index in range(2)]
+    bad = [_roll(tmp_path, f"0000001{index}", _frame(b"ok") + b"tail") for index in range(2)]
+
+    first = service.verify_paths(good, use_cache=False)
+    executor = verify_pool.executor(2)
+    second = service.verify_paths(bad, use_cache=False)
+
+    assert verify_pool.executor(2) is executor
+    assert {result.status for result in first.values()} == {RollIntegrityStatus.VALID}
+    assert {result.status for result in second.values()} == {RollIntegrityStatus.CORRUPT}
+
+
+def test_results_from_older_verifier_are_rechecked(tmp_path: Path) -> None:
+    db_path = tmp_path / "db.sqlite"
+    service = RollIntegrityService(db_path=db_path, max_workers=1)
+    path = _roll(tmp_path, "3ad85aea", _frame(b"roll") + b"tail")
+    stat_result = path.stat()
+    stale = RollIntegrityEntry(
+        path=RollIntegrityService._path_key(path),
+        size_bytes=stat_result.st_size,
+        mtime_ns=stat_result.st_mtime_ns,
+        verifier_version=VERIFIER_VERSION - 1,
+        status=RollIntegrityStatus.VALID.value,
+        message="ok",
+        frames=1,
+        decompressed_bytes=4,
+        checked_at="2026-01-01T00:00:00+00:00",
+    )
+    with closing(DatabaseManager(db_path=db_path)) as database:
+        RollIntegrityRepository(database.connect()).upsert_many([stale])
+
+    assert service.verify_paths([path])[path].status == RollIntegrityStatus.CORRUPT
+    with closing(DatabaseManager(db_path=db_path)) as database:
+        entry = RollIntegrityRepository(database.connect()).get_many([stale.path])[stale.path]
+    assert entry.verifier_version == VERIFIER_VERSION
+
+
+def test_verify_worker_imports_skip_qt_and_storage() -> None:
+    script = (
+        "import sys; import core.saves.roll_verifier, core.system.process_pool; "
+        "print(','.join(m for m in sys.modules if m.startswith(('PySide6', 'storage', 'sqlite3'))))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PACKAGE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.strip() == ""
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.save_tree import SyntheticSaveTree, generate_save_tree
+from core.saves.scan_cache import ScanCache
+from core.saves.scanner_service import SaveScannerService
+from core.worldname.extractor import EXTRACTOR_VERSION
+
+
+STALE_NAME = "Stale Name"
+
+
+@pytest.fixture()
+def save_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> SyntheticSaveTree:
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    return generate_save_tree(tmp_path / "tree", slots=3, rolls=2, steam_users=0, roll_size=1024)
+
+
+def _display_names(scanner: SaveScannerService, root: Path) -> dict[str, str]:
+    result = scanner.scan_singleplayer(root, incremental=True)
+    return {slot.world_id_hex: slot.display_name for slot in result.slots}
+
+
+def _mark_names_stale(cache: ScanCache, root: Path, world_ids: list[str], extractor_version: int | None) -> None:
+    for world_id in world_ids:
+        cached = cache.get_slot(root, world_id)
+        assert cached is not None and cached.info_resolved
+        cached.info_name = STALE_NAME
+        cached.info_extractor_version = extractor_version
+        cache.put_slot(root, world_id, cached)
+
+
+def test_cached_names_from_older_extractor_are_resolved_again(tmp_path: Path, save_tree: SyntheticSaveTree) -> None:
+    cache = ScanCache(cache_path=tmp_path / "scan-cache.json")
+    scanner = SaveScannerService(scan_cache=cache, world_name_workers=1)
+    root = save_tree.saved_games_root.resolve()
+    names = _display_names(scanner, root)
+    assert names and STALE_NAME not in names.values()
+
+    _mark_names_stale(cache, root, list(names), EXTRACTOR_VERSION - 1)
+
+    assert _display_names(scanner, root) == names
+
+
+def test_cached_names_from_current_extractor_are_trusted(tmp_path: Path, save_tree: SyntheticSaveTree) -> None:
+    cache = ScanCache(cache_path=tmp_path / "scan-cache.json")
+    scanner = SaveScannerService(scan_cache=cache, world_name_workers=1)
+    root = save_tree.saved_games_root.resolve()
+    names = _display_names(scanner, root)
+
+    _mark_names_stale(cache, root, list(names), EXTRACTOR_VERSION)
+
+    assert set(_display_names(scanner, root).values()) == {STALE_NAME}
+
+
+def test_extractor_version_round_trips_through_cache_file(tmp_path: Path, save_tree: SyntheticSaveTree) -> None:
+    cache_path = tmp_path / "scan-cache.json"
+    cache = ScanCache(cache_path=cache_path)
+    root = save_tree.saved_games_root.resolve()
+    names = _display_names(SaveScannerService(scan_cache=cache, world_name_workers=1), root)
+    cache.save()
+
+    reloaded = ScanCache(cache_path=cache_path)
+    for world_id in names:
+        assert reloaded.get_slot(root, world_id).info_extractor_version == EXTRACTOR_VERSION
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import QCoreApplication, QObject, Signal
+
+from core.saves.models import SaveScanResult
+from core.saves.scan_coordinator import SaveScanCoordinator, _PendingScan, _ScanSubscriber
+from core.saves.scanner_service import SaveScannerService
+
+
+class StubMappingStore(QObject):
+    mapping_changed = Signal()
+
+    def start_watching(self) -> None:
+        pass
+
+
+class StubScanWorker:
+    def __init__(self, cancelled: bool = False) -> None:
+        self._cancelled = cancelled
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+
+@pytest.fixture()
+def coordinator(tmp_path: Path) -> Iterator[SaveScanCoordinator]:
+    _app = QCoreApplication.instance() or QCoreApplication([])
+    coordinator = SaveScanCoordinator(
+        scanner=SaveScannerService(),
+        hash_service=object(),
+        integrity_service=object(),
+        mapping_store=StubMappingStore(),
+    )
+    coordinator._schedule_background_jobs = lambda result: None
+    yield coordinator
+    coordinator.deleteLater()
+
+
+def _pending(
+    coordinator: SaveScanCoordinator,
+    root: Path,
+    delivered: list[SaveScanResult],
+    cancelled: bool = False,
+) -> str:
+    key = coordinator._root_key(root)
+    coordinator._pending[key] = _PendingScan(
+        root=root,
+        thread=None,
+        worker=StubScanWorker(cancelled),
+        relay=None,
+        subscribers=[_ScanSubscriber(on_finished=delivered.append, on_failed=None)],
+    )
+    return key
+
+
+def test_finished_scan_is_cached_and_delivered(coordinator: SaveScanCoordinator, tmp_path: Path) -> None:
+    delivered: list[SaveScanResult] = []
+    key = _pending(coordinator, tmp_path, delivered)
+    result = SaveScanResult(root=tmp_path, slots=[], warnings=[])
+
+    coordinator._on_scan_finished(key, result)
+
+    assert delivered == [result]
+    assert coordinator.cached_result(tmp_path) is result
+
+
+def test_cancelled_scan_is_not_cached_or_delivered(coordinator: SaveScanCoordinator, tmp_path: Path) -> None:
+    delivered: list[SaveScanResult] = []
+    key = _pending(coordinator, tmp_path, delivered, cancelled=True)
+
+    coordinator._on_scan_finished(key, SaveScanResult(root=tmp_path, slots=[], warnings=[]))
+
+    assert delivered == []
+    assert coordinator.cached_result(tmp_path) is None
+    assert coordinator._watcher.watched_root() is None
+
+
+def test_superseded_scan_runs_again_for_its_subscribers(
+    coordinator: SaveScanCoordinator,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    delivered: list[SaveScanResult] = []
+    restarted: list[tuple[str, Path, int]] = []
+    monkeypatch.setattr(
+        coordinator,
+        "_start_scan",
+        lambda key, root, subscribers: restarted.append((key, root, len(subscribers))),
+    )
+    key = _pending(coordinator, tmp_path, delivered)
+
+    coordinator.invalidate(tmp_path)
+    coordinator._on_scan_finished(key, SaveScanResult(root=tmp_path, slots=[], warnings=[]))
+
+    assert delivered == []
+    assert coordinator.cached_result(tmp_path) is None
+    assert restarted == [(key, tmp_path, 1)]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from collections import Counter
+import os
+from pathlib import Path
+
+import pytest
+
+from benchmarks.save_tree import SyntheticSaveTree, generate_save_tree
+from core.saves.scan_cache import ScanCache
+from core.saves.scanner_service import SaveScannerService
+
+
+@pytest.fixture()
+def save_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> SyntheticSaveTree:
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    return generate_save_tree(tmp_path / "tree", slots=10, rolls=10, steam_users=0, roll_size=1024)
+
+
+def _counting_syscalls(monkeypatch: pytest.MonkeyPatch) -> tuple[Counter[str], Counter[str]]:
+    stat_calls: Counter[str] = Counter()
+    scandir_calls: Counter[str] = Counter()
+    real_stat = os.stat
+    real_scandir = os.scandir
+
+    def counting_stat(path, *args, **kwargs):
+        stat_calls[os.fspath(path)] += 1
+        return real_stat(path, *args, **kwargs)
+
+    def counting_scandir(path="."):
+        scandir_calls[os.fspath(path)] += 1
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "stat", counting_stat)
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    return stat_calls, scandir_calls
+
+
+def _scanner(tmp_path: Path, name: str, single_pass: bool) -> SaveScannerService:
+    return SaveScannerService(single_pass=single_pass, scan_cache=ScanCache(cache_path=tmp_path / f"{name}.json"))
+
+
+def test_single_pass_lists_root_once_without_per_file_stats(
+    save_tree: SyntheticSaveTree,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    scanner = _scanner(tmp_path, "single", single_pass=True)
+    root = save_tree.saved_games_root.resolve()
+    save_files = {str(root / path.name) for path in save_tree.roll_files}
+    save_files.update(str(root / f"{path.name}-index") for path in save_tree.roll_files if "-" not in path.name)
+    stat_calls, scandir_calls = _counting_syscalls(monkeypatch)
+
+    result = scanner.scan_singleplayer(root)
+
+    assert len(result.slots) == 10
+    assert scandir_calls[str(root)] == 1
+    assert sorted(save_files & set(stat_calls)) == []
+
+
+def test_probe_mode_stats_every_roll(
+    save_tree: SyntheticSaveTree,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    scanner = _scanner(tmp_path, "probe", single_pass=False)
+    root = save_tree.saved_games_root.resolve()
+    roll_files = [str(root / path.name) for path in save_tree.roll_files]
+    stat_calls, _scandir_calls = _counting_syscalls(monkeypatch)
+
+    scanner.scan_singleplayer(root)
+
+    assert all(stat_calls[path] > 0 for path in roll_files)
+
+
+def test_single_pass_matches_probe_mode(save_tree: SyntheticSaveTree, tmp_path: Path) -> None:
+    root = save_tree.saved_games_root
+
+    probe = _scanner(tmp_path, "probe", single_pass=False).scan_singleplayer(root)
+    single = _scanner(tmp_path, "single", single_pass=True).scan_singleplayer(root)
+
+    assert single == probe
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import pytest
+
+from core.profiles.models import Profile
+from core.remote.transfer_tuning import (
+    AUTO_TUNE_MIN_BYTES,
+    AUTO_TUNE_WINDOW_FACTOR,
+    DEFAULT_SFTP_WINDOW,
+    MAX_FTP_BLOCK_SIZE,
+    MAX_SFTP_BLOCK_SIZE,
+    MAX_SFTP_REQUESTS,
+    MIN_FTP_BLOCK_SIZE,
+    TransferAutoTuner,
+    TransferTuning,
+    _clamp_power_of_two,
+    recommend_tuning,
+)
+
+
+MIB = 1024 * 1024
+
+
+def _profile(protocol: str = "sftp", auto_tune: bool = True, profile_id: int = 1, **overrides: object) -> Profile:
+    return Profile(
+        name="test",
+        protocol=protocol,
+        host="example.com",
+        port=22 if protocol == "sftp" else 21,
+        username="user",
+        remote_path="/",
+        transfer_auto_tune=auto_tune,
+        id=profile_id,
+        **overrides,
+    )
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (0, MIN_FTP_BLOCK_SIZE),
+        (MIN_FTP_BLOCK_SIZE, MIN_FTP_BLOCK_SIZE),
+        (MIN_FTP_BLOCK_SIZE + 1, 2 * MIN_FTP_BLOCK_SIZE),
+        (2 * MIN_FTP_BLOCK_SIZE, 2 * MIN_FTP_BLOCK_SIZE),
+        (MAX_FTP_BLOCK_SIZE, MAX_FTP_BLOCK_SIZE),
+        (MAX_FTP_BLOCK_SIZE + 1, MAX_FTP_BLOCK_SIZE),
+        (1e12, MAX_FTP_BLOCK_SIZE),
+    ],
+)
+def test_clamp_power_of_two_boundaries(value: float, expected: int) -> None:
+    assert _clamp_power_of_two(value, MIN_FTP_BLOCK_SIZE, MAX_FTP_BLOCK_SIZE) == expected
+
+
+@pytest.mark.parametrize(
+    ("bytes_per_second", "block_size"),
+    [
+        (1_000_000, MIN_FTP_BLOCK_SIZE),
+        (100 * MIN_FTP_BLOCK_SIZE, MIN_FTP_BLOCK_SIZE),
+        (100 * MIN_FTP_BLOCK_SIZE + 100, 2 * MIN_FTP_BLOCK_SIZE),
+        (10 * MIB, 128 * 1024),
+        (10_000 * MIB, MAX_FTP_BLOCK_SIZE),
+    ],
+)
+def test_ftp_block_size_follows_throughput(bytes_per_second: float, block_size: int) -> None:
+    tuning = recommend_tuning("ftp", bytes_per_second, rtt_seconds=0.5)
+
+    assert tuning == TransferTuning(block_size=block_size)
+    assert tuning.ftp_block_size() == block_size
+
+
+def test_small_sftp_window_keeps_asyncssh_defaults() -> None:
+    rtt_seconds = 0.1
+    at_default = DEFAULT_SFTP_WINDOW / (rtt_seconds * AUTO_TUNE_WINDOW_FACTOR)
+
+    tuning = recommend_tuning("sftp", at_default, rtt_seconds)
+
+    assert tuning == TransferTuning()
+    assert tuning.sftp_block_size() == -1
+    assert tuning.sftp_max_requests() == -1
+
+
+@pytest.mark.parametrize(
+    ("bytes_per_second", "rtt_seconds", "max_requests"),
+    [
+        (DEFAULT_SFTP_WINDOW / AUTO_TUNE_WINDOW_FACTOR + 1, 1.0, DEFAULT_SFTP_WINDOW // MAX_SFTP_BLOCK_SIZE + 1),
+        (100 * MIB, 0.1, 160),
+        (10 * MIB, 0.25, 40),
+        (1000 * MIB, 1.0, MAX_SFTP_REQUESTS),
+    ],
+)
+def test_sftp_window_sets_request_count(bytes_per_second: float, rtt_seconds: float, max_requests: int) -> None:
+    tuning = recommend_tuning("SFTP", bytes_per_second, rtt_seconds)
+
+    assert tuning == TransferTuning(block_size=MAX_SFTP_BLOCK_SIZE, max_requests=max_requests)
+
+
+def test_first_measurement_wins() -> None:
+    tuner = TransferAutoTuner()
+    profile = _profile("ftp")
+    assert tuner.needs_measurement(profile)
+
+    tuner.record(profile, 10 * MIB, 1.0, 0.05)
+    tuner.record(profile, 10_000 * MIB, 1.0, 0.05)
+
+    assert not tuner.needs_measurement(profile)
+    assert tuner.tuning_for(profile) == TransferTuning(block_size=128 * 1024)
+
+
+@pytest.mark.parametrize(("size_bytes", "elapsed_seconds"), [(AUTO_TUNE_MIN_BYTES - 1, 1.0), (10 * MIB, 0.0)])
+def test_unreliable_measurements_are_ignored(size_bytes: int, elapsed_seconds: float) -> None:
+    tuner = TransferAutoTuner()
+    profile = _profile("ftp")
+
+    tuner.record(profile, size_bytes, elapsed_seconds, 0.05)
+
+    assert tuner.needs_measurement(profile)
+    assert tuner.tuning_for(profile) == TransferTuning()
+
+
+def test_manual_settings_apply_without_auto_tune() -> None:
+    tuner = TransferAutoTuner()
+    profile = _profile(auto_tune=False, transfer_block_size=32 * 1024, transfer_max_requests=8)
+
+    tuner.record(profile, 100 * MIB, 1.0, 0.5)
+
+    assert not tuner.needs_measurement(profile)
+    assert tuner.tuning_for(profile) == TransferTuning(block_size=32 * 1024, max_requests=8)
+
+
+def test_measurements_are_kept_per_profile() -> None:
+    tuner = TransferAutoTuner()
+    measured = _profile(profile_id=1)
+    other = _profile(profile_id=2)
+
+    tuner.record(measured, 100 * MIB, 1.0, 0.1)
+
+    assert tuner.tuning_for(measured) == TransferTuning(block_size=MAX_SFTP_BLOCK_SIZE, max_requests=160)
+    assert tuner.needs_measurement(other)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from core.profiles.models import Profile
+from core.remote.client_base import RemoteEntry, open_local_target
+from core.transfers import execute_remote
+from core.transfers.partial_transfers import UPLOAD, PartialTransferStore
+from core.transfers.transfer_progress import TransferProgress
+from storage.db import DatabaseManager
+from storage.repositories import ProfileRepository
+
+
+REMOTE_PATH = "/saves/world"
+
+
+class FlakyUploadClient:
+    def __init__(self, chunk_bytes: int, resume_alignment: int = 1) -> None:
+        self.chunk_bytes = chunk_bytes
+        self.resume_alignment = resume_alignment
+        self.files: dict[str, bytes] = {}
+        self.modified_at: dict[str, datetime] = {}
+        self.offsets: list[int] = []
+
+    def replace_remote(self, remote_path: str, data: bytes) -> None:
+        self.files[remote_path] = data
+        self.modified_at[remote_path] = self.modified_at[remote_path] + timedelta(seconds=5)
+
+    async def stat_many(self, remote_paths: list[str]) -> tuple[bool, str, dict[str, RemoteEntry | None]]:
+        entries: dict[str, RemoteEntry | None] = {}
+        for remote_path in remote_paths:
+            data = self.files.get(remote_path)
+            entries[remote_path] = (
+                RemoteEntry(remote_path, True, len(data), self.modified_at[remote_path]) if data is not None else None
+            )
+        return True, "", entries
+
+    async def upload_resume_offset(self, offset: int) -> int:
+        return offset - offset % self.resume_alignment
+
+    async def upload_file(self, local_path: Path, remote_path: str, offset: int = 0, progress=None) -> tuple[bool, str, int]:
+        offset = await self.upload_resume_offset(offset)
+        self.offsets.append(offset)
+        source = local_path.read_bytes()
+        written = source[offset : offset + self.chunk_bytes]
+        self.files[remote_path] = self.files.get(remote_path, b"")[:offset] + written
+        self.modified_at[remote_path] = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=len(self.offsets))
+        if progress is not None:
+            progress(len(written))
+        if offset + len(written) < len(source):
+            return False, "connection reset", len(written)
+        return True, "", len(written)
+
+
+class FlakyDownloadClient:
+    def __init__(self, data: bytes, chunk_bytes: int, flushed_bytes: int) -> None:
+        self.data = data
+        self.chunk_bytes = chunk_bytes
+        self.flushed_bytes = flushed_bytes
+        self.offsets: list[int] = []
+
+    async def download_file(
+        self,
+        remote_path: str,
+        local_path: Path,
+        offset: int = 0,
+        progress=None,
+    ) -> tuple[bool, str, int]:
+        self.offsets.append(offset)
+        received = self.data[offset : offset + self.chunk_bytes]
+        if progress is not None:
+            progress(len(received))
+        if offset + len(received) < len(self.data):
+            received = received[: self.flushed_bytes]
+        with open_local_target(local_path, offset) as handle:
+            handle.write(received)
+        if offset + len(received) < len(self.data):
+            return False, "connection reset", len(received)
+        return True, "", offset + len(received)
+
+
+@pytest.fixture()
+def partial_store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[tuple[PartialTransferStore, int]]:
+    db_path = tmp_path / "shroudkeeper.db"
+    database = DatabaseManager(db_path=db_path)
+    profile_id = ProfileRepository(database.connect()).create_profile(
+        Profile(name="test", protocol="sftp", host="localhost", port=22, username="user", remote_path="/")
+    )
+    database.close()
+
+    store = PartialTransferStore(db_path=db_path)
+    monkeypatch.setattr(execute_remote, "get_partial_transfer_store", lambda: store)
+    yield store, profile_id
+    store.close()
+
+
+def _upload(
+    client: FlakyUploadClient,
+    source: Path,
+    profile_id: int,
+    progress: TransferProgress | None = None,
+) -> int:
+    return asyncio.run(execute_remote._upload_file(client, source, REMOTE_PATH, profile_id, progress))
+
+
+def _interrupted_upload(tmp_path: Path, profile_id: int) -> tuple[FlakyUploadClient, Path]:
+    source = tmp_path / "world"
+    source.write_bytes(bytes(range(256)) * 40)
+    client = FlakyUploadClient(chunk_bytes=1024)
+    with pytest.raises(RuntimeError):
+        _upload(client, source, profile_id)
+    assert client.offsets == [0, 1024, 2048]
+    return client, source
+
+
+def test_upload_resumes_when_remote_matches_recorded_state(
+    tmp_path: Path,
+    partial_store: tuple[PartialTransferStore, int],
+) -> None:
+    store, profile_id = partial_store
+    client, source = _interrupted_upload(tmp_path, profile_id)
+    assert store.get(profile_id, UPLOAD, REMOTE_PATH, source).remote_signature is not None
+
+    client.chunk_bytes = source.stat().st_size
+    _upload(client, source, profile_id)
+
+    assert client.offsets[-1] == 3072
+    assert client.files[REMOTE_PATH] == source.read_bytes()
+    assert store.get(profile_id, UPLOAD, REMOTE_PATH, source) is None
+
+
+def test_upload_restarts_when_remote_changed(
+    tmp_path: Path,
+    partial_store: tuple[PartialTransferStore, int],
+) -> None:
+    _store, profile_id = partial_store
+    client, source = _interrupted_upload(tmp_path, profile_id)
+    client.replace_remote(REMOTE_PATH, b"\xff" * 3072)
+
+    client.chunk_bytes = source.stat().st_size
+    _upload(client, source, profile_id)
+
+    assert client.offsets[-1] == 0
+    assert client.files[REMOTE_PATH] == source.read_bytes()
+
+
+def test_resumed_progress_counts_bytes_the_client_sends_again(
+    tmp_path: Path,
+    partial_store: tuple[PartialTransferStore, int],
+) -> None:
+    _store, profile_id = partial_store
+    client, source = _interrupted_upload(tmp_path, profile_id)
+    client.chunk_bytes = source.stat().st_size
+    client.resume_alignment = 2048
+    progress = TransferProgress()
+    progress.add_total(source.stat().st_size)
+
+    _upload(client, source, profile_id, progress)
+
+    snapshot = progress.snapshot()
+    assert client.offsets[-1] == 2048
+    assert snapshot.bytes_done == snapshot.bytes_total == source.stat().st_size - 2048
+    assert client.files[REMOTE_PATH] == source.read_bytes()
+
+
+def test_upload_retries_do_not_count_resent_bytes_twice(
+    tmp_path: Path,
+    partial_store: tuple[PartialTransferStore, int],
+) -> None:
+    _store, profile_id = partial_store
+    source = tmp_path / "world"
+    source.write_bytes(bytes(range(256)) * 28)
+    client = FlakyUploadClient(chunk_bytes=3072, resume_alignment=2048)
+    progress = TransferProgress()
+    progress.add_total(source.stat().st_size)
+
+    _upload(client, source, profile_id, progress)
+
+    snapshot = progress.snapshot()
+    assert client.offsets == [0, 2048, 4096]
+    assert snapshot.bytes_done == snapshot.bytes_total == source.stat().st_size
+
+
+def test_download_retries_roll_progress_back_to_the_local_file(
+    tmp_path: Path,
+    partial_store: tuple[PartialTransferStore, int],
+) -> None:
+    _store, profile_id = partial_store
+    data = bytes(range(256)) * 12
+    client = FlakyDownloadClient(data, chunk_bytes=1536, flushed_bytes=1024)
+    entry = RemoteEntry(REMOTE_PATH, True, len(data), datetime(2026, 1, 1, tzinfo=timezone.utc))
+    target = tmp_path / "local" / "world"
+    progress = TransferProgress()
+    progress.add_total(len(data))
+
+    asyncio.run(execute_remote._download_remote_file(client, REMOTE_PATH, target, profile_id, entry, progress))
+
+    snapshot = progress.snapshot()
+    assert client.offsets == [0, 1024, 2048]
+    assert snapshot.bytes_done == snapshot.bytes_total == len(data)
+    assert target.read_bytes() == data
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import zstandard
+
+from benchmarks.save_tree import generate_save_tree
+from core.saves.scan_cache import ScanCache
+from core.saves.scanner_service import SaveScannerService
+from core.worldname.extractor import SearchBudget, SearchStop, search_world_name_in_bytes
+
+
+WORLD_NAME = "Ember Hollow"
+FRAME_COUNT = 6
+
+
+def _frame(index: int) -> bytes:
+    payload = b"\x01\x02".join(
+        [f"ProgressLevel{index}".encode("ascii"), WORLD_NAME.encode("utf-8"), b"Difficulty", WORLD_NAME.encode("utf-8")]
+    )
+    return zstandard.ZstdCompressor(level=3).compress(payload + b"\x00" * 64)
+
+
+@pytest.fixture()
+def info_bytes() -> bytes:
+    return b"".join(_frame(index) for index in range(FRAME_COUNT))
+
+
+def test_unbudgeted_search_reads_every_frame(info_bytes: bytes) -> None:
+    result = search_world_name_in_bytes(info_bytes)
+
+    assert result.best_guess == WORLD_NAME
+    assert result.stop == SearchStop.COMPLETE
+
+
+def test_confident_winner_stops_early_with_the_same_answer(info_bytes: bytes) -> None:
+    result = search_world_name_in_bytes(info_bytes, SearchBudget(confidence=0.5))
+
+    assert result.stop == SearchStop.CONFIDENT
+    assert result.best_guess == search_world_name_in_bytes(info_bytes).best_guess
+    assert result.is_deterministic
+
+
+def test_byte_budget_stops_after_the_budgeted_output(info_bytes: bytes) -> None:
+    first_payload = zstandard.ZstdDecompressor().decompress(_frame(0))
+    result = search_world_name_in_bytes(info_bytes, SearchBudget(max_bytes=len(first_payload)))
+    truncated = search_world_name_in_bytes(info_bytes, SearchBudget(max_bytes=first_payload.index(WORLD_NAME.encode("utf-8"))))
+
+    assert result.stop == SearchStop.BYTE_BUDGET
+    assert result.best_guess == WORLD_NAME
+    assert truncated.stop == SearchStop.BYTE_BUDGET
+    assert truncated.best_guess is None
+    assert result.is_deterministic
+
+
+def test_time_budget_result_is_not_deterministic(info_bytes: bytes) -> None:
+    result = search_world_name_in_bytes(info_bytes, SearchBudget(max_ms=0))
+
+    assert result.stop == SearchStop.TIME_BUDGET
+    assert not result.is_deterministic
+
+
+def test_cancellation_stops_between_frames(info_bytes: bytes) -> None:
+    checks = 0
+
+    def is_cancelled() -> bool:
+        nonlocal checks
+        checks += 1
+        return checks > 2
+
+    result = search_world_name_in_bytes(info_bytes, is_cancelled=is_cancelled)
+
+    assert result.stop == SearchStop.CANCELLED
+    assert checks == 3
+    assert not result.is_deterministic
+
+
+def test_cancelled_before_start_returns_nothing(info_bytes: bytes) -> None:
+    result = search_world_name_in_bytes(info_bytes, is_cancelled=lambda: True)
+
+    assert result == search_world_name_in_bytes(b"", is_cancelled=lambda: True)
+    assert result.best_guess is None
+    assert result.stop == SearchStop.CANCELLED
+
+
+def test_scanner_does_not_cache_names_from_time_budgeted_searches(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    tree = generate_save_tree(tmp_path / "tree", slots=2, rolls=1, steam_users=0, roll_size=1024)
+    root = tree.saved_games_root.resolve()
+    cache = ScanCache(cache_path=tmp_path / "scan-cache.json")
+    scanner = SaveScannerService(scan_cache=cache, world_name_budget=SearchBudget(max_ms=0), world_name_workers=1)
+
+    result = scanner.scan_singleplayer(root, incremental=True)
+
+    assert result.slots
+    for slot in result.slots:
+        cached = cache.get_slot(root, slot.world_id_hex)
+        assert cached is not None and not cached.info_resolved
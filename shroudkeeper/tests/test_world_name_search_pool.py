@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.save_tree import generate_save_tree
+from core.worldname import mapping
+from core.worldname.extractor import search_world_name
+from core.worldname.mapping import InfoFileSignature
+from core.worldname import search_pool as search_pool_module
+from core.system.process_pool import SpawnProcessPool
+from core.worldname.search_pool import should_use_process_pool
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _signatures(tmp_path: Path, slots: int) -> dict[str, InfoFileSignature]:
+    tree = generate_save_tree(tmp_path / "tree", slots=slots, rolls=1, steam_users=0, roll_size=1024)
+    signatures = {}
+    for path in tree.info_files:
+        stat_result = path.stat()
+        signatures[path.name] = InfoFileSignature(path, stat_result.st_size, stat_result.st_mtime_ns)
+    return signatures
+
+
+class RecordingSearchPool(SpawnProcessPool):
+    def __init__(self) -> None:
+        super().__init__()
+        self.executors: list[ProcessPoolExecutor] = []
+        self.submitted = 0
+
+    def executor(self, workers: int) -> ProcessPoolExecutor:
+        executor = super().executor(workers)
+        self.executors.append(executor)
+        if "submit" not in vars(executor):
+            submit = executor.submit
+
+            def counting_submit(*args, **kwargs):
+                self.submitted += 1
+                return submit(*args, **kwargs)
+
+            executor.submit = counting_submit
+        return executor
+
+
+@pytest.fixture()
+def search_pool(monkeypatch: pytest.MonkeyPatch) -> Iterator[RecordingSearchPool]:
+    pool = RecordingSearchPool()
+    monkeypatch.setattr(mapping, "get_world_name_search_pool", lambda: pool)
+    yield pool
+    pool.shutdown()
+
+
+def test_small_batches_resolve_inline_while_pool_is_cold(tmp_path: Path, search_pool: RecordingSearchPool) -> None:
+    signatures = _signatures(tmp_path, slots=4)
+    assert sum(signature.size_bytes for signature in signatures.values()) < search_pool_module.PROCESS_POOL_MIN_BYTES
+
+    results = mapping._search_info_files(signatures, None, 4, None, None)
+
+    assert results.keys() == signatures.keys()
+    assert search_pool.executors == []
+    assert not search_pool.is_warm
+
+
+def test_pool_starts_above_byte_threshold_and_is_reused_while_warm(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    search_pool: RecordingSearchPool,
+) -> None:
+    signatures = _signatures(tmp_path, slots=10)
+    expected = {prefix: search_world_name(signature.path).best_guess for prefix, signature in signatures.items()}
+
+    with monkeypatch.context() as patch:
+        patch.setattr(search_pool_module, "PROCESS_POOL_MIN_BYTES", 1)
+        first = mapping._search_info_files(signatures, None, 2, None, None)
+    two_slots = dict(list(signatures.items())[:2])
+    second = mapping._search_info_files(two_slots, None, 2, None, None)
+
+    assert len(search_pool.executors) == 2
+    assert search_pool.executors[0] is search_pool.executors[1]
+    assert search_pool.submitted == len(signatures) + len(two_slots)
+    assert {prefix: result.best_guess for prefix, result in first.items()} == expected
+    assert {prefix: result.best_guess for prefix, result in second.items()} == {
+        prefix: expected[prefix] for prefix in two_slots
+    }
+
+
+def test_single_miss_never_uses_pool() -> None:
+    assert not should_use_process_pool(1, 64 * 1024 * 1024, 1, warm=True)
+    assert should_use_process_pool(2, 0, 2, warm=True)
+    assert not should_use_process_pool(2, 0, 2, warm=False)
+
+
+def test_search_worker_imports_skip_qt_and_storage() -> None:
+    script = (
+        "import sys; import core.worldname.extractor, core.worldname.search_pool; "
+        "print(','.join(m for m in sys.modules if m.startswith(('PySide6', 'storage', 'sqlite3'))))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PACKAGE_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.strip() == ""
@@ -12,6 +12,10 @@ from core.automations.runner import AutomationRunner
 from core.automations.scheduler import AutomationScheduler
 from core.config import AppConfig
 from core.logging import LogEmitter
+from core.remote.connection_manager import get_connection_manager
+from core.saves.integrity import get_roll_verify_pool
+from core.saves.scan_coordinator import SaveScanCoordinator
+from core.worldname.search_pool import get_world_name_search_pool
 from i18n.i18n import get_i18n, tr
 from storage.repositories import AutomationJobRepository
 from ui.components.ev_window_title_bar import EVWindowTitleBar
@@ -43,6 +47,7 @@ class MainWindow(QMainWindow):
         self._automation_runner = AutomationRunner(connection=connection, config=config, logger=logger)
         self._automation_scheduler = AutomationScheduler(repository=AutomationJobRepository(connection))
         self._automation_scheduler.job_due.connect(self._automation_runner.run_job_id)
+        self._scan_coordinator = SaveScanCoordinator(logger=logger, parent=self)
 
         self._shell_widget: QWidget | None = None
         self._frameless_active = False
@@ -102,10 +107,21 @@ class MainWindow(QMainWindow):
             "singleplayer": SingleplayerView(
                 singleplayer_root=self._config.get_singleplayer_root(),
                 logger=self._logger,
+                scan_coordinator=self._scan_coordinator,
             ),
             "server": ServerView(connection=connection, config=self._config, logger=self._logger),
-            "transfers": TransfersView(connection=connection, config=self._config, logger=self._logger),
-            "backups": BackupsView(connection=connection, config=self._config, logger=self._logger),
+            "transfers": TransfersView(
+                connection=connection,
+                config=self._config,
+                logger=self._logger,
+                scan_coordinator=self._scan_coordinator,
+            ),
+            "backups": BackupsView(
+                connection=connection,
+                config=self._config,
+                logger=self._logger,
+                scan_coordinator=self._scan_coordinator,
+            ),
             "automations": AutomationsView(
                 connection=connection,
                 scheduler=self._automation_scheduler,
@@ -157,6 +173,10 @@ class MainWindow(QMainWindow):
         if app is not None:
             app.removeEventFilter(self)
         self._automation_scheduler.stop()
+        self._scan_coordinator.cancel_all()
+        get_connection_manager().shutdown()
+        get_world_name_search_pool().shutdown()
+        get_roll_verify_pool().shutdown()
         super().closeEvent(event)
 
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:
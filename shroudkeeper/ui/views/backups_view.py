@@ -41,8 +41,7 @@ from core.config import AppConfig
 from core.profiles.credentials import CredentialService
 from core.profiles.models import Profile
 from core.saves.models import SaveScanResult, SaveSlot
-from core.saves.scan_worker import SaveScanWorker
-from core.saves.scanner_service import SaveScannerService
+from core.saves.scan_coordinator import SaveScanCoordinator
 from core.system.process_check import can_write_singleplayer_files
 from core.transfers.execute_remote import join_remote
 from core.transfers.transfer_models import TransferDirection, TransferPlan, TransferResult
@@ -54,18 +53,25 @@ from ui.widgets.password_dialog import PasswordDialog
 
 
 class BackupsView(QWidget):
-    def __init__(self, connection: sqlite3.Connection, config: AppConfig, logger: logging.Logger) -> None:
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        config: AppConfig,
+        logger: logging.Logger,
+        scan_coordinator: SaveScanCoordinator,
+    ) -> None:
         super().__init__()
         self._logger = logger
         self._config = config
         self._repo = ProfileRepository(connection)
         self._credential_service = CredentialService()
 
-        self._scan_service = SaveScannerService(logger=logger)
-        self._scan_thread: QThread | None = None
-        self._scan_worker: SaveScanWorker | None = None
+        self._scan_coordinator = scan_coordinator
+        self._scan_pending = False
         self._scan_result: SaveScanResult | None = None
         self._slots_by_number: dict[int, SaveSlot] = {}
+        self._scan_coordinator.slot_changed.connect(self._on_watched_slot_changed)
+        self._scan_coordinator.result_changed.connect(self._on_watched_result_changed)
 
         self._backup_thread: QThread | None = None
         self._backup_worker: SingleplayerBackupWorker | ServerBackupWorker | TransferWorker | None = None
@@ -286,29 +292,19 @@ class BackupsView(QWidget):
         self._refresh_backup_list()
 
     def _start_local_scan(self) -> None:
-        if self._scan_thread is not None:
+        if self._scan_pending:
             return
 
         root = Path(self._config.get_singleplayer_root())
-
-        thread = QThread(self)
-        worker = SaveScanWorker(scanner=self._scan_service, root=root)
-        worker.moveToThread(thread)
-
-        thread.started.connect(worker.run)
-        worker.finished.connect(self._on_scan_finished)
-        worker.failed.connect(self._on_scan_failed)
-        worker.finished.connect(thread.quit)
-        worker.failed.connect(thread.quit)
-        thread.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
-        thread.finished.connect(self._on_scan_closed)
-
-        self._scan_thread = thread
-        self._scan_worker = worker
-        thread.start()
+        self._scan_pending = True
+        self._scan_coordinator.request_scan(
+            root,
+            on_finished=self._on_scan_finished,
+            on_failed=self._on_scan_failed,
+        )
 
     def _on_scan_finished(self, result: object) -> None:
+        self._on_scan_closed()
         if not isinstance(result, SaveScanResult):
             return
 
@@ -316,12 +312,43 @@ class BackupsView(QWidget):
         self._slots_by_number = {slot.slot_number: slot for slot in result.slots}
         self._populate_slot_list()
 
+    def _on_watched_slot_changed(self, root: object, slot_number: int, slot: object) -> None:
+        if self._scan_pending or self._scan_result is None or root != self._scan_result.root:
+            return
+
+        known_before = slot_number in self._slots_by_number
+        if isinstance(slot, SaveSlot):
+            self._slots_by_number[slot_number] = slot
+        else:
+            self._slots_by_number.pop(slot_number, None)
+
+        if known_before != isinstance(slot, SaveSlot):
+            self._populate_slot_list()
+            return
+
+        if not isinstance(slot, SaveSlot):
+            return
+
+        for idx in range(self._slots_list.count()):
+            item = self._slots_list.item(idx)
+            if item is not None and item.data(Qt.ItemDataRole.UserRole) == slot_number:
+                self._slots_list.blockSignals(True)
+                item.setText(tr("backups.slot_item", slot=slot_number, name=slot.display_name))
+                self._slots_list.blockSignals(False)
+                return
+
+    def _on_watched_result_changed(self, result: object) -> None:
+        if not isinstance(result, SaveScanResult) or self._scan_pending:
+            return
+        if self._scan_result is not None and result.root == self._scan_result.root:
+            self._scan_result = result
+
     def _on_scan_failed(self, message: str) -> None:
+        self._on_scan_closed()
         self._status_label.setText(tr("backups.status.scan_failed", error=message))
 
     def _on_scan_closed(self) -> None:
-        self._scan_thread = None
-        self._scan_worker = None
+        self._scan_pending = False
         self._update_create_buttons_state()
 
     def _reload_profiles(self) -> None:
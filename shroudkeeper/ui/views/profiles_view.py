@@ -25,10 +25,11 @@ from PySide6.QtWidgets import (
 from core.config import AppConfig
 from core.profiles.credentials import CredentialService
 from core.profiles.models import Profile
-from core.remote.client_factory import create_client
+from core.remote.connection_manager import get_connection_manager
 from core.remote.test_worker import RemoteTestWorker
 from core.server.server_models import ServerScanResult
 from core.server.server_world_service import ServerWorldService
+from core.transfers.partial_transfers import get_partial_transfer_store
 from i18n.i18n import get_i18n, tr
 from storage.repositories import ProfileRepository
 from ui.components.ev_page_header import EVPageHeader
@@ -253,12 +254,17 @@ class ProfilesView(QWidget):
         dialog.exec()
 
     async def _scan_profile_world(self, profile: Profile, password: str):
-        client = create_client(profile=profile, password=password, logger=self._logger)
-        success, message = await client.test_connection()
-        if not success:
-            raise RuntimeError(message)
-        service = ServerWorldService(logger=self._logger)
-        return await service.scan_server_world(client=client, remote_root=profile.remote_path)
+        client = get_connection_manager().client(profile=profile, password=password, logger=self._logger)
+        async with client.session():
+            success, message = await client.test_connection()
+            if not success:
+                raise RuntimeError(message)
+            service = ServerWorldService(logger=self._logger)
+            return await service.scan_server_world(
+                client=client,
+                remote_root=profile.remote_path,
+                profile_id=profile.id,
+            )
 
     def _rollback_profile_world_sync(
         self,
@@ -273,21 +279,26 @@ class ProfilesView(QWidget):
             return False, str(error), None
 
     async def _rollback_profile_world(self, profile: Profile, password: str, roll_index: int):
-        client = create_client(profile=profile, password=password, logger=self._logger)
-        success, message = await client.test_connection()
-        if not success:
-            raise RuntimeError(message)
-
-        service = ServerWorldService(logger=self._logger)
-        write_ok, write_message = await service.write_latest(
-            client=client,
-            remote_root=profile.remote_path,
-            latest=roll_index,
-        )
-        if not write_ok:
-            raise RuntimeError(write_message)
+        client = get_connection_manager().client(profile=profile, password=password, logger=self._logger)
+        async with client.session():
+            success, message = await client.test_connection()
+            if not success:
+                raise RuntimeError(message)
+
+            service = ServerWorldService(logger=self._logger)
+            write_ok, write_message = await service.write_latest(
+                client=client,
+                remote_root=profile.remote_path,
+                latest=roll_index,
+            )
+            if not write_ok:
+                raise RuntimeError(write_message)
 
-        return await service.scan_server_world(client=client, remote_root=profile.remote_path)
+            return await service.scan_server_world(
+                client=client,
+                remote_root=profile.remote_path,
+                profile_id=profile.id,
+            )
 
     def _open_profile_config(self, profile_id: int) -> None:
         profile = self._repo.get_profile(profile_id)
@@ -318,17 +329,18 @@ class ProfilesView(QWidget):
         QMessageBox.information(self, tr("common.ok"), tr("profiles.config.saved"))
 
     async def _download_server_config(self, profile: Profile, password: str) -> tuple[str, dict[str, object]]:
-        client = create_client(profile=profile, password=password, logger=self._logger)
-        success, message = await client.test_connection()
-        if not success:
-            raise RuntimeError(message)
-
+        client = get_connection_manager().client(profile=profile, password=password, logger=self._logger)
         normalized_remote_root = "/" + "/".join(part for part in profile.remote_path.strip().split("/") if part)
         normalized_remote_root = normalized_remote_root if normalized_remote_root != "" else "/"
         config_dir = str(PurePosixPath(normalized_remote_root).parent)
         config_path = str(PurePosixPath(config_dir) / "enshrouded_server.json")
 
-        read_ok, read_message, payload_bytes = await client.read_file_bytes(config_path, max_bytes=2 * 1024 * 1024)
+        async with client.session():
+            success, message = await client.test_connection()
+            if not success:
+                raise RuntimeError(message)
+
+            read_ok, read_message, payload_bytes = await client.read_file_bytes(config_path, max_bytes=2 * 1024 * 1024)
         if not read_ok or payload_bytes is None:
             raise RuntimeError(read_message)
 
@@ -349,13 +361,14 @@ class ProfilesView(QWidget):
         config_path: str,
         payload: dict[str, object],
     ) -> None:
-        client = create_client(profile=profile, password=password, logger=self._logger)
-        success, message = await client.test_connection()
-        if not success:
-            raise RuntimeError(message)
-
+        client = get_connection_manager().client(profile=profile, password=password, logger=self._logger)
         data = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
-        upload_ok, upload_message, _bytes_written = await client.upload_bytes(config_path, data)
+        async with client.session():
+            success, message = await client.test_connection()
+            if not success:
+                raise RuntimeError(message)
+
+            upload_ok, upload_message, _bytes_written = await client.upload_bytes(config_path, data)
         if not upload_ok:
             raise RuntimeError(upload_message)
 
@@ -430,6 +443,7 @@ class ProfilesView(QWidget):
             return
 
         if profile.id is not None:
+            get_partial_transfer_store().abandon_profile(profile.id)
             self._repo.delete_profile(profile.id)
             self._config.remove_profile_connection_status(profile.id)
             try:
@@ -1,9 +1,7 @@
 from __future__ import annotations
 
 import logging
-import os
 from pathlib import Path
-import re
 
 from PySide6.QtCore import Qt, QThread, QTimer, QUrl, Signal
 from PySide6.QtGui import QDesktopServices
@@ -25,9 +23,9 @@ from PySide6.QtWidgets import (
 )
 
 from core.paths import get_default_singleplayer_root
-from core.saves.models import SaveScanResult, SaveSlot
-from core.saves.scan_worker import SaveScanWorker
-from core.saves.scanner_service import SaveScannerService
+from core.saves.models import SaveRootCandidate, SaveScanResult, SaveSlot
+from core.saves.root_discovery import SaveRootDiscoveryService, SaveRootDiscoveryWorker
+from core.saves.scan_coordinator import SaveScanCoordinator
 from i18n.i18n import get_i18n, tr
 from ui.components.ev_page_header import EVPageHeader
 from ui.widgets.slot_details_dialog import SlotDetailsDialog
@@ -37,19 +35,29 @@ from ui.widgets.warnings_dialog import WarningsDialog
 class SingleplayerView(QWidget):
     singleplayer_root_selected = Signal(str)
 
-    def __init__(self, singleplayer_root: str, logger: logging.Logger) -> None:
+    def __init__(
+        self,
+        singleplayer_root: str,
+        logger: logging.Logger,
+        scan_coordinator: SaveScanCoordinator,
+    ) -> None:
         super().__init__()
         self._logger = logger
         self._scan_root = Path(singleplayer_root)
-        self._scanner = SaveScannerService(logger=logger)
+        self._scan_coordinator = scan_coordinator
         self._current_result: SaveScanResult | None = None
         self._slot_by_number: dict[int, SaveSlot] = {}
         self._slot_rows: list[SaveSlot] = []
-        self._scan_thread: QThread | None = None
-        self._scan_worker: SaveScanWorker | None = None
+        self._scan_pending = False
+        self._discovery_service = SaveRootDiscoveryService(logger=logger)
+        self._discovery_thread: QThread | None = None
+        self._discovery_worker: SaveRootDiscoveryWorker | None = None
         self._initialized_scan = False
         self._warnings: list[str] = []
 
+        self._scan_coordinator.slot_changed.connect(self._on_watched_slot_changed)
+        self._scan_coordinator.result_changed.connect(self._on_watched_result_changed)
+
         root_layout = QVBoxLayout(self)
         root_layout.setContentsMargins(16, 16, 16, 16)
         root_layout.setSpacing(12)
@@ -170,20 +178,56 @@ class SingleplayerView(QWidget):
             return
 
         self._initialized_scan = True
-        self._auto_detect_and_apply_root()
-        self.start_scan()
+        self._start_root_discovery()
 
-    def _auto_detect_and_apply_root(self) -> None:
-        discovered = self._discover_savegame_roots()
-        if len(discovered) == 0:
+    def _start_root_discovery(self) -> None:
+        if self._discovery_thread is not None:
             return
 
-        scored_candidates = sorted(
-            ((path, self._candidate_score(path)) for path in discovered),
-            key=lambda item: item[1],
-            reverse=True,
+        self._scan_button.setEnabled(False)
+
+        thread = QThread(self)
+        worker = SaveRootDiscoveryWorker(
+            service=self._discovery_service,
+            configured_root=self._singleplayer_root_edit.text().strip(),
         )
-        best_score = scored_candidates[0][1]
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_root_discovery_finished)
+        worker.failed.connect(self._on_root_discovery_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_root_discovery_closed)
+
+        self._discovery_thread = thread
+        self._discovery_worker = worker
+        thread.start()
+
+    def _on_root_discovery_finished(self, ranked: object) -> None:
+        if isinstance(ranked, list):
+            self._auto_detect_and_apply_root([item for item in ranked if isinstance(item, SaveRootCandidate)])
+        self._request_scan(SaveScanCoordinator.DEFAULT_MAX_AGE_SECONDS)
+
+    def _on_root_discovery_failed(self, error_message: str) -> None:
+        self._logger.warning("Save root discovery failed: %s", error_message)
+        self._request_scan(SaveScanCoordinator.DEFAULT_MAX_AGE_SECONDS)
+
+    def _on_root_discovery_closed(self) -> None:
+        self._discovery_thread = None
+        self._discovery_worker = None
+        if not self._scan_pending:
+            self._scan_button.setEnabled(True)
+
+    def _auto_detect_and_apply_root(self, ranked: list[SaveRootCandidate]) -> None:
+        if len(ranked) == 0:
+            return
+
+        discovered = [candidate.path for candidate in ranked]
+        scores = {candidate.path: candidate.score for candidate in ranked}
+        best_score = ranked[0].score
         has_detected_saves = best_score[0] > 0
 
         try:
@@ -191,13 +235,13 @@ class SingleplayerView(QWidget):
         except Exception:
             current = self._scan_root
 
-        current_score = self._candidate_score(current)
+        current_score = scores.get(current, (0, 0))
 
         if current in discovered and (not has_detected_saves or current_score >= best_score):
             self.set_scan_root(str(current))
             return
 
-        preferred_candidates = [path for path, score in scored_candidates if score == best_score]
+        preferred_candidates = [candidate.path for candidate in ranked if candidate.score == best_score]
 
         if len(preferred_candidates) == 1:
             chosen = preferred_candidates[0]
@@ -221,62 +265,6 @@ class SingleplayerView(QWidget):
             self.set_scan_root(str(chosen))
             self._singleplayer_status.setText(tr("singleplayer.auto_detect.selected", path=str(chosen)))
 
-    def _candidate_score(self, candidate: Path) -> tuple[int, int]:
-        try:
-            root = candidate.expanduser().resolve()
-        except Exception:
-            return (0, 0)
-
-        if not root.exists() or not root.is_dir():
-            return (0, 0)
-
-        patterns = [
-            re.compile(r"^[0-9a-fA-F]{8}(?:-[0-9])?$"),
-            re.compile(r"^[0-9a-fA-F]{8}-index$"),
-            re.compile(r"^[0-9a-fA-F]{8}_info(?:-[0-9]+)?$"),
-            re.compile(r"^[0-9a-fA-F]{8}_info-index$"),
-        ]
-
-        hit_count = 0
-        try:
-            for child in root.iterdir():
-                if not child.is_file():
-                    continue
-                if any(pattern.match(child.name) for pattern in patterns):
-                    hit_count += 1
-        except OSError:
-            return (0, 0)
-
-        return (1 if hit_count > 0 else 0, hit_count)
-
-    def _discover_savegame_roots(self) -> list[Path]:
-        candidates: list[Path] = []
-
-        current_cfg = self._singleplayer_root_edit.text().strip()
-        if current_cfg != "":
-            candidates.append(Path(current_cfg))
-
-        userprofile = os.getenv("USERPROFILE")
-        if userprofile:
-            candidates.append(Path(userprofile) / "Saved Games" / "enshrouded")
-
-        steam_install_dir = os.getenv("STEAMINSTALLDIRECTORY")
-        if steam_install_dir:
-            candidates.extend((Path(steam_install_dir) / "userdata").glob("*/1203620/remote"))
-
-        candidates.extend((Path(r"C:\Program Files (x86)\Steam\userdata")).glob("*/1203620/remote"))
-
-        unique: dict[str, Path] = {}
-        for candidate in candidates:
-            try:
-                normalized = candidate.expanduser().resolve()
-            except Exception:
-                continue
-            if normalized.exists() and normalized.is_dir():
-                unique[str(normalized).lower()] = normalized
-
-        return sorted(unique.values(), key=lambda path: str(path).lower())
-
     def set_scan_root(self, root_path: str) -> None:
         self._scan_root = Path(root_path)
         self._singleplayer_root_edit.setText(str(self._scan_root))
@@ -301,37 +289,30 @@ class SingleplayerView(QWidget):
         self.singleplayer_root_selected.emit(selected_root)
         self.set_scan_root(selected_root)
         self._singleplayer_status.setText(tr("settings.saved"))
-        self.start_scan()
+        self._request_scan(SaveScanCoordinator.DEFAULT_MAX_AGE_SECONDS)
 
     def start_scan(self) -> None:
-        if self._scan_thread is not None:
+        self._request_scan(0)
+
+    def _request_scan(self, max_age_seconds: float) -> None:
+        if self._scan_pending:
             return
 
+        self._scan_pending = True
         self._scan_button.setEnabled(False)
+        self._scan_coordinator.request_scan(
+            self._scan_root,
+            on_finished=self._on_scan_finished,
+            on_failed=self._on_scan_failed,
+            max_age_seconds=max_age_seconds,
+        )
 
-        thread = QThread(self)
-        worker = SaveScanWorker(scanner=self._scanner, root=self._scan_root)
-        worker.moveToThread(thread)
-
-        thread.started.connect(worker.run)
-        worker.finished.connect(self._on_scan_finished)
-        worker.failed.connect(self._on_scan_failed)
-        worker.finished.connect(thread.quit)
-        worker.failed.connect(thread.quit)
-        thread.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
-        thread.finished.connect(self._on_scan_thread_closed)
-
-        self._scan_thread = thread
-        self._scan_worker = worker
-        thread.start()
-
-    def _on_scan_thread_closed(self) -> None:
-        self._scan_thread = None
-        self._scan_worker = None
+    def _on_scan_closed(self) -> None:
+        self._scan_pending = False
         self._scan_button.setEnabled(True)
 
     def _on_scan_finished(self, result: object) -> None:
+        self._on_scan_closed()
         if not isinstance(result, SaveScanResult):
             return
 
@@ -345,7 +326,38 @@ class SingleplayerView(QWidget):
         if len(self._warnings) > 0:
             self._logger.info(tr("dashboard.scan.finished_with_warnings", count=len(self._warnings)))
 
+    def _on_watched_slot_changed(self, root: object, slot_number: int, slot: object) -> None:
+        if self._scan_pending or self._current_result is None or root != self._current_result.root:
+            return
+
+        if not isinstance(slot, SaveSlot):
+            self._slot_by_number.pop(slot_number, None)
+            self._slot_rows = [row_slot for row_slot in self._slot_rows if row_slot.slot_number != slot_number]
+            self._refresh_slots_table()
+            return
+
+        self._slot_by_number[slot_number] = slot
+        for row, row_slot in enumerate(self._slot_rows):
+            if row_slot.slot_number == slot_number:
+                self._slot_rows[row] = slot
+                self._update_slot_row(row, slot)
+                return
+
+        self._slot_rows = sorted([*self._slot_rows, slot], key=lambda value: value.slot_number)
+        self._refresh_slots_table()
+
+    def _on_watched_result_changed(self, result: object) -> None:
+        if not isinstance(result, SaveScanResult) or self._scan_pending:
+            return
+        if self._current_result is None or result.root != self._current_result.root:
+            return
+
+        self._current_result = result
+        self._warnings = list(result.warnings)
+        self._update_warnings_badge()
+
     def _on_scan_failed(self, error_message: str) -> None:
+        self._on_scan_closed()
         self._logger.error("Save scan failed: %s", error_message)
         self._warnings = [tr("dashboard.scan.failed", error=error_message)]
         self._update_warnings_badge()
@@ -404,32 +416,35 @@ class SingleplayerView(QWidget):
 
         self._slots_table.setRowCount(len(self._slot_rows))
         for row, slot in enumerate(self._slot_rows):
-            slot_number = slot.slot_number
-
-            values = [
-                str(slot.slot_number),
-                slot.display_name,
-                slot.world_id_hex,
-                self._format_latest(slot.latest),
-                self._format_datetime(slot.last_modified),
-                self._format_size(slot.total_size_bytes),
-            ]
-
-            for column, value in enumerate(values):
-                item = self._slots_table.item(row, column)
-                if item is None:
-                    item = QTableWidgetItem()
-                    self._slots_table.setItem(row, column, item)
-
-                item.setText(value)
-                item.setData(Qt.ItemDataRole.UserRole, slot_number)
-                if column == 1:
-                    item.setToolTip(self._world_name_source_tooltip(slot.world_name_source))
+            self._update_slot_row(row, slot)
+
+    def _update_slot_row(self, row: int, slot: SaveSlot) -> None:
+        slot_number = slot.slot_number
+
+        values = [
+            str(slot.slot_number),
+            slot.display_name,
+            slot.world_id_hex,
+            self._format_latest(slot.latest),
+            self._format_datetime(slot.last_modified),
+            self._format_size(slot.total_size_bytes),
+        ]
 
-            action_widget = self._slots_table.cellWidget(row, 6)
-            if action_widget is None:
-                action_widget = self._build_actions_widget(slot_number)
-                self._slots_table.setCellWidget(row, 6, action_widget)
+        for column, value in enumerate(values):
+            item = self._slots_table.item(row, column)
+            if item is None:
+                item = QTableWidgetItem()
+                self._slots_table.setItem(row, column, item)
+
+            item.setText(value)
+            item.setData(Qt.ItemDataRole.UserRole, slot_number)
+            if column == 1:
+                item.setToolTip(self._world_name_source_tooltip(slot.world_name_source))
+
+        action_widget = self._slots_table.cellWidget(row, 6)
+        if action_widget is None:
+            action_widget = self._build_actions_widget(slot_number)
+            self._slots_table.setCellWidget(row, 6, action_widget)
 
     def _world_name_source_tooltip(self, source: str) -> str:
         if source == "mapping":
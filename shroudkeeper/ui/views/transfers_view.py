@@ -24,8 +24,7 @@ from core.config import AppConfig
 from core.profiles.credentials import CredentialService
 from core.profiles.models import Profile
 from core.saves.models import SaveScanResult, SaveSlot
-from core.saves.scan_worker import SaveScanWorker
-from core.saves.scanner_service import SaveScannerService
+from core.saves.scan_coordinator import SaveScanCoordinator
 from core.saves.world_slots import WORLD_SLOT_MAPPING
 from core.server.server_models import ServerScanResult
 from core.server.server_scan_worker import ServerScanWorker
@@ -41,16 +40,23 @@ from ui.widgets.password_dialog import PasswordDialog
 
 
 class TransfersView(QWidget):
-    def __init__(self, connection: sqlite3.Connection, config: AppConfig, logger: logging.Logger) -> None:
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        config: AppConfig,
+        logger: logging.Logger,
+        scan_coordinator: SaveScanCoordinator,
+    ) -> None:
         super().__init__()
         self._logger = logger
         self._config = config
         self._repo = ProfileRepository(connection)
         self._credential_service = CredentialService()
 
-        self._scan_service = SaveScannerService(logger=logger)
-        self._scan_thread: QThread | None = None
-        self._scan_worker: SaveScanWorker | None = None
+        self._scan_coordinator = scan_coordinator
+        self._scan_pending = False
+        self._scan_coordinator.slot_changed.connect(self._on_watched_slot_changed)
+        self._scan_coordinator.result_changed.connect(self._on_watched_result_changed)
 
         self._server_scan_thread: QThread | None = None
         self._server_scan_worker: ServerScanWorker | None = None
@@ -195,6 +201,9 @@ class TransfersView(QWidget):
         self._confirm_overwrite_checkbox.setChecked(True)
         action_layout.addWidget(self._confirm_overwrite_checkbox)
 
+        self._skip_identical_checkbox = QCheckBox()
+        action_layout.addWidget(self._skip_identical_checkbox)
+
         self._start_button = QPushButton()
         self._start_button.setProperty("variant", "primary")
         self._start_button.setProperty("fullWidth", True)
@@ -252,33 +261,25 @@ class TransfersView(QWidget):
         self._reload_roll_options()
         self._update_start_button_state()
 
-    def _start_local_scan(self) -> None:
-        if self._scan_thread is not None:
+    def _start_local_scan(self, max_age_seconds: float = SaveScanCoordinator.DEFAULT_MAX_AGE_SECONDS) -> None:
+        if self._scan_pending:
             return
 
         root = Path(self._config.get_singleplayer_root())
+        self._scan_pending = True
         self._set_busy_state(True)
         self._status_label.setText(tr("transfers.progress.preparing"))
         self._update_progress_section_visibility()
 
-        thread = QThread(self)
-        worker = SaveScanWorker(scanner=self._scan_service, root=root)
-        worker.moveToThread(thread)
-
-        thread.started.connect(worker.run)
-        worker.finished.connect(self._on_local_scan_finished)
-        worker.failed.connect(self._on_local_scan_failed)
-        worker.finished.connect(thread.quit)
-        worker.failed.connect(thread.quit)
-        thread.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
-        thread.finished.connect(self._on_local_scan_closed)
-
-        self._scan_thread = thread
-        self._scan_worker = worker
-        thread.start()
+        self._scan_coordinator.request_scan(
+            root,
+            on_finished=self._on_local_scan_finished,
+            on_failed=self._on_local_scan_failed,
+            max_age_seconds=max_age_seconds,
+        )
 
     def _on_local_scan_finished(self, result: object) -> None:
+        self._on_local_scan_closed()
         if not isinstance(result, SaveScanResult):
             return
 
@@ -287,13 +288,47 @@ class TransfersView(QWidget):
         self._populate_source_slots()
         self._reload_roll_options()
 
+    def _on_watched_slot_changed(self, root: object, slot_number: int, slot: object) -> None:
+        if self._scan_pending or self._transfer_thread is not None:
+            return
+        if self._scan_result is None or root != self._scan_result.root:
+            return
+
+        known_before = slot_number in self._source_slots
+        if isinstance(slot, SaveSlot):
+            self._source_slots[slot_number] = slot
+        else:
+            self._source_slots.pop(slot_number, None)
+
+        if known_before != isinstance(slot, SaveSlot):
+            self._populate_source_slots()
+            self._reload_roll_options()
+            return
+
+        if isinstance(slot, SaveSlot):
+            index = self._source_slot_combo.findData(slot_number)
+            if index >= 0:
+                self._source_slot_combo.setItemText(
+                    index,
+                    tr("transfers.slot_item", slot=slot_number, name=slot.display_name),
+                )
+
+        if self._source_slot_combo.currentData() == slot_number:
+            self._reload_roll_options()
+
+    def _on_watched_result_changed(self, result: object) -> None:
+        if not isinstance(result, SaveScanResult) or self._scan_pending:
+            return
+        if self._scan_result is not None and result.root == self._scan_result.root:
+            self._scan_result = result
+
     def _on_local_scan_failed(self, message: str) -> None:
+        self._on_local_scan_closed()
         self._status_label.setText(tr("transfers.status.scan_failed", error=message))
         self._update_progress_section_visibility()
 
     def _on_local_scan_closed(self) -> None:
-        self._scan_thread = None
-        self._scan_worker = None
+        self._scan_pending = False
         self._set_busy_state(False)
         self._update_start_button_state()
 
@@ -366,6 +401,7 @@ class TransfersView(QWidget):
             self._status_label.setText(tr("transfers.error.no_selection"))
             self._update_start_button_state()
             return
+        plan.skip_identical = self._skip_identical_checkbox.isChecked()
 
         if self._writes_local(plan.direction) and not can_write_singleplayer_files():
             self._status_label.setText(singleplayer_write_block_message())
@@ -450,16 +486,23 @@ class TransfersView(QWidget):
         if not isinstance(result, TransferResult):
             return
 
-        self._logger.info("Transfer success files=%s bytes=%s", result.files_copied, result.bytes_copied)
+        self._logger.info(
+            "Transfer success files=%s bytes=%s skipped_files=%s skipped_bytes=%s elapsed=%.1fs throughput=%.2f MB/s",
+            result.files_copied,
+            result.bytes_copied,
+            result.files_skipped,
+            result.bytes_skipped,
+            result.elapsed_seconds,
+            result.bytes_per_second / 1_000_000,
+        )
         self._status_label.setText(tr("transfers.status.finished"))
         self._update_progress_section_visibility()
-        QMessageBox.information(
-            self,
-            tr("transfers.success.title"),
-            tr("transfers.success.text", files=result.files_copied, bytes=result.bytes_copied),
-        )
+        text = tr("transfers.success.text", files=result.files_copied, bytes=result.bytes_copied)
+        if result.files_skipped > 0:
+            text = f"{text}\n{tr('transfers.success.skipped', files=result.files_skipped, bytes=result.bytes_skipped)}"
+        QMessageBox.information(self, tr("transfers.success.title"), text)
 
-        self._start_local_scan()
+        self._start_local_scan(max_age_seconds=0)
 
     def _on_transfer_error(self, message: str) -> None:
         self._logger.error("Transfer failed: %s", message)
@@ -700,6 +743,7 @@ class TransfersView(QWidget):
         self._target_slot_combo.setEnabled(controls_enabled and self._target_kind() == "singleplayer")
         self._target_server_profile_combo.setEnabled(controls_enabled and self._target_kind() == "server")
         self._confirm_overwrite_checkbox.setEnabled(controls_enabled)
+        self._skip_identical_checkbox.setEnabled(controls_enabled)
         self._start_button.setEnabled(controls_enabled)
         self._update_progress_section_visibility()
 
@@ -782,7 +826,7 @@ class TransfersView(QWidget):
         self._roll_badge.setVisible(True)
 
     def _update_progress_section_visibility(self) -> None:
-        is_busy = self._transfer_thread is not None or self._scan_thread is not None or self._server_scan_thread is not None
+        is_busy = self._transfer_thread is not None or self._scan_pending or self._server_scan_thread is not None
         self._progress_section.setVisible(is_busy)
 
     def _ensure_server_scan_started(self) -> None:
@@ -866,7 +910,7 @@ class TransfersView(QWidget):
         self._server_profile_info.setVisible(False)
 
     def _update_start_button_state(self) -> None:
-        enabled = self._transfer_thread is None and self._scan_thread is None and self._server_scan_thread is None
+        enabled = self._transfer_thread is None and not self._scan_pending and self._server_scan_thread is None
 
         if self._source_kind() == "server" and self._server_result is None:
             enabled = False
@@ -924,6 +968,7 @@ class TransfersView(QWidget):
 
         self._action_title.setText(tr("transfers.action"))
         self._confirm_overwrite_checkbox.setText(tr("transfers.confirm_overwrite"))
+        self._skip_identical_checkbox.setText(tr("transfers.skip_identical"))
         self._start_button.setText(tr("transfers.start"))
 
         if self._status_label.text().strip() == "":
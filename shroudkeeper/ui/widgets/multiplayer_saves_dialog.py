@@ -92,15 +92,16 @@ class MultiplayerSavesDialog(QDialog):
             if self._result.latest is not None
             else tr("common.not_available")
         )
-        self._summary.setText(
-            tr(
-                "server.summary.result",
-                world_id=self._result.world_id_hex,
-                remote_root=self._result.remote_root,
-                latest=latest_text,
-                warnings=tr("server.summary.warnings", count=len(self._result.warnings)),
-            )
+        summary_text = tr(
+            "server.summary.result",
+            world_id=self._result.world_id_hex,
+            remote_root=self._result.remote_root,
+            latest=latest_text,
+            warnings=tr("server.summary.warnings", count=len(self._result.warnings)),
         )
+        if self._result.world_name:
+            summary_text = f"{tr('server.summary.world_name', name=self._result.world_name)} · {summary_text}"
+        self._summary.setText(summary_text)
 
         self._table.setHorizontalHeaderLabels(
             [
@@ -16,7 +16,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from core.profiles.models import Profile
+from core.profiles.models import DEFAULT_TRANSFER_CONCURRENCY, MAX_TRANSFER_CONCURRENCY, Profile
+from core.remote.transfer_tuning import MAX_FTP_BLOCK_SIZE, MAX_SFTP_BLOCK_SIZE, MAX_SFTP_REQUESTS
 from i18n.i18n import get_i18n, tr
 
 
@@ -75,6 +76,26 @@ class ProfileDialog(QDialog):
         self._verify_host_key_input = QCheckBox()
         self._form.addRow(self._build_label("verify_host_key"), self._verify_host_key_input)
 
+        self._transfer_concurrency_input = QSpinBox()
+        self._transfer_concurrency_input.setRange(1, MAX_TRANSFER_CONCURRENCY)
+        self._form.addRow(self._build_label("transfer_concurrency"), self._transfer_concurrency_input)
+
+        self._transfer_block_size_input = QSpinBox()
+        self._transfer_block_size_input.setRange(0, MAX_FTP_BLOCK_SIZE // 1024)
+        self._transfer_block_size_input.setSingleStep(32)
+        self._transfer_block_size_input.setSuffix(" KiB")
+        self._form.addRow(self._build_label("transfer_block_size"), self._transfer_block_size_input)
+
+        self._transfer_max_requests_input = QSpinBox()
+        self._transfer_max_requests_input.setRange(0, MAX_SFTP_REQUESTS)
+        self._form.addRow(self._build_label("transfer_max_requests"), self._transfer_max_requests_input)
+
+        self._ssh_compression_input = QCheckBox()
+        self._form.addRow(self._build_label("ssh_compression"), self._ssh_compression_input)
+
+        self._transfer_auto_tune_input = QCheckBox()
+        self._form.addRow(self._build_label("transfer_auto_tune"), self._transfer_auto_tune_input)
+
         layout.addLayout(self._form)
 
         button_row = QHBoxLayout()
@@ -108,6 +129,11 @@ class ProfileDialog(QDialog):
             self._remote_path_input.setText("/savegame")
             self._passive_mode_input.setChecked(True)
             self._verify_host_key_input.setChecked(True)
+            self._transfer_concurrency_input.setValue(DEFAULT_TRANSFER_CONCURRENCY)
+            self._transfer_block_size_input.setValue(0)
+            self._transfer_max_requests_input.setValue(0)
+            self._ssh_compression_input.setChecked(False)
+            self._transfer_auto_tune_input.setChecked(False)
         else:
             self._name_input.setText(self._source_profile.name)
             self._host_input.setText(self._source_profile.host)
@@ -115,6 +141,11 @@ class ProfileDialog(QDialog):
             self._remote_path_input.setText(self._source_profile.remote_path)
             self._passive_mode_input.setChecked(self._source_profile.passive_mode)
             self._verify_host_key_input.setChecked(self._source_profile.verify_host_key)
+            self._transfer_concurrency_input.setValue(self._source_profile.transfer_concurrency)
+            self._transfer_block_size_input.setValue(self._source_profile.transfer_block_size // 1024)
+            self._transfer_max_requests_input.setValue(self._source_profile.transfer_max_requests)
+            self._ssh_compression_input.setChecked(self._source_profile.ssh_compression)
+            self._transfer_auto_tune_input.setChecked(self._source_profile.transfer_auto_tune)
 
         self._protocol_input.clear()
         self._protocol_input.addItem("FTP", "ftp")
@@ -145,15 +176,24 @@ class ProfileDialog(QDialog):
         protocol = str(self._protocol_input.currentData())
         is_sftp = protocol == "sftp"
 
-        self._passive_mode_input.setVisible(not is_sftp)
-        self._verify_host_key_input.setVisible(is_sftp)
+        max_block_size = MAX_SFTP_BLOCK_SIZE if is_sftp else MAX_FTP_BLOCK_SIZE
+        self._transfer_block_size_input.setMaximum(max_block_size // 1024)
 
+        self._passive_mode_input.setVisible(not is_sftp)
         passive_label = self._form.labelForField(self._passive_mode_input)
-        verify_label = self._form.labelForField(self._verify_host_key_input)
         if passive_label is not None:
             passive_label.setVisible(not is_sftp)
-        if verify_label is not None:
-            verify_label.setVisible(is_sftp)
+
+        for field in (
+            self._verify_host_key_input,
+            self._transfer_concurrency_input,
+            self._transfer_max_requests_input,
+            self._ssh_compression_input,
+        ):
+            field.setVisible(is_sftp)
+            label = self._form.labelForField(field)
+            if label is not None:
+                label.setVisible(is_sftp)
 
     def _on_save_clicked(self) -> None:
         if not self._validate_inputs():
@@ -193,6 +233,11 @@ class ProfileDialog(QDialog):
             remote_path=normalized_path,
             passive_mode=self._passive_mode_input.isChecked(),
             verify_host_key=self._verify_host_key_input.isChecked(),
+            transfer_concurrency=int(self._transfer_concurrency_input.value()),
+            transfer_block_size=int(self._transfer_block_size_input.value()) * 1024,
+            transfer_max_requests=int(self._transfer_max_requests_input.value()) if protocol == "sftp" else 0,
+            ssh_compression=self._ssh_compression_input.isChecked() if protocol == "sftp" else False,
+            transfer_auto_tune=self._transfer_auto_tune_input.isChecked(),
             created_at=self._source_profile.created_at if self._source_profile is not None else None,
             updated_at=self._source_profile.updated_at if self._source_profile is not None else None,
         )
@@ -216,5 +261,9 @@ class ProfileDialog(QDialog):
 
         self._passive_mode_input.setText(tr("profile_dialog.field.passive_mode"))
         self._verify_host_key_input.setText(tr("profile_dialog.field.verify_host_key"))
+        self._ssh_compression_input.setText(tr("profile_dialog.field.ssh_compression"))
+        self._transfer_auto_tune_input.setText(tr("profile_dialog.field.transfer_auto_tune"))
+        self._transfer_block_size_input.setSpecialValueText(tr("profile_dialog.value.default"))
+        self._transfer_max_requests_input.setSpecialValueText(tr("profile_dialog.value.default"))
         self._save_button.setText(tr("profile_dialog.save"))
         self._cancel_button.setText(tr("profile_dialog.cancel"))